@@ -0,0 +1 @@
+# Commands 패키지
@@ -0,0 +1,77 @@
+"""
+movie_reaction_counter_shards 에 나누어 쌓인 리액션 카운터를 movies 에 합치는 명령
+
+인기 영화의 좋아요/싫어요는 row lock 경합을 피하기 위해 shard row 에 증감되므로,
+movies.like_count 로 정렬하는 인기순 목록에는 shard 값이 합쳐질 때까지 반영되지 않습니다.
+영화별로 트랜잭션 안에서 shard row 를 잠그고 합계를 movies 에 더한 뒤 shard row 에서 합친 값만큼 빼며,
+shard row 는 삭제하지 않으므로 실행 중에 shard 를 조회한 증감도 유실되지 않습니다. cron 등으로 주기적으로 실행합니다.
+
+사용법: python -m app.commands.fold_reaction_counters
+"""
+
+import asyncio
+
+from tortoise import Tortoise, timezone
+from tortoise.expressions import F, Q
+from tortoise.transactions import in_transaction
+
+from app.configs.database import TORTOISE_ORM
+from app.models.likes import MovieReactionCounterShard
+from app.models.movies import Movie
+
+
+async def fold_reaction_counters() -> int:
+    """shard 합계를 movies 의 카운터에 더하고, 합친 영화 수를 반환합니다."""
+    movie_ids = [
+        movie_id
+        for (movie_id,) in await MovieReactionCounterShard.filter(
+            Q(like_count__not=0) | Q(dislike_count__not=0)
+        )
+        .distinct()
+        .values_list("movie_id")
+    ]
+    for movie_id in movie_ids:
+        async with in_transaction() as connection:
+            shards = (
+                await MovieReactionCounterShard.filter(movie_id=movie_id)
+                .select_for_update()
+                .using_db(connection)
+                .values("id", "like_count", "dislike_count")
+            )
+            await (
+                Movie.filter(id=movie_id)
+                .using_db(connection)
+                .update(
+                    like_count=F("like_count")
+                    + sum(shard["like_count"] for shard in shards),
+                    dislike_count=F("dislike_count")
+                    + sum(shard["dislike_count"] for shard in shards),
+                    updated_at=timezone.now(),
+                )
+            )
+            # shard row 를 삭제하면 get_or_create 로 shard 를 조회한 뒤 update 하려던 증감이 0 row 에 적용되어
+            # 유실되므로, row 는 남겨두고 합친 값만큼만 뺌
+            for shard in shards:
+                await (
+                    MovieReactionCounterShard.filter(id=shard["id"])
+                    .using_db(connection)
+                    .update(
+                        like_count=F("like_count") - shard["like_count"],
+                        dislike_count=F("dislike_count") - shard["dislike_count"],
+                        updated_at=timezone.now(),
+                    )
+                )
+    return len(movie_ids)
+
+
+async def main() -> None:
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        folded = await fold_reaction_counters()
+    finally:
+        await Tortoise.close_connections()
+    print(f"folded reaction counter shards of {folded} movies")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+"""
+CSV/NDJSON 파일의 영화를 한 번에 등록하는 명령
+
+POST /import/movies.{csv,ndjson} 와 같은 방식으로 파일을 chunk 단위로 읽고,
+chunk 크기만큼 검증한 row 를 트랜잭션 하나에서 bulk_create 로 저장합니다.
+파일 형식은 확장자(.csv, .ndjson)로 결정하며, chunk 를 저장할 때마다 진행 상황을 출력하고
+마지막에 잘못된 row 의 줄 번호와 오류를 출력합니다.
+
+사용법: python -m app.commands.import_movies <파일 경로> [chunk 크기]
+"""
+
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from tortoise import Tortoise
+
+from app.configs import config
+from app.configs.database import TORTOISE_ORM
+from app.services.movie_import import (
+    MovieImportFormatEnum,
+    MovieImportResult,
+    import_movies,
+)
+
+READ_SIZE = 64 * 1024
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(READ_SIZE):
+            yield chunk
+
+
+def print_progress(result: MovieImportResult) -> None:
+    print(
+        f"processed {result.processed} rows"
+        f" (imported {result.imported}, failed {result.failed})",
+        file=sys.stderr,
+    )
+
+
+async def main(path: Path, chunk_size: int) -> None:
+    file_format = MovieImportFormatEnum(path.suffix.removeprefix("."))
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        result = await import_movies(
+            read_file(path),
+            file_format,
+            chunk_size=chunk_size,
+            max_errors=config.IMPORT_MAX_REPORTED_ERRORS,
+            on_progress=print_progress,
+        )
+    finally:
+        await Tortoise.close_connections()
+    for error in result.errors:
+        print(f"line {error['line']}: {error['errors']}")
+    print(f"imported {result.imported} of {result.processed} rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            Path(sys.argv[1]),
+            int(sys.argv[2]) if len(sys.argv) > 2 else config.IMPORT_CHUNK_SIZE,
+        )
+    )
@@ -0,0 +1,82 @@
+"""
+users.follower_count / following_count 를 follows 테이블 기준으로 다시 계산하는 명령
+
+카운터는 시그널에서 증감되므로 bulk 작업, 수동 SQL, 마이그레이션 직후처럼 시그널을 거치지 않은 변경이
+있으면 실제 값과 어긋날 수 있습니다. 사용자를 id 순서로 batch_size 명씩 나누어
+batch 마다 GROUP BY 집계 두 번과 bulk update 한 번으로 값이 다른 사용자만 보정합니다.
+
+사용법: python -m app.commands.reconcile_follow_counts [batch 크기]
+"""
+
+import asyncio
+import sys
+from typing import Any
+
+from tortoise import Tortoise
+from tortoise.functions import Count
+
+from app.configs.database import TORTOISE_ORM
+from app.models.follows import Follow
+from app.models.users import User
+
+
+async def count_follows(field: str, ids: list[int]) -> dict[int, int]:
+    """ids 에 해당하는 사용자별로 field(following_id 또는 follower_id) 기준 팔로우 수를 집계합니다."""
+    lookup: dict[str, Any] = {f"{field}__in": ids}
+    rows = (
+        await Follow.filter(is_following=True, **lookup)
+        .annotate(count=Count("id"))
+        .group_by(field)
+        .values_list(field, "count")
+    )
+    return {user_id: count for user_id, count in rows}
+
+
+async def reconcile_follow_counts(batch_size: int = 1000) -> int:
+    """카운터를 보정하고, 값이 달라 수정된 사용자 수를 반환합니다."""
+    fixed = 0
+    last_id = 0
+    while True:
+        users = (
+            await User.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .only("id", "follower_count", "following_count")
+        )
+        if not users:
+            return fixed
+
+        ids = [user.id for user in users]
+        follower_counts = await count_follows("following_id", ids)
+        following_counts = await count_follows("follower_id", ids)
+
+        changed = []
+        for user in users:
+            follower_count = follower_counts.get(user.id, 0)
+            following_count = following_counts.get(user.id, 0)
+            if (user.follower_count, user.following_count) != (
+                follower_count,
+                following_count,
+            ):
+                user.follower_count = follower_count
+                user.following_count = following_count
+                changed.append(user)
+        if changed:
+            await User.bulk_update(
+                changed, fields=["follower_count", "following_count"]
+            )
+        fixed += len(changed)
+        last_id = ids[-1]
+
+
+async def main(batch_size: int) -> None:
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        fixed = await reconcile_follow_counts(batch_size)
+    finally:
+        await Tortoise.close_connections()
+    print(f"reconciled follow counts of {fixed} users")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -10,6 +10,12 @@ class Config(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
+    # True 이면 refresh 시 refresh token 도 새로 발급하고 사용한 토큰은 폐기합니다.
+    JWT_ROTATE_REFRESH_TOKEN: bool = True
+    # True 이면 access token 에 사용자 프로필 claim 을 담고, 인증 시 DB 조회를 생략합니다.
+    AUTH_CLAIMS_ONLY: bool = False
+    JWT_CACHE_MAXSIZE: int = 10_000
+    JWT_CACHE_TTL_SECONDS: int = 60 * 5
 
     MYSQL_HOST: str = "localhost"
     MYSQL_PORT: int = 3306
@@ -19,5 +25,58 @@ class Config(BaseSettings):
     MYSQL_CONNECT_TIMEOUT: int = 5
     CONNECTION_POOL_MAXSIZE: int = 10
 
+    PASSWORD_HASH_MAX_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 32
+
+    # 로그인/회원가입 rate limit (RATE_LIMIT_PERIOD_SECONDS 동안 허용되는 요청 수)
+    RATE_LIMIT_PERIOD_SECONDS: int = 60
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_USERNAME: int = 5
+    SIGNUP_RATE_LIMIT_PER_IP: int = 10
+
+    USER_CACHE_MAXSIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: int = 60
+
+    AUTOCOMPLETE_DEFAULT_LIMIT: int = 10
+    AUTOCOMPLETE_MAX_LIMIT: int = 50
+
+    FOLLOW_GRAPH_COMPACT_THRESHOLD: int = 10_000
+    SUGGESTION_DEFAULT_LIMIT: int = 10
+    SUGGESTION_MAX_LIMIT: int = 50
+    BULK_FOLLOW_MAX_IDS: int = 100
+
+    # 홈 피드: 사용자별 buffer 크기, 전체 buffer 에 보관할 최대 리뷰 id 수,
+    # 리뷰 작성 시 팔로워에게 전파하지 않고 조회 시 가져오는 작성자의 팔로워 수 기준
+    FEED_BUFFER_SIZE: int = 200
+    FEED_MAX_ENTRIES: int = 1_000_000
+    FEED_CELEBRITY_FOLLOWER_THRESHOLD: int = 10_000
+
+    MOVIE_SEARCH_DEFAULT_LIMIT: int = 20
+    MOVIE_SEARCH_MAX_LIMIT: int = 50
+
+    # 영화 리액션 카운터: 이 좋아요 수 이상인 영화는 shard row 에 나누어 증감
+    REACTION_COUNTER_HOT_THRESHOLD: int = 10_000
+    REACTION_COUNTER_SHARDS: int = 16
+    REACTION_COUNTS_MAX_IDS: int = 100
+    MOVIE_BATCH_MAX_IDS: int = 100
+
+    # 조회 API 응답 캐시: 저장된 body 크기 합의 상한, 항목 하나의 최대 크기, 만료 시간
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_MAX_ENTRY_BYTES: int = 4 * 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+
+    PAGINATION_DEFAULT_LIMIT: int = 20
+    PAGINATION_MAX_LIMIT: int = 100
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # 영화 가져오기: 한 트랜잭션에서 bulk_create 로 저장하는 row 수, 응답에 포함하는 row 오류 수
+    IMPORT_CHUNK_SIZE: int = 1000
+    IMPORT_MAX_CHUNK_SIZE: int = 10_000
+    IMPORT_MAX_REPORTED_ERRORS: int = 100
+    # 한 줄(CSV 는 여러 줄에 걸친 record 하나)의 최대 크기 - 넘으면 나머지를 읽지 않고 row 오류로 처리
+    IMPORT_MAX_RECORD_BYTES: int = 1024 * 1024
+    # 관리자 API(영화 가져오기 등)를 사용할 수 있는 사용자 id - username 은 사용자가 바꿀 수 있으므로 id 로 지정
+    ADMIN_USER_IDS: list[int] = []
+
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
     MEDIA_DIR: str = os.path.join(BASE_DIR, "media")
@@ -0,0 +1 @@
+# Dependencies 패키지
@@ -0,0 +1,74 @@
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, WebSocketException
+from starlette.requests import HTTPConnection
+
+from app.configs import config
+from app.models.users import User
+from app.services.auth import AuthenticatedUser, AuthService
+
+
+def _get_access_token(connection: HTTPConnection) -> str | None:
+    """http 요청은 access_token 쿠키를, 웹소켓은 Authorization 헤더(Bearer)를 우선 사용합니다."""
+    if connection.scope["type"] == "websocket":
+        authorization = connection.headers.get("Authorization")
+        if authorization:
+            return authorization.removeprefix("Bearer ").strip() or None
+    return connection.cookies.get("access_token")
+
+
+async def get_current_user(
+    connection: HTTPConnection,
+) -> User | AuthenticatedUser:
+    """
+    현재 인증된 사용자를 반환하는 dependency 입니다.
+
+    AuthMiddleware 가 request.state.user 를 설정했다면 그 결과를 재사용하고,
+    미들웨어가 적용되지 않는 경로(/reviews, /likes, 웹소켓)에서는 토큰을 직접 검증합니다.
+    조회한 사용자는 connection.state.user 에 저장하므로 요청당 최대 한 번만 조회합니다.
+    claims-only 모드에서는 DB 를 조회하지 않은 AuthenticatedUser 를 그대로 반환하므로,
+    id/username 만 사용하는 핸들러는 CurrentUser 를, ORM 객체를 수정하는 핸들러는 CurrentOrmUser 를 사용합니다.
+    """
+    is_websocket = connection.scope["type"] == "websocket"
+    auth_service = AuthService()
+
+    try:
+        user = getattr(connection.state, "user", None)
+        if user is None:
+            access_token = _get_access_token(connection)
+            if not access_token:
+                raise HTTPException(status_code=401, detail="Access token required")
+            user = await auth_service.authenticate_token(access_token)
+    except HTTPException as e:
+        if is_websocket:
+            raise WebSocketException(code=4001, reason=str(e.detail))
+        raise
+
+    connection.state.user = user
+    return user
+
+
+CurrentUser = Annotated[User | AuthenticatedUser, Depends(get_current_user)]
+
+
+async def get_current_orm_user(connection: HTTPConnection, user: CurrentUser) -> User:
+    """
+    현재 사용자의 ORM User 객체를 반환하는 dependency 입니다.
+    claims-only 모드에서는 사용자 정보를 수정/삭제하는 핸들러에서만 이때 처음 DB 를 조회합니다.
+    """
+    orm_user = await AuthService().resolve_user(user)
+    connection.state.user = orm_user
+    return orm_user
+
+
+CurrentOrmUser = Annotated[User, Depends(get_current_orm_user)]
+
+
+async def get_current_admin_user(user: CurrentUser) -> User | AuthenticatedUser:
+    """현재 사용자가 ADMIN_USER_IDS 에 포함된 관리자인지 확인하는 dependency 입니다."""
+    if user.id not in config.ADMIN_USER_IDS:
+        raise HTTPException(status_code=403, detail="Admin permission required")
+    return user
+
+
+CurrentAdminUser = Annotated[User | AuthenticatedUser, Depends(get_current_admin_user)]
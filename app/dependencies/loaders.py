@@ -0,0 +1,29 @@
+from typing import Annotated
+
+from fastapi import Depends
+from starlette.requests import HTTPConnection
+
+from app.models.movies import Movie
+from app.utils.loader import ModelLoader
+
+
+class RequestLoaders:
+    """요청 하나 동안 공유되는 DataLoader 모음입니다. 여러 id 를 동시에 조회하는 곳에서 사용하는 loader 만 둡니다."""
+
+    def __init__(self) -> None:
+        self.movies = ModelLoader(Movie)
+
+
+def get_loaders(connection: HTTPConnection) -> RequestLoaders:
+    """
+    요청마다 새 RequestLoaders 를 만들어 connection.state.loaders 에 저장합니다.
+    같은 요청의 여러 dependency 와 핸들러가 같은 loader 를 공유하므로 조회 결과가 재사용되고,
+    요청이 끝나면 캐시도 함께 사라져 다른 요청에 오래된 값이 전달되지 않습니다.
+    """
+    loaders = getattr(connection.state, "loaders", None)
+    if loaders is None:
+        loaders = connection.state.loaders = RequestLoaders()
+    return loaders
+
+
+Loaders = Annotated[RequestLoaders, Depends(get_loaders)]
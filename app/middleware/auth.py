@@ -1,53 +1,80 @@
-from fastapi import HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+import re
 
-from app.services.auth import AuthService
-from app.services.jwt import JWTService
+from fastapi import HTTPException
+from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.models.users import User
+from app.services.auth import AuthenticatedUser, AuthService
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        try:
-            if request.url.path.startswith("/users"):
-                if request.url.path not in ["/users/login", "/users", "/users/search"]:
-                    # 쿠키에서 access_token 읽기
-                    access_token = request.cookies.get("access_token")
+# 인증이 필요한 경로의 prefix 와 그 중 인증 없이 접근 가능한 경로를 미리 컴파일해 둡니다.
+PROTECTED_PATH_PATTERN = re.compile(r"^/users")
+PUBLIC_PATHS = frozenset(
+    {
+        "/users/login",
+        "/users",
+        "/users/search",
+        "/users/autocomplete",
+        "/users/token/refresh",
+    }
+)
 
-                    if not access_token:
-                        raise HTTPException(
-                            status_code=401, detail="Access token required"
-                        )
 
-                    try:
-                        # JWT 토큰 검증
-                        jwt_service = JWTService()
-                        payload = jwt_service.decode_token(access_token)
-                        username = payload.get("username")
+class AuthMiddleware:
+    """
+    BaseHTTPMiddleware 를 사용하지 않는 순수 ASGI 미들웨어입니다.
+    응답을 버퍼링하지 않고 receive/send 를 그대로 다음 앱에 전달하므로
+    스트리밍 응답과 대용량 파일 응답이 그대로 동작합니다.
+    """
 
-                        if not username:
-                            raise HTTPException(status_code=401, detail="Invalid token")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-                        # 사용자 정보 가져오기
-                        user = await AuthService().get_current_user(username)
-                        if not user:
-                            raise HTTPException(
-                                status_code=401, detail="User not found"
-                            )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-                        # request.state에 사용자 정보 설정
-                        request.state.user = user
+        response_started = False
 
-                    except Exception:
-                        raise HTTPException(status_code=401, detail="Invalid token")
-
-            response: Response = await call_next(request)
-            return response
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
+        try:
+            if self._is_protected(scope["path"]):
+                user = await self._authenticate(HTTPConnection(scope))
+                # request.state 는 scope["state"] 를 사용하므로 여기에 사용자 정보를 설정
+                scope.setdefault("state", {})["user"] = user
+            await self.app(scope, receive, send_wrapper)
+            return
         except HTTPException as e:
-            return JSONResponse({"detail": e.detail}, status_code=e.status_code)
+            if response_started:
+                raise
+            response = JSONResponse({"detail": e.detail}, status_code=e.status_code)
         except Exception as e:
-            return JSONResponse({"detail": str(e)}, status_code=500)
+            # 처리되지 않은 예외도 {"detail": ...} 형식의 500 응답으로 변환
+            # 이미 응답을 보내기 시작했다면 다른 응답을 보낼 수 없으므로 그대로 전파
+            if response_started:
+                raise
+            response = JSONResponse({"detail": str(e)}, status_code=500)
+        await response(scope, receive, send)
+
+    @staticmethod
+    def _is_protected(path: str) -> bool:
+        return (
+            PROTECTED_PATH_PATTERN.match(path) is not None and path not in PUBLIC_PATHS
+        )
+
+    @staticmethod
+    async def _authenticate(conn: HTTPConnection) -> User | AuthenticatedUser:
+        # 쿠키에서 access_token 읽기
+        access_token = conn.cookies.get("access_token")
+
+        if not access_token:
+            raise HTTPException(status_code=401, detail="Access token required")
+
+        return await AuthService().authenticate_token(access_token)
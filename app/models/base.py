@@ -5,3 +5,6 @@ from tortoise.models import Model
 class BaseModel(Model):
     id = fields.BigIntField(primary_key=True, autoincrement=True)
     created_at = fields.DatetimeField(auto_now_add=True)
+    # 조건부 GET(ETag/Last-Modified)의 버전으로 사용 - save() 시 자동 갱신되며,
+    # queryset.update() 로 컬럼을 바꿀 때는 updated_at 도 함께 지정해야 함
+    updated_at = fields.DatetimeField(auto_now=True)
@@ -14,6 +14,8 @@ class Follow(BaseModel, Model):
     following: fields.ForeignKeyRelation["User"] = fields.ForeignKeyField(
         "models.User", related_name="followings"
     )
+    follower_id: int
+    following_id: int
     is_following = fields.BooleanField(default=True)
 
     class Meta:
@@ -22,6 +22,8 @@ class ReviewLike(BaseModel, Model):
     review: fields.ForeignKeyRelation["Review"] = fields.ForeignKeyField(
         "models.Review", related_name="likes"
     )
+    user_id: int
+    review_id: int
     is_liked = fields.BooleanField(default=True)
 
     class Meta:
@@ -36,8 +38,30 @@ class MovieReaction(BaseModel, Model):
     movie: fields.ForeignKeyRelation["Movie"] = fields.ForeignKeyField(
         "models.Movie", related_name="reactions"
     )
+    user_id: int
+    movie_id: int
     type = fields.CharEnumField(ReactionTypeEnum, default=ReactionTypeEnum.LIKE)
 
     class Meta:
         table = "movie_reactions"
         unique_together = (("user", "movie"),)
+
+
+class MovieReactionCounterShard(BaseModel, Model):
+    """
+    좋아요가 많은 영화의 리액션 카운터를 여러 row 로 나누어 저장합니다.
+    인기 영화의 movies row 하나에 갱신이 몰려 row lock 경합이 생기지 않도록
+    shard 중 하나를 무작위로 골라 증감하며, 실제 값은 movies 의 카운터와 모든 shard 의 합입니다.
+    """
+
+    movie: fields.ForeignKeyRelation["Movie"] = fields.ForeignKeyField(
+        "models.Movie", related_name="reaction_counter_shards"
+    )
+    movie_id: int
+    shard = fields.IntField()
+    like_count = fields.IntField(default=0)
+    dislike_count = fields.IntField(default=0)
+
+    class Meta:
+        table = "movie_reaction_counter_shards"
+        unique_together = (("movie", "shard"),)
@@ -29,9 +29,23 @@ class Movie(BaseModel):
     playtime = fields.IntField()
     genre = fields.CharEnumField(GenreEnum)
     poster_image_url = fields.CharField(max_length=255, null=True)
+    # 좋아요/싫어요 수 - app/services/reaction_counter.py 에서 갱신
+    # 인기 영화는 movie_reaction_counter_shards 에 나누어 쌓은 값도 더해야 실제 값이 됨
+    like_count = fields.IntField(default=0)
+    dislike_count = fields.IntField(default=0)
 
     class Meta:
         table = "movies"
+        # GET /movies 의 장르(복수)/상영시간/등록일 필터와 인기순/최신순/상영시간순 정렬에 사용되는 인덱스
+        indexes = (
+            ("genre", "like_count"),
+            ("genre", "created_at"),
+            ("genre", "playtime"),
+            ("like_count",),
+            ("created_at",),
+            ("playtime",),
+            ("title",),
+        )
 
     def __str__(self) -> str:
         return self.title
@@ -15,6 +15,8 @@ class Review(BaseModel, Model):
     movie: fields.ForeignKeyRelation["Movie"] = fields.ForeignKeyField(
         "models.Movie", related_name="reviews", on_delete=fields.CASCADE
     )
+    user_id: int
+    movie_id: int
     title = fields.CharField(max_length=50)
     content = fields.CharField(max_length=255)
     review_image_url = fields.CharField(max_length=255, null=True)
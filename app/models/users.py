@@ -17,6 +17,11 @@ class User(BaseModel, Model):
     gender = fields.CharEnumField(GenderEnum)
     profile_image_url = fields.CharField(max_length=255, null=True)
     last_login = fields.DatetimeField(null=True)
+    # follows 테이블에서 is_following 인 row 수를 비정규화한 카운터 (app/signals/follow_signals.py 에서 갱신)
+    follower_count = fields.IntField(default=0)
+    following_count = fields.IntField(default=0)
 
     class Meta:
         table = "users"
+        # /users/search 의 나이 범위, 성별(복수) 필터와 가입일/최근 로그인 정렬에 사용되는 인덱스
+        indexes = (("gender", "age"), ("age",), ("created_at",), ("last_login",))
@@ -0,0 +1,84 @@
+import json
+from datetime import datetime
+from enum import StrEnum
+from typing import Any, AsyncIterator
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from tortoise.models import Model
+
+from app.configs import config
+from app.models.movies import Movie
+from app.models.reviews import Review
+from app.models.users import User
+from app.utils.pagination import iter_value_batches
+
+export_router = APIRouter(prefix="/export", tags=["export"])
+
+
+class ExportResourceEnum(StrEnum):
+    USERS = "users"
+    MOVIES = "movies"
+    REVIEWS = "reviews"
+
+
+# 리소스별 모델과 내보낼 컬럼 (users 의 hashed_password 는 내보내지 않음)
+EXPORT_RESOURCES: dict[ExportResourceEnum, tuple[type[Model], tuple[str, ...]]] = {
+    ExportResourceEnum.USERS: (
+        User,
+        ("username", "age", "gender", "profile_image_url", "last_login", "created_at"),
+    ),
+    ExportResourceEnum.MOVIES: (
+        Movie,
+        (
+            "title",
+            "plot",
+            "cast",
+            "playtime",
+            "genre",
+            "poster_image_url",
+            "created_at",
+        ),
+    ),
+    ExportResourceEnum.REVIEWS: (
+        Review,
+        (
+            "user_id",
+            "movie_id",
+            "title",
+            "content",
+            "review_image_url",
+            "created_at",
+        ),
+    ),
+}
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+async def _stream_ndjson(
+    model: type[Model], fields: tuple[str, ...]
+) -> AsyncIterator[str]:
+    async for rows in iter_value_batches(model.all(), fields, config.EXPORT_BATCH_SIZE):
+        yield "".join(
+            json.dumps(row, ensure_ascii=False, default=_json_default) + "\n"
+            for row in rows
+        )
+
+
+@export_router.get("/{resource}.ndjson")
+async def export_resource(resource: ExportResourceEnum) -> StreamingResponse:
+    """
+    리소스 전체를 NDJSON(한 줄에 JSON 객체 하나)으로 스트리밍하는 API
+
+    EXPORT_BATCH_SIZE 개씩 keyset 방식으로 조회한 뒤 바로 전송하므로
+    테이블 크기와 관계없이 메모리 사용량이 일정하고, 첫 batch 가 조회되는 즉시 응답이 시작됩니다.
+    """
+    model, fields = EXPORT_RESOURCES[resource]
+    return StreamingResponse(
+        _stream_ndjson(model, fields), media_type="application/x-ndjson"
+    )
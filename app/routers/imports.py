@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Query, Request
+
+from app.configs import config
+from app.dependencies.auth import CurrentAdminUser
+from app.schemas.movies import MovieImportResponse, MovieImportRowError
+from app.services.movie_import import MovieImportFormatEnum, import_movies
+
+import_router = APIRouter(prefix="/import", tags=["import"])
+
+
+@import_router.post("/movies.{file_format}")
+async def import_movies_file(
+    request: Request,
+    admin: CurrentAdminUser,
+    file_format: MovieImportFormatEnum,
+    chunk_size: int = Query(
+        config.IMPORT_CHUNK_SIZE, gt=0, le=config.IMPORT_MAX_CHUNK_SIZE
+    ),
+) -> MovieImportResponse:
+    """
+    요청 본문의 CSV/NDJSON 파일로 영화를 한 번에 등록하는 관리자 API (/export/movies.ndjson 형식도 그대로 가져올 수 있음)
+
+    본문을 multipart 로 받지 않고 그대로 스트리밍하며 chunk_size row 씩 검증/저장하므로
+    파일 크기와 관계없이 메모리 사용량이 일정합니다. 잘못된 row 는 건너뛰고 줄 번호와 함께 오류를 반환합니다.
+    """
+    result = await import_movies(
+        request.stream(),
+        file_format,
+        chunk_size=chunk_size,
+        max_errors=config.IMPORT_MAX_REPORTED_ERRORS,
+    )
+    return MovieImportResponse(
+        processed=result.processed,
+        imported=result.imported,
+        failed=result.failed,
+        errors=[MovieImportRowError(**error) for error in result.errors],
+    )
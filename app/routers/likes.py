@@ -1,9 +1,10 @@
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, HTTPException, Path
+from tortoise.transactions import in_transaction
 
+from app.dependencies.auth import CurrentUser
 from app.models.likes import ReviewLike, MovieReaction, ReactionTypeEnum
-from app.models.users import User
+from app.models.movies import Movie
+from app.models.reviews import Review
 from app.schemas.likes import (
     ReviewLikeResponse,
     MovieReactionResponse,
@@ -12,11 +13,37 @@ from app.schemas.likes import (
 like_router = APIRouter(prefix="/likes", tags=["likes"])
 
 
+async def set_reaction(
+    reaction: MovieReaction, reaction_type: ReactionTypeEnum
+) -> MovieReaction:
+    """
+    리액션 종류가 실제로 바뀔 때만 저장합니다.
+    좋아요/싫어요를 바꾸는 동시 요청이 같은 전환을 중복으로 저장해 카운터가 두 번 바뀌지 않도록
+    set_following 과 같이 row lock 을 잡고 다시 확인한 뒤 update_fields 로 저장합니다.
+    """
+    if reaction.type == reaction_type:
+        return reaction
+    async with in_transaction() as connection:
+        reaction = (
+            await MovieReaction.select_for_update()
+            .using_db(connection)
+            .get(id=reaction.id)
+        )
+        if reaction.type != reaction_type:
+            reaction.type = reaction_type
+            await reaction.save(
+                update_fields=["type", "updated_at"], using_db=connection
+            )
+    return reaction
+
+
 @like_router.post("/reviews/{review_id}/like", status_code=200)
 async def like_review(
-    user: Annotated[User, Depends()], review_id: int = Path(gt=0)
+    user: CurrentUser, review_id: int = Path(gt=0)
 ) -> ReviewLikeResponse:
     """리뷰 좋아요 API"""
+    if not await Review.exists(id=review_id):
+        raise HTTPException(status_code=404, detail="Review does not exist")
     review_like, _ = await ReviewLike.get_or_create(
         user_id=user.id, review_id=review_id
     )
@@ -27,15 +54,15 @@ async def like_review(
 
     return ReviewLikeResponse(
         id=review_like.id,
-        user_id=review_like.user.id,
-        review_id=review_like.review.id,
+        user_id=review_like.user_id,
+        review_id=review_like.review_id,
         is_liked=review_like.is_liked,
     )
 
 
 @like_router.post("/reviews/{review_id}/unlike", status_code=200)
 async def unlike_review(
-    user: Annotated[User, Depends()], review_id: int = Path(gt=0)
+    user: CurrentUser, review_id: int = Path(gt=0)
 ) -> ReviewLikeResponse:
     """리뷰 좋아요 취소 API"""
     review_like = await ReviewLike.get_or_none(user_id=user.id, review_id=review_id)
@@ -51,45 +78,49 @@ async def unlike_review(
 
     return ReviewLikeResponse(
         id=review_like.id,
-        user_id=review_like.user.id,
-        review_id=review_like.review.id,
+        user_id=review_like.user_id,
+        review_id=review_like.review_id,
         is_liked=review_like.is_liked,
     )
 
 
 @like_router.post("/movies/{movie_id}/like", status_code=200)
 async def like_movie(
-    user: Annotated[User, Depends()], movie_id: int = Path(gt=0)
+    user: CurrentUser, movie_id: int = Path(gt=0)
 ) -> MovieReactionResponse:
     """영화 좋아요 API"""
-    reaction, _ = await MovieReaction.get_or_create(user_id=user.id, movie_id=movie_id)
-
-    if reaction.type != ReactionTypeEnum.LIKE:
-        reaction.type = ReactionTypeEnum.LIKE
-        await reaction.save()
+    if not await Movie.exists(id=movie_id):
+        raise HTTPException(status_code=404, detail="Movie not found")
+    # 처음 남기는 리액션은 바로 like 로 생성하여 insert 한 번, 카운터 증감 한 번으로 처리
+    reaction, _ = await MovieReaction.get_or_create(
+        defaults={"type": ReactionTypeEnum.LIKE}, user_id=user.id, movie_id=movie_id
+    )
+    reaction = await set_reaction(reaction, ReactionTypeEnum.LIKE)
 
     return MovieReactionResponse(
         id=reaction.id,
-        user_id=reaction.user.id,
-        movie_id=reaction.movie.id,
+        user_id=reaction.user_id,
+        movie_id=reaction.movie_id,
         type=reaction.type,
     )
 
 
 @like_router.post("/movies/{movie_id}/dislike", status_code=200)
 async def dislike_movie(
-    user: Annotated[User, Depends()], movie_id: int = Path(gt=0)
+    user: CurrentUser, movie_id: int = Path(gt=0)
 ) -> MovieReactionResponse:
     """영화 싫어요 API"""
-    reaction, _ = await MovieReaction.get_or_create(user_id=user.id, movie_id=movie_id)
-
-    if reaction.type != ReactionTypeEnum.DISLIKE:
-        reaction.type = ReactionTypeEnum.DISLIKE
-        await reaction.save()
+    if not await Movie.exists(id=movie_id):
+        raise HTTPException(status_code=404, detail="Movie not found")
+    # 처음 남기는 리액션은 바로 dislike 로 생성하여 insert 한 번, 카운터 증감 한 번으로 처리
+    reaction, _ = await MovieReaction.get_or_create(
+        defaults={"type": ReactionTypeEnum.DISLIKE}, user_id=user.id, movie_id=movie_id
+    )
+    reaction = await set_reaction(reaction, ReactionTypeEnum.DISLIKE)
 
     return MovieReactionResponse(
         id=reaction.id,
-        user_id=reaction.user.id,
-        movie_id=reaction.movie.id,
+        user_id=reaction.user_id,
+        movie_id=reaction.movie_id,
         type=reaction.type,
     )
@@ -1,15 +1,46 @@
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException, Path, Query, UploadFile
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response, UploadFile
+from fastapi.responses import ORJSONResponse
+from tortoise.queryset import QuerySet
 
+from app.configs import config
+from app.dependencies.loaders import Loaders
 from app.models.movies import Movie
+from app.schemas.likes import MovieReactionCountResponse
 from app.schemas.movies import (
     CreateMovieRequest,
+    MovieFullTextSearchParams,
     MovieResponse,
     MovieSearchParams,
+    MovieSearchResultResponse,
+    MovieSortEnum,
     MovieUpdateRequest,
 )
+from app.schemas.pagination import LIST_OPTION_FIELDS, CursorPage, ListQueryParams
+from app.schemas.reviews import ReviewResponse
+from app.services.movie_search import movie_search_index
+from app.services.reaction_counter import reaction_counter
+from app.services.response_cache import (
+    MOVIE_LIST_TAG,
+    POPULAR_MOVIE_LIST_TAG,
+    movie_reviews_tag,
+    movie_tag,
+    response_cache,
+)
+from app.utils.conditional import (
+    VERSION_FIELDS,
+    get_version,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    page_version,
+    queryset_version,
+    with_validators,
+)
 from app.utils.file import delete_file, upload_file, validate_image_extension
+from app.utils.pagination import paginate_values, paginate_values_by
+from app.utils.serialization import list_response, model_values, select_fields
 
 movie_router = APIRouter(prefix="/movies", tags=["movies"])
 
@@ -28,50 +59,156 @@ async def create_movie(data: CreateMovieRequest) -> MovieResponse:
     )
 
 
-@movie_router.get("", status_code=200)
-async def get_movies(
-    query_params: Annotated[MovieSearchParams, Query()],
-) -> list[MovieResponse]:
+MOVIE_SEARCH_LOOKUPS = {
+    "genres": "genre__in",
+    "playtime_min": "playtime__gte",
+    "playtime_max": "playtime__lte",
+    "created_after": "created_at__gte",
+    "created_before": "created_at__lt",
+}
+
+
+def filter_movies(query_params: MovieSearchParams) -> QuerySet[Movie]:
     valid_query = {
-        key: value
-        for key, value in query_params.model_dump().items()
+        MOVIE_SEARCH_LOOKUPS.get(key, key): value
+        for key, value in query_params.model_dump(
+            exclude=LIST_OPTION_FIELDS | {"sort"}
+        ).items()
         if value is not None
     }
-    if valid_query:
-        movies = await Movie.filter(**valid_query).all()
-    else:
-        movies = await Movie.filter().all()
+    return Movie.filter(**valid_query)
 
-    return [
-        MovieResponse(
-            id=movie.id,
-            title=movie.title,
-            plot=movie.plot,
-            cast=movie.cast,
-            playtime=movie.playtime,
-            genre=movie.genre,
-            poster_image_url=movie.poster_image_url,
+
+async def fetch_movies(
+    queryset: QuerySet[Movie],
+    query_params: MovieSearchParams,
+    fields: tuple[str, ...],
+) -> tuple[list[dict[str, Any]], str | None]:
+    if query_params.is_paginated and query_params.sort:
+        return await paginate_values_by(
+            queryset, query_params, fields, query_params.sort
+        )
+    if query_params.is_paginated:
+        return await paginate_values(queryset, query_params, fields)
+    if query_params.sort:
+        queryset = queryset.order_by(
+            query_params.sort, "-id" if query_params.sort.startswith("-") else "id"
         )
-        for movie in movies
+    return await queryset.values(*fields), None
+
+
+@movie_router.get(
+    "",
+    status_code=200,
+    response_model=list[MovieResponse] | CursorPage[MovieResponse],
+)
+async def get_movies(
+    request: Request,
+    query_params: Annotated[MovieSearchParams, Query()],
+) -> Response:
+    fields = select_fields(query_params.fields, MovieResponse)
+    queryset = filter_movies(query_params)
+
+    async def build() -> Response:
+        # 전체 row 를 읽기 전에 id/updated_at 만으로 목록의 버전을 확인하여 304 여부를 결정
+        version: Any
+        if query_params.is_paginated:
+            versions, next_cursor = await fetch_movies(
+                queryset, query_params, VERSION_FIELDS
+            )
+            version = page_version(versions, next_cursor)
+        else:
+            version = await queryset_version(queryset)
+        etag = make_etag(
+            "movies", fields, query_params.is_paginated, version, weak=True
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        movies, next_cursor = await fetch_movies(queryset, query_params, fields)
+        return with_validators(
+            list_response(movies, query_params.is_paginated, next_cursor), etag
+        )
+
+    tags = [MOVIE_LIST_TAG]
+    if query_params.sort == MovieSortEnum.POPULAR:
+        tags.append(POPULAR_MOVIE_LIST_TAG)
+    return await response_cache.serve(request, tags, build)
+
+
+@movie_router.get(
+    "/search", status_code=200, response_model=list[MovieSearchResultResponse]
+)
+async def search_movies(
+    query_params: Annotated[MovieFullTextSearchParams, Query()],
+) -> ORJSONResponse:
+    """영화 전문 검색 API - 제목, 줄거리, 출연진 이름을 BM25 로 점수화하여 메모리 색인에서 조회"""
+    return ORJSONResponse(movie_search_index.search(query_params.q, query_params.limit))
+
+
+@movie_router.get("/reaction_counts", status_code=200)
+async def get_movies_reaction_counts(
+    ids: list[int] = Query(max_length=config.REACTION_COUNTS_MAX_IDS),
+) -> list[MovieReactionCountResponse]:
+    """
+    여러 영화의 리액션 개수를 한 번의 쿼리로 조회하는 API
+    요청한 순서대로 반환하며, 존재하지 않는 영화는 결과에서 제외합니다.
+    """
+    counts = await reaction_counter.get_counts(ids)
+    return [
+        MovieReactionCountResponse(movie_id=movie_id, **counts[movie_id])
+        for movie_id in dict.fromkeys(ids)
+        if movie_id in counts
     ]
 
 
-@movie_router.get("/{movie_id}", status_code=200)
-async def get_movie(movie_id: int = Path(gt=0)) -> MovieResponse:
-    movie = await Movie.get_or_none(id=movie_id)
-    if movie is None:
-        raise HTTPException(status_code=404)
-    return MovieResponse(
-        id=movie.id,
-        title=movie.title,
-        plot=movie.plot,
-        cast=movie.cast,
-        playtime=movie.playtime,
-        genre=movie.genre,
-        poster_image_url=movie.poster_image_url,
+@movie_router.get("/batch", status_code=200, response_model=list[MovieResponse])
+async def get_movies_batch(
+    loaders: Loaders,
+    ids: list[int] = Query(max_length=config.MOVIE_BATCH_MAX_IDS),
+    fields: str | None = Query(None),
+) -> ORJSONResponse:
+    """
+    여러 영화를 id 로 한 번에 조회하는 API - 리뷰 목록처럼 영화 여러 편을 그리는 화면에서 사용
+    요청한 순서대로 반환하며, 존재하지 않는 영화는 결과에서 제외합니다.
+    """
+    selected_fields = select_fields(fields, MovieResponse)
+    movies = await loaders.movies.load_many(list(dict.fromkeys(ids)))
+    return ORJSONResponse(
+        [model_values(movie, selected_fields) for movie in movies if movie is not None]
     )
 
 
+@movie_router.get("/{movie_id}", status_code=200, response_model=MovieResponse)
+async def get_movie(
+    request: Request,
+    movie_id: int = Path(gt=0),
+    fields: str | None = Query(None),
+) -> Response:
+    selected_fields = select_fields(fields, MovieResponse)
+
+    async def build() -> Response:
+        # cast JSON 등 전체 row 를 읽기 전에 updated_at 만 조회하여 304 여부를 결정
+        version = await get_version(Movie, movie_id)
+        if version is None:
+            raise HTTPException(status_code=404)
+        updated_at = version["updated_at"]
+        etag = make_etag("movie", movie_id, updated_at, selected_fields)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified_response(etag, updated_at)
+
+        movie = await Movie.get_or_none(id=movie_id)
+        if movie is None:
+            raise HTTPException(status_code=404)
+        # 버전 확인 이후 수정되었을 수 있으므로 실제로 읽은 row 의 버전으로 ETag 를 다시 만듦
+        etag = make_etag("movie", movie_id, movie.updated_at, selected_fields)
+        return with_validators(
+            ORJSONResponse(model_values(movie, selected_fields)), etag, movie.updated_at
+        )
+
+    return await response_cache.serve(request, [movie_tag(movie_id)], build)
+
+
 @movie_router.patch("/{movie_id}", status_code=200)
 async def update_movie(
     data: MovieUpdateRequest, movie_id: int = Path(gt=0)
@@ -83,7 +220,9 @@ async def update_movie(
         key: value for key, value in data.model_dump().items() if value is not None
     }
     await movie.update_from_dict(update_data)
-    await movie.save()
+    # like_count 는 시그널에서 F 표현식으로 갱신되므로 변경한 컬럼만 저장
+    if update_data:
+        await movie.save(update_fields=[*update_data, "updated_at"])
     return MovieResponse(
         id=movie.id,
         title=movie.title,
@@ -120,7 +259,7 @@ async def register_poster_image(
     try:
         image_url = await upload_file(image, "movies/poster_images")
         movie.poster_image_url = image_url
-        await movie.save()
+        await movie.save(update_fields=["poster_image_url", "updated_at"])
 
         # 기존 이미지가 있다면 삭제
         if prev_image_url is not None:
@@ -139,41 +278,60 @@ async def register_poster_image(
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
 
-@movie_router.get("/{movie_id}/reviews")
+@movie_router.get(
+    "/{movie_id}/reviews",
+    response_model=list[ReviewResponse] | CursorPage[ReviewResponse],
+)
 async def get_movie_reviews(
+    request: Request,
+    query_params: Annotated[ListQueryParams, Query()],
     movie_id: int = Path(gt=0),
-) -> list[dict[str, int | str | None]]:
+) -> Response:
     """특정 영화의 리뷰 리스트 조회 API"""
     from app.models.reviews import Review
 
-    reviews = await Review.filter(movie_id=movie_id).all()
-    return [
-        {
-            "id": review.id,
-            "user_id": review.user.id,
-            "movie_id": review.movie.id,
-            "title": review.title,
-            "content": review.content,
-            "review_image_url": review.review_image_url,
-        }
-        for review in reviews
-    ]
+    fields = select_fields(query_params.fields, ReviewResponse)
+    queryset = Review.filter(movie_id=movie_id)
+
+    async def build() -> Response:
+        version: Any
+        if query_params.is_paginated:
+            versions, next_cursor = await paginate_values(
+                queryset, query_params, VERSION_FIELDS
+            )
+            version = page_version(versions, next_cursor)
+        else:
+            version = await queryset_version(queryset)
+        etag = make_etag(
+            "movie_reviews",
+            movie_id,
+            fields,
+            query_params.is_paginated,
+            version,
+            weak=True,
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        next_cursor = None
+        if query_params.is_paginated:
+            reviews, next_cursor = await paginate_values(queryset, query_params, fields)
+        else:
+            reviews = await queryset.values(*fields)
+        return with_validators(
+            list_response(reviews, query_params.is_paginated, next_cursor), etag
+        )
+
+    return await response_cache.serve(request, [movie_reviews_tag(movie_id)], build)
 
 
 @movie_router.get("/{movie_id}/reaction_count", status_code=200)
-async def get_movie_reaction_count(movie_id: int = Path(gt=0)) -> dict[str, int]:
+async def get_movie_reaction_count(
+    movie_id: int = Path(gt=0),
+) -> MovieReactionCountResponse:
     """영화 리액션 개수 조회 API"""
-    from app.models.likes import MovieReaction, ReactionTypeEnum
-
-    like_count = await MovieReaction.filter(
-        movie_id=movie_id, type=ReactionTypeEnum.LIKE
-    ).count()
-    dislike_count = await MovieReaction.filter(
-        movie_id=movie_id, type=ReactionTypeEnum.DISLIKE
-    ).count()
-
-    return {
-        "movie_id": movie_id,
-        "like_count": like_count,
-        "dislike_count": dislike_count,
-    }
+    counts = await reaction_counter.get_counts([movie_id])
+    return MovieReactionCountResponse(
+        movie_id=movie_id,
+        **counts.get(movie_id, {"like_count": 0, "dislike_count": 0}),
+    )
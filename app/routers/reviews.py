@@ -1,32 +1,46 @@
-from typing import Annotated
-
 from fastapi import (
     APIRouter,
     Form,
     UploadFile,
     File,
-    Depends,
     Path,
     HTTPException,
+    Query,
+    Request,
+    Response,
 )
+from fastapi.responses import ORJSONResponse
 
+from app.dependencies.auth import CurrentUser
+from app.models.movies import Movie
 from app.models.reviews import Review
-from app.models.users import User
 from app.schemas.reviews import ReviewResponse
+from app.services.response_cache import response_cache, review_likes_tag
+from app.utils.conditional import (
+    get_version,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    with_validators,
+)
 from app.utils.file import upload_file, delete_file
+from app.utils.serialization import model_values, select_fields
 
 review_router = APIRouter(prefix="/reviews", tags=["reviews"])
 
 
 @review_router.post("", status_code=201)
 async def create_movie_review(
-    user: Annotated[User, Depends()],
+    user: CurrentUser,
     movie_id: int = Form(),
     title: str = Form(),
     content: str = Form(),
     review_image: UploadFile | None = File(None),
 ) -> ReviewResponse:
     """영화 리뷰 생성 API"""
+    if not await Movie.exists(id=movie_id):
+        raise HTTPException(status_code=404, detail="Movie not found")
+
     review_data = {
         "user_id": user.id,
         "movie_id": movie_id,
@@ -57,25 +71,34 @@ async def create_movie_review(
     )
 
 
-@review_router.get("/{review_id}")
-async def get_review(review_id: int = Path(gt=0)) -> ReviewResponse:
+@review_router.get("/{review_id}", response_model=ReviewResponse)
+async def get_review(
+    request: Request,
+    review_id: int = Path(gt=0),
+    fields: str | None = Query(None),
+) -> Response:
     """리뷰 조회 API"""
+    selected_fields = select_fields(fields, ReviewResponse)
+    version = await get_version(Review, review_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Review does not exist")
+    updated_at = version["updated_at"]
+    etag = make_etag("review", review_id, updated_at, selected_fields)
+    if is_not_modified(request, etag, updated_at):
+        return not_modified_response(etag, updated_at)
+
     review = await Review.get_or_none(id=review_id)
     if not review:
         raise HTTPException(status_code=404, detail="Review does not exist")
-    return ReviewResponse(
-        id=review.id,
-        user_id=review.user.id,
-        movie_id=review.movie.id,
-        title=review.title,
-        content=review.content,
-        review_image_url=review.review_image_url,
+    etag = make_etag("review", review_id, review.updated_at, selected_fields)
+    return with_validators(
+        ORJSONResponse(model_values(review, selected_fields)), etag, review.updated_at
     )
 
 
 @review_router.patch("/{review_id}")
 async def update_review(
-    user: Annotated[User, Depends()],
+    user: CurrentUser,
     update_title: str | None = Form(None),
     update_content: str | None = Form(None),
     update_image: UploadFile | None = File(None),
@@ -86,7 +109,7 @@ async def update_review(
     if not review:
         raise HTTPException(status_code=404, detail="Review does not exist")
 
-    if review.user.id != user.id:
+    if review.user_id != user.id:
         raise HTTPException(
             status_code=403, detail="Only the review owner can update reviews"
         )
@@ -104,8 +127,8 @@ async def update_review(
 
     return ReviewResponse(
         id=review.id,
-        user_id=review.user.id,
-        movie_id=review.movie.id,
+        user_id=review.user_id,
+        movie_id=review.movie_id,
         title=review.title,
         content=review.content,
         review_image_url=review.review_image_url,
@@ -113,15 +136,13 @@ async def update_review(
 
 
 @review_router.delete("/{review_id}", status_code=204)
-async def delete_review(
-    user: Annotated[User, Depends()], review_id: int = Path(gt=0)
-) -> None:
+async def delete_review(user: CurrentUser, review_id: int = Path(gt=0)) -> None:
     """리뷰 삭제 API"""
     review = await Review.get_or_none(id=review_id)
     if not review:
         raise HTTPException(status_code=404, detail="Review does not exist")
 
-    if review.user.id != user.id:
+    if review.user_id != user.id:
         raise HTTPException(
             status_code=403, detail="Only the review owner can delete review."
         )
@@ -129,18 +150,23 @@ async def delete_review(
     await review.delete()
 
 
-@review_router.get("/{review_id}/like_count")
-async def get_review_like_count(review_id: int = Path(gt=0)) -> dict[str, int]:
+@review_router.get("/{review_id}/like_count", response_model=dict[str, int])
+async def get_review_like_count(
+    request: Request, review_id: int = Path(gt=0)
+) -> Response:
     """리뷰 좋아요 개수 조회 API"""
     from app.models.likes import ReviewLike
 
-    like_count = await ReviewLike.filter(review_id=review_id, is_liked=True).count()
-    return {"review_id": review_id, "like_count": like_count}
+    async def build() -> Response:
+        like_count = await ReviewLike.filter(review_id=review_id, is_liked=True).count()
+        return ORJSONResponse({"review_id": review_id, "like_count": like_count})
+
+    return await response_cache.serve(request, [review_likes_tag(review_id)], build)
 
 
 @review_router.get("/{review_id}/is_liked")
 async def get_user_review_is_liked(
-    user: Annotated[User, Depends()], review_id: int = Path(gt=0)
+    user: CurrentUser, review_id: int = Path(gt=0)
 ) -> dict[str, int | bool]:
     """사용자가 특정 리뷰에 좋아요를 눌렀는지 확인 API"""
     from app.models.likes import ReviewLike
@@ -150,7 +176,7 @@ async def get_user_review_is_liked(
         return {"review_id": review_id, "user_id": user.id, "is_liked": False}
 
     return {
-        "review_id": like.review.id,
-        "user_id": like.user.id,
+        "review_id": like.review_id,
+        "user_id": like.user_id,
         "is_liked": like.is_liked,
     }
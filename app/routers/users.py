@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import (
     APIRouter,
@@ -10,66 +10,151 @@ from fastapi import (
     Response,
     Path,
 )
+from fastapi.responses import ORJSONResponse
+from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
 
+from app.configs import config
+from app.dependencies.auth import CurrentOrmUser, CurrentUser
+from app.models.follows import Follow
 from app.models.users import User
+from app.schemas.pagination import (
+    CursorPage,
+    CursorParams,
+    LIST_OPTION_FIELDS,
+    ListQueryParams,
+)
+from app.schemas.reviews import ReviewResponse
 from app.schemas.users import (
     UserCreateRequest,
     UserLoginRequest,
+    UserAutocompleteParams,
+    UserAutocompleteResponse,
+    UserProfileResponse,
+    UserSuggestionResponse,
     UserResponse,
     UserSearchParams,
     UserUpdateRequest,
+    BulkFollowRequest,
     FollowResponse,
+    FollowStatusResponse,
     FollowingUserResponse,
     FollowerUserResponse,
 )
-from app.services.auth import AuthService
-from app.services.jwt import JWTService
+from app.services.auth import AuthenticatedUser, AuthService
+from app.services.feed import feed_store
+from app.services.follow import FollowService
+from app.services.follow_graph import follow_graph
+from app.services.jwt import REFRESH_TOKEN_TYPE, JWTService
+from app.services.token_store import refresh_token_store
+from app.services.user_cache import user_cache
+from app.services.username_index import username_index
+from app.utils.conditional import (
+    VERSION_FIELDS,
+    get_version,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    page_version,
+    queryset_version,
+    with_validators,
+)
 from app.utils.file import upload_file, validate_image_extension, delete_file
+from app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    paginate_values,
+    paginate_values_by,
+)
+from app.utils.rate_limit import (
+    get_client_ip,
+    login_ip_rate_limiter,
+    login_username_rate_limiter,
+    signup_ip_rate_limiter,
+)
+from app.utils.serialization import list_response, response_fields, select_fields
 
 user_router = APIRouter(prefix="/users", tags=["users"])
 
 
+def refresh_claims_token(user: User, response: Response) -> None:
+    """claims-only 모드에서는 프로필이 변경되면 변경된 claim 으로 access token 을 다시 발급합니다."""
+    if not config.AUTH_CLAIMS_ONLY:
+        return
+    jwt_service = JWTService()
+    access_token = jwt_service.create_access_token(
+        jwt_service.get_access_token_claims(user)
+    )
+    jwt_service.attach_access_token_in_response_cookie(access_token, response)
+
+
 @user_router.post("")
 async def create_user(
-    data: UserCreateRequest, auth_service: AuthService = Depends()
+    data: UserCreateRequest, request: Request, auth_service: AuthService = Depends()
 ) -> int:
+    # bcrypt 해싱 전에 rate limit 을 확인
+    await signup_ip_rate_limiter.hit(get_client_ip(request))
     request_data = data.model_dump()
-    request_data["hashed_password"] = auth_service.hash_password(
+    request_data["hashed_password"] = await auth_service.hash_password_async(
         request_data.pop("password")
     )
     user = await User.create(**request_data)
     return user.id
 
 
-@user_router.get("")
-async def get_all_users() -> list[UserResponse]:
-    result = await User.filter().all()
-    if not result:
-        raise HTTPException(status_code=404)
-    return [
-        UserResponse(
-            id=user.id,
-            username=user.username,
-            age=user.age,
-            gender=user.gender,
-            profile_image_url=user.profile_image_url,
+@user_router.get("", response_model=list[UserResponse] | CursorPage[UserResponse])
+async def get_all_users(
+    request: Request,
+    query_params: Annotated[ListQueryParams, Query()],
+) -> Response:
+    fields = select_fields(query_params.fields, UserResponse)
+
+    version: Any
+    if query_params.is_paginated:
+        versions, next_cursor = await paginate_values(
+            User.filter(), query_params, VERSION_FIELDS
         )
-        for user in result
-    ]
+        version = page_version(versions, next_cursor)
+    else:
+        version = await queryset_version(User.filter())
+    etag = make_etag("users", fields, query_params.is_paginated, version, weak=True)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    next_cursor = None
+    if query_params.is_paginated:
+        users, next_cursor = await paginate_values(User.filter(), query_params, fields)
+    else:
+        users = await User.filter().values(*fields)
+        if not users:
+            raise HTTPException(status_code=404)
+    return with_validators(
+        list_response(users, query_params.is_paginated, next_cursor), etag
+    )
 
 
 @user_router.post("/login", status_code=204)
 async def login(
-    data: UserLoginRequest, response: Response, auth_service: AuthService = Depends()
+    data: UserLoginRequest,
+    request: Request,
+    response: Response,
+    auth_service: AuthService = Depends(),
 ) -> None:
     """사용자 로그인 API - JWT 토큰 생성 및 쿠키 설정"""
+    # bcrypt 검증 전에 IP, username 별 rate limit 을 확인
+    await login_ip_rate_limiter.hit(get_client_ip(request))
+    await login_username_rate_limiter.hit(data.username)
+
     user = await auth_service.login(data.username, data.password)
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     # JWT 토큰 생성
     jwt_service = JWTService()
-    access_token = jwt_service.create_access_token({"username": user.username})
+    access_token = jwt_service.create_access_token(
+        jwt_service.get_access_token_claims(user)
+    )
     refresh_token = jwt_service.create_refresh_token({"username": user.username})
 
     # 쿠키에 토큰 설정
@@ -78,56 +163,142 @@ async def login(
     )
 
 
-@user_router.get("/search")
-async def search_users(
-    query_params: Annotated[UserSearchParams, Query()],
-) -> list[UserResponse]:
+@user_router.post("/token/refresh", status_code=204)
+async def refresh_access_token(
+    request: Request, response: Response, auth_service: AuthService = Depends()
+) -> None:
+    """
+    refresh token 으로 access token 을 재발급하는 API
+
+    bcrypt 검증이 필요한 로그인 대신 HMAC 검증만으로 토큰을 재발급합니다.
+    JWT_ROTATE_REFRESH_TOKEN 이 활성화되어 있으면 refresh token 도 새로 발급하고,
+    사용한 refresh token 은 폐기하여 재사용할 수 없도록 합니다.
+    """
+    refresh_token = request.cookies.get("refresh_token")
+    if not refresh_token:
+        raise HTTPException(status_code=401, detail="Refresh token required")
+
+    jwt_service = JWTService()
+    payload = jwt_service.decode_token(refresh_token)
+    jti = payload.get("jti")
+    if payload.get("type") != REFRESH_TOKEN_TYPE or not jti:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    if config.JWT_ROTATE_REFRESH_TOKEN:
+        if not await refresh_token_store.consume(jti, payload["exp"]):
+            raise HTTPException(status_code=401, detail="Refresh token revoked")
+    elif await refresh_token_store.is_revoked(jti):
+        raise HTTPException(status_code=401, detail="Refresh token revoked")
+
+    user = await auth_service.get_current_user(payload.get("username"))
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+
+    access_token = jwt_service.create_access_token(
+        jwt_service.get_access_token_claims(user)
+    )
+    if config.JWT_ROTATE_REFRESH_TOKEN:
+        jwt_service.attach_jwt_token_in_response_cookie(
+            access_token,
+            jwt_service.create_refresh_token({"username": user.username}),
+            response,
+        )
+    else:
+        jwt_service.attach_access_token_in_response_cookie(access_token, response)
+
+
+# UserSearchParams 의 범위/복수 값 필드를 ORM lookup 으로 변환
+USER_SEARCH_LOOKUPS = {
+    "age_min": "age__gte",
+    "age_max": "age__lte",
+    "genders": "gender__in",
+}
+
+
+def filter_users(query_params: UserSearchParams) -> QuerySet[User]:
     valid_query = {
-        key: value
-        for key, value in query_params.model_dump().items()
+        USER_SEARCH_LOOKUPS.get(key, key): value
+        for key, value in query_params.model_dump(
+            exclude=LIST_OPTION_FIELDS | {"sort"}
+        ).items()
         if value is not None
     }
-    filtered_users = await User.filter(**valid_query).all()
-    if not filtered_users:
-        raise HTTPException(status_code=404)
-    return [
-        UserResponse(
-            id=user.id,
-            username=user.username,
-            age=user.age,
-            gender=user.gender,
-            profile_image_url=user.profile_image_url,
-        )
-        for user in filtered_users
-    ]
+    return User.filter(**valid_query)
 
 
-@user_router.get("/me")
-async def get_user(request: Request) -> UserResponse:
+@user_router.get(
+    "/search", response_model=list[UserResponse] | CursorPage[UserResponse]
+)
+async def search_users(
+    query_params: Annotated[UserSearchParams, Query()],
+) -> ORJSONResponse:
+    fields = select_fields(query_params.fields, UserResponse)
+    queryset = filter_users(query_params)
+    next_cursor = None
+    if query_params.is_paginated and query_params.sort:
+        filtered_users, next_cursor = await paginate_values_by(
+            queryset, query_params, fields, query_params.sort
+        )
+    elif query_params.is_paginated:
+        filtered_users, next_cursor = await paginate_values(
+            queryset, query_params, fields
+        )
+    else:
+        if query_params.sort:
+            queryset = queryset.order_by(
+                query_params.sort, "-id" if query_params.sort.startswith("-") else "id"
+            )
+        filtered_users = await queryset.values(*fields)
+        if not filtered_users:
+            raise HTTPException(status_code=404)
+    return list_response(filtered_users, query_params.is_paginated, next_cursor)
+
+
+@user_router.get("/autocomplete", response_model=list[UserAutocompleteResponse])
+async def autocomplete_users(
+    query_params: Annotated[UserAutocompleteParams, Query()],
+) -> ORJSONResponse:
+    """username prefix 자동완성 API - DB 대신 메모리의 username 인덱스에서 조회"""
+    return ORJSONResponse(username_index.search(query_params.q, query_params.limit))
+
+
+@user_router.get("/me", response_model=UserResponse)
+async def get_user(request: Request, fields: str | None = Query(None)) -> Response:
     user = request.state.user
-    return UserResponse(
-        id=user.id,
-        username=user.username,
-        age=user.age,
-        gender=user.gender,
-        profile_image_url=user.profile_image_url,
-    )
+    profile = {
+        field: getattr(user, field) for field in select_fields(fields, UserResponse)
+    }
+    # 사용자 정보는 이미 메모리에 있으므로(claims-only 모드에서는 토큰의 claim) 응답 값으로 ETag 를 만듦
+    etag = make_etag("me", sorted(profile.items()))
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return with_validators(ORJSONResponse(profile), etag)
 
 
 @user_router.patch("/me")
 async def update_user(
-    data: UserUpdateRequest, request: Request, auth_service: AuthService = Depends()
+    data: UserUpdateRequest,
+    user: CurrentOrmUser,
+    response: Response,
+    auth_service: AuthService = Depends(),
 ) -> UserResponse:
-    user = request.state.user
     update_data = {
         key: value for key, value in data.model_dump().items() if value is not None
     }
     if "password" in update_data.keys():
-        update_data["hashed_password"] = auth_service.hash_password(
+        update_data["hashed_password"] = await auth_service.hash_password_async(
             update_data.pop("password")
         )
     await user.update_from_dict(update_data)
-    await user.save()
+    # 카운터 컬럼은 시그널에서 F 표현식으로 갱신되므로 변경한 컬럼만 저장해 덮어쓰지 않도록 함
+    if update_data:
+        try:
+            await user.save(update_fields=[*update_data, "updated_at"])
+        except Exception:
+            # 저장에 실패하면 post_save 시그널이 발생하지 않으므로 직접 캐시를 비움
+            user_cache.invalidate(user)
+            raise
+    refresh_claims_token(user, response)
     return UserResponse(
         id=user.id,
         username=user.username,
@@ -138,24 +309,25 @@ async def update_user(
 
 
 @user_router.delete("/me")
-async def delete_user(request: Request) -> dict[str, str]:
-    user = request.state.user
+async def delete_user(user: CurrentOrmUser) -> dict[str, str]:
     await user.delete()
 
     return {"detail": "Successfully Deleted."}
 
 
 @user_router.post("/me/profile_image", status_code=200)
-async def register_profile_image(image: UploadFile, request: Request) -> UserResponse:
+async def register_profile_image(
+    image: UploadFile, user: CurrentOrmUser, response: Response
+) -> UserResponse:
     """사용자 프로필 이미지 업로드 API"""
     validate_image_extension(image)
-    user = request.state.user
     prev_image_url = user.profile_image_url
 
     try:
         image_url = await upload_file(image, "users/profile_images")
         user.profile_image_url = image_url
-        await user.save()
+        await user.save(update_fields=["profile_image_url", "updated_at"])
+        refresh_claims_token(user, response)
 
         # 기존 이미지가 있다면 삭제
         if prev_image_url is not None:
@@ -169,56 +341,206 @@ async def register_profile_image(image: UploadFile, request: Request) -> UserRes
             profile_image_url=user.profile_image_url,
         )
     except Exception as e:
+        user_cache.invalidate(user)
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
 
-@user_router.get("/me/reviews")
-async def get_my_reviews(request: Request) -> list[dict[str, int | str | None]]:
+@user_router.get(
+    "/me/reviews",
+    response_model=list[ReviewResponse] | CursorPage[ReviewResponse],
+)
+async def get_my_reviews(
+    request: Request, query_params: Annotated[ListQueryParams, Query()]
+) -> ORJSONResponse:
     """내가 쓴 리뷰 리스트 조회 API"""
     user = request.state.user
     from app.models.reviews import Review
 
-    reviews = await Review.filter(user_id=user.id).all()
+    fields = select_fields(query_params.fields, ReviewResponse)
+    next_cursor = None
+    if query_params.is_paginated:
+        reviews, next_cursor = await paginate_values(
+            Review.filter(user_id=user.id), query_params, fields
+        )
+    else:
+        reviews = await Review.filter(user_id=user.id).values(*fields)
+    return list_response(reviews, query_params.is_paginated, next_cursor)
+
+
+@user_router.get("/me/feed", response_model=CursorPage[ReviewResponse])
+async def get_my_feed(
+    request: Request, query_params: Annotated[ListQueryParams, Query()]
+) -> ORJSONResponse:
+    """
+    홈 피드 API - 내가 팔로우한 사용자들의 리뷰를 최신순으로 조회
+
+    리뷰 id 목록은 메모리의 feed_store 에서 구성하고, 해당 페이지의 리뷰만 id 로 한 번에 조회합니다.
+    """
+    from app.models.reviews import Review
+
+    fields = select_fields(query_params.fields, ReviewResponse)
+    before_id = (
+        decode_cursor(query_params.cursor) if query_params.cursor is not None else None
+    )
+    review_ids, has_more = await feed_store.read(
+        request.state.user.id,
+        before_id,
+        query_params.limit or config.PAGINATION_DEFAULT_LIMIT,
+    )
+    reviews = {
+        review["id"]: review
+        for review in await Review.filter(id__in=review_ids).values(*fields)
+    }
+    return list_response(
+        # 삭제된 리뷰는 id 목록에 남아있을 수 있으므로 조회된 리뷰만 응답
+        [reviews[review_id] for review_id in review_ids if review_id in reviews],
+        paginated=True,
+        next_cursor=encode_cursor(review_ids[-1]) if has_more else None,
+    )
+
+
+@user_router.get("/me/suggestions", response_model=list[UserSuggestionResponse])
+async def get_my_suggestions(
+    request: Request,
+    limit: int = Query(
+        config.SUGGESTION_DEFAULT_LIMIT, ge=1, le=config.SUGGESTION_MAX_LIMIT
+    ),
+) -> ORJSONResponse:
+    """
+    알 수도 있는 사람 추천 API
+
+    메모리의 팔로우 그래프에서 2-hop 관계를 공통 팔로우 수로 점수화하고,
+    추천된 사용자 정보만 id 목록으로 한 번에 조회합니다.
+    """
+    scored = follow_graph.suggestions(request.state.user.id, limit)
+    users = {
+        user["id"]: user
+        for user in await User.filter(id__in=[user_id for user_id, _ in scored]).values(
+            "id", "username", "profile_image_url"
+        )
+    }
+    return ORJSONResponse(
+        [
+            {**users[user_id], "mutual_count": mutual_count}
+            for user_id, mutual_count in scored
+            if user_id in users
+        ]
+    )
+
+
+async def set_following(follow: Follow, is_following: bool) -> Follow:
+    """
+    팔로우 상태가 실제로 바뀔 때만 저장합니다.
+    동시 요청이 같은 상태 전환을 중복으로 저장해 카운터가 두 번 바뀌지 않도록 row lock 을 잡고 다시 확인하며,
+    update_fields 로 저장하여 follow_signals 가 상태 전환임을 알 수 있도록 합니다.
+    """
+    if follow.is_following == is_following:
+        return follow
+    async with in_transaction() as connection:
+        follow = await Follow.select_for_update().using_db(connection).get(id=follow.id)
+        if follow.is_following != is_following:
+            follow.is_following = is_following
+            await follow.save(
+                update_fields=["is_following", "updated_at"], using_db=connection
+            )
+    return follow
+
+
+@user_router.get("/{user_id}/profile", response_model=UserProfileResponse)
+async def get_user_profile(request: Request, user_id: int = Path(gt=0)) -> Response:
+    """사용자 프로필 조회 API - 팔로워/팔로잉 수는 비정규화된 카운터 컬럼에서 조회"""
+    # 프로필 컬럼은 작으므로 버전(updated_at)과 함께 한 번에 조회
+    profile = await get_version(User, user_id, *response_fields(UserProfileResponse))
+    if profile is None:
+        raise HTTPException(status_code=404)
+    updated_at = profile.pop("updated_at")
+    etag = make_etag("profile", user_id, updated_at)
+    if is_not_modified(request, etag, updated_at):
+        return not_modified_response(etag, updated_at)
+    return with_validators(ORJSONResponse(profile), etag, updated_at)
+
+
+async def validate_follow_targets(
+    user: User | AuthenticatedUser, user_ids: list[int]
+) -> list[int]:
+    """중복과 자기 자신을 제외하고, 존재하지 않는 사용자가 있으면 404 예외를 발생시킵니다."""
+    target_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id != user.id]
+    existing_ids = {
+        user_id for (user_id,) in await User.filter(id__in=target_ids).values_list("id")
+    }
+    missing_ids = [user_id for user_id in target_ids if user_id not in existing_ids]
+    if missing_ids:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Users not found: {', '.join(map(str, missing_ids))}",
+        )
+    return target_ids
+
+
+@user_router.post("/me/follow", status_code=200)
+async def following_users(
+    data: BulkFollowRequest,
+    user: CurrentUser,
+    follow_service: FollowService = Depends(),
+) -> list[FollowResponse]:
+    """여러 사용자 일괄 팔로우 API - 한 트랜잭션에서 일괄 insert/update 로 처리"""
+    target_ids = await validate_follow_targets(user, data.user_ids)
+    await follow_service.follow_many(user, target_ids)
+    return [
+        FollowResponse(follower_id=user.id, following_id=user_id, is_following=True)
+        for user_id in target_ids
+    ]
+
+
+@user_router.post("/me/unfollow", status_code=200)
+async def unfollowing_users(
+    data: BulkFollowRequest,
+    user: CurrentUser,
+    follow_service: FollowService = Depends(),
+) -> list[FollowResponse]:
+    """여러 사용자 일괄 언팔로우 API"""
+    target_ids = list(dict.fromkeys(data.user_ids))
+    await follow_service.unfollow_many(user, target_ids)
+    return [
+        FollowResponse(follower_id=user.id, following_id=user_id, is_following=False)
+        for user_id in target_ids
+    ]
+
+
+@user_router.get("/me/follow_status", status_code=200)
+async def get_my_follow_status(
+    user: CurrentUser,
+    ids: list[int] = Query(max_length=config.BULK_FOLLOW_MAX_IDS),
+    follow_service: FollowService = Depends(),
+) -> list[FollowStatusResponse]:
+    """여러 사용자에 대한 팔로우 여부를 한 번의 쿼리로 조회하는 API"""
+    following_ids = await follow_service.get_follow_status(user.id, ids)
     return [
-        {
-            "id": review.id,
-            "user_id": review.user.id,
-            "movie_id": review.movie.id,
-            "title": review.title,
-            "content": review.content,
-            "review_image_url": review.review_image_url,
-        }
-        for review in reviews
+        FollowStatusResponse(user_id=user_id, is_following=user_id in following_ids)
+        for user_id in ids
     ]
 
 
 @user_router.post("/{user_id}/follow", status_code=200)
 async def following_user(
-    user: Annotated[User, Depends()], user_id: int = Path(gt=0)
+    user: CurrentUser, user_id: int = Path(gt=0)
 ) -> FollowResponse:
     """사용자 팔로우 API"""
-    from app.models.follows import Follow
-
     follow, _ = await Follow.get_or_create(follower_id=user.id, following_id=user_id)
-
-    if not follow.is_following:
-        follow.is_following = True
-        await follow.save()
+    follow = await set_following(follow, True)
 
     return FollowResponse(
-        follower_id=follow.follower.id,
-        following_id=follow.following.id,
+        follower_id=follow.follower_id,
+        following_id=follow.following_id,
         is_following=follow.is_following,
     )
 
 
 @user_router.post("/{user_id}/unfollow", status_code=200)
 async def unfollowing_user(
-    user: Annotated[User, Depends()], user_id: int = Path(gt=0)
+    user: CurrentUser, user_id: int = Path(gt=0)
 ) -> FollowResponse:
     """사용자 언팔로우 API"""
-    from app.models.follows import Follow
-
     follow = await Follow.filter(follower_id=user.id, following_id=user_id).first()
 
     if not follow:
@@ -226,32 +548,36 @@ async def unfollowing_user(
             follower_id=user.id, following_id=user_id, is_following=False
         )
 
-    if follow.is_following:
-        follow.is_following = False
-        await follow.save()
+    follow = await set_following(follow, False)
 
     return FollowResponse(
-        follower_id=follow.follower.id,
-        following_id=follow.following.id,
+        follower_id=follow.follower_id,
+        following_id=follow.following_id,
         is_following=follow.is_following,
     )
 
 
 @user_router.get("/me/followings", status_code=200)
 async def get_my_followings(
-    user: Annotated[User, Depends()],
-) -> list[FollowingUserResponse]:
+    user: CurrentUser,
+    pagination: Annotated[CursorParams, Query()],
+) -> list[FollowingUserResponse] | CursorPage[FollowingUserResponse]:
     """내가 팔로우한 사용자 목록 조회 API"""
     from app.models.follows import Follow
     from tortoise.expressions import Subquery
 
-    following_users = await User.filter(
+    queryset = User.filter(
         id__in=Subquery(
             Follow.filter(follower_id=user.id, is_following=True).values("following_id")
         )
-    ).all()
+    )
+    next_cursor = None
+    if pagination.is_paginated:
+        following_users, next_cursor = await paginate(queryset, pagination)
+    else:
+        following_users = await queryset.all()
 
-    return [
+    items = [
         FollowingUserResponse(
             following_id=user.id,
             username=user.username,
@@ -259,23 +585,32 @@ async def get_my_followings(
         )
         for user in following_users
     ]
+    if pagination.is_paginated:
+        return CursorPage(items=items, next_cursor=next_cursor)
+    return items
 
 
 @user_router.get("/me/followers", status_code=200)
 async def get_my_followers(
-    user: Annotated[User, Depends()],
-) -> list[FollowerUserResponse]:
+    user: CurrentUser,
+    pagination: Annotated[CursorParams, Query()],
+) -> list[FollowerUserResponse] | CursorPage[FollowerUserResponse]:
     """나를 팔로우하는 사용자 목록 조회 API"""
     from app.models.follows import Follow
     from tortoise.expressions import Subquery
 
-    follower_users = await User.filter(
+    queryset = User.filter(
         id__in=Subquery(
             Follow.filter(following_id=user.id, is_following=True).values("follower_id")
         )
-    ).all()
+    )
+    next_cursor = None
+    if pagination.is_paginated:
+        follower_users, next_cursor = await paginate(queryset, pagination)
+    else:
+        follower_users = await queryset.all()
 
-    return [
+    items = [
         FollowerUserResponse(
             follower_id=user.id,
             username=user.username,
@@ -283,3 +618,6 @@ async def get_my_followers(
         )
         for user in follower_users
     ]
+    if pagination.is_paginated:
+        return CursorPage(items=items, next_cursor=next_cursor)
+    return items
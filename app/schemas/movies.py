@@ -1,8 +1,12 @@
-from typing import Annotated
+from datetime import datetime
+from enum import StrEnum
+from typing import Annotated, Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from app.configs import config
 from app.models.movies import CastModel, GenreEnum
+from app.schemas.pagination import ListQueryParams
 
 
 class CreateMovieRequest(BaseModel):
@@ -13,6 +17,18 @@ class CreateMovieRequest(BaseModel):
     genre: GenreEnum
 
 
+class MovieImportRowError(BaseModel):
+    line: int
+    errors: list[dict[str, Any]]
+
+
+class MovieImportResponse(BaseModel):
+    processed: int
+    imported: int
+    failed: int
+    errors: list[MovieImportRowError]
+
+
 class MovieResponse(BaseModel):
     id: int
     title: str
@@ -23,9 +39,57 @@ class MovieResponse(BaseModel):
     poster_image_url: str | None = None
 
 
-class MovieSearchParams(BaseModel):
+class MovieSortEnum(StrEnum):
+    POPULAR = "-like_count"
+    NEWEST = "-created_at"
+    OLDEST = "created_at"
+    PLAYTIME = "playtime"
+    PLAYTIME_DESC = "-playtime"
+
+
+class MovieSearchParams(ListQueryParams):
     title: str | None = None
     genre: GenreEnum | None = None
+    genres: list[GenreEnum] | None = None
+    playtime_min: Annotated[int, Field(gt=0)] | None = None
+    playtime_max: Annotated[int, Field(gt=0)] | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    sort: MovieSortEnum | None = None
+
+    @model_validator(mode="after")
+    def validate_ranges(self) -> Self:
+        if (
+            self.playtime_min is not None
+            and self.playtime_max is not None
+            and self.playtime_min > self.playtime_max
+        ):
+            raise ValueError("playtime_min must be less than or equal to playtime_max")
+        if (
+            self.created_after is not None
+            and self.created_before is not None
+            and self.created_after > self.created_before
+        ):
+            raise ValueError("created_after must be earlier than created_before")
+        return self
+
+
+class MovieFullTextSearchParams(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    q: Annotated[str, Field(min_length=1, max_length=100)]
+    limit: Annotated[int, Field(ge=1, le=config.MOVIE_SEARCH_MAX_LIMIT)] = (
+        config.MOVIE_SEARCH_DEFAULT_LIMIT
+    )
+
+
+class MovieSearchResultResponse(BaseModel):
+    id: int
+    title: str
+    genre: GenreEnum
+    playtime: int
+    poster_image_url: str | None = None
+    score: float
 
 
 class MovieUpdateRequest(BaseModel):
@@ -0,0 +1,39 @@
+from typing import Annotated, Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+from app.configs import config
+
+T = TypeVar("T")
+
+
+class CursorParams(BaseModel):
+    """
+    keyset(cursor) 페이지네이션 쿼리 파라미터입니다.
+    limit 이나 cursor 중 하나라도 전달되면 CursorPage 형태로 응답합니다.
+    """
+
+    limit: Annotated[int, Field(ge=1, le=config.PAGINATION_MAX_LIMIT)] | None = None
+    cursor: str | None = None
+
+    @property
+    def is_paginated(self) -> bool:
+        return self.limit is not None or self.cursor is not None
+
+
+class ListQueryParams(CursorParams):
+    """
+    목록 조회 API 공통 쿼리 파라미터입니다.
+    fields 에 쉼표로 구분된 필드 이름을 전달하면 해당 필드(와 id)만 조회하여 응답합니다.
+    """
+
+    fields: str | None = None
+
+
+# 목록 조회 옵션이므로 검색 조건(filter)에서 제외해야 하는 쿼리 파라미터
+LIST_OPTION_FIELDS = {"limit", "cursor", "fields"}
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
@@ -1,8 +1,11 @@
-from typing import Annotated
+from enum import StrEnum
+from typing import Annotated, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from app.configs import config
 from app.models.users import GenderEnum
+from app.schemas.pagination import ListQueryParams
 
 
 class UserCreateRequest(BaseModel):
@@ -18,12 +21,47 @@ class UserUpdateRequest(BaseModel):
     age: int | None = None
 
 
-class UserSearchParams(BaseModel):
+class UserSortEnum(StrEnum):
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+    LAST_LOGIN = "last_login"
+    LAST_LOGIN_DESC = "-last_login"
+
+
+class UserSearchParams(ListQueryParams):
     model_config = {"extra": "forbid"}
 
     username: str | None = None
     age: Annotated[int, Field(gt=0)] | None = None
+    age_min: Annotated[int, Field(gt=0)] | None = None
+    age_max: Annotated[int, Field(gt=0)] | None = None
     gender: GenderEnum | None = None
+    genders: list[GenderEnum] | None = None
+    sort: UserSortEnum | None = None
+
+    @model_validator(mode="after")
+    def validate_age_range(self) -> Self:
+        if (
+            self.age_min is not None
+            and self.age_max is not None
+            and self.age_min > self.age_max
+        ):
+            raise ValueError("age_min must be less than or equal to age_max")
+        return self
+
+
+class UserAutocompleteParams(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    q: Annotated[str, Field(min_length=1)]
+    limit: Annotated[int, Field(ge=1, le=config.AUTOCOMPLETE_MAX_LIMIT)] = (
+        config.AUTOCOMPLETE_DEFAULT_LIMIT
+    )
+
+
+class UserAutocompleteResponse(BaseModel):
+    id: int
+    username: str
 
 
 class UserResponse(BaseModel):
@@ -34,11 +72,38 @@ class UserResponse(BaseModel):
     profile_image_url: str | None = None
 
 
+class UserProfileResponse(BaseModel):
+    id: int
+    username: str
+    profile_image_url: str | None = None
+    follower_count: int
+    following_count: int
+
+
+class UserSuggestionResponse(BaseModel):
+    id: int
+    username: str
+    profile_image_url: str | None = None
+    mutual_count: int
+
+
 class UserLoginRequest(BaseModel):
     username: str
     password: str
 
 
+class BulkFollowRequest(BaseModel):
+    user_ids: Annotated[
+        list[Annotated[int, Field(gt=0)]],
+        Field(min_length=1, max_length=config.BULK_FOLLOW_MAX_IDS),
+    ]
+
+
+class FollowStatusResponse(BaseModel):
+    user_id: int
+    is_following: bool
+
+
 class FollowResponse(BaseModel):
     follower_id: int
     following_id: int
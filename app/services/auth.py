@@ -1,12 +1,52 @@
 from typing import Any, Dict, Optional
 
+from fastapi import HTTPException
 from passlib.context import CryptContext  # type: ignore
 from tortoise.exceptions import DoesNotExist
 
-from app.models.users import User
+from app.configs import config
+from app.models.users import GenderEnum, User
+from app.services.jwt import REFRESH_TOKEN_TYPE, JWTService
+from app.services.user_cache import user_cache
+from app.utils.worker_pool import BoundedWorkerPool
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt 해싱/검증은 요청 하나당 수백 ms 동안 CPU 를 사용하므로 이벤트 루프 밖에서 실행
+password_hash_pool = BoundedWorkerPool(
+    max_workers=config.PASSWORD_HASH_MAX_WORKERS,
+    max_pending=config.PASSWORD_HASH_MAX_PENDING,
+    thread_name_prefix="password-hash",
+)
+
+jwt_service = JWTService()
+
+
+class AuthenticatedUser:
+    """
+    claims-only 인증 모드(AUTH_CLAIMS_ONLY)에서 request.state.user 로 사용되는 객체입니다.
+
+    access token 에 담긴 claim 만으로 UserResponse 에 필요한 필드를 채우므로 DB 를 조회하지 않으며,
+    핸들러가 ORM 객체를 필요로 할 때만 get_user() 로 User 를 조회합니다.
+    claim 은 토큰이 만료될 때까지 유지되므로, 프로필을 수정하는 API 는 access token 을 다시 발급합니다.
+    """
+
+    __slots__ = ("id", "username", "age", "gender", "profile_image_url", "_user")
+
+    def __init__(self, claims: dict[str, Any]) -> None:
+        self.id: int = claims["user_id"]
+        self.username: str = claims["username"]
+        self.age: int = claims["age"]
+        self.gender = GenderEnum(claims["gender"])
+        self.profile_image_url: str | None = claims.get("profile_image_url")
+        self._user: User | None = None
+
+    async def get_user(self) -> Optional[User]:
+        # username 은 바뀔 수 있고 다른 사용자가 이전 username 을 사용할 수 있으므로 id 로 조회
+        if self._user is None:
+            self._user = await AuthService().get_user_by_id(self.id)
+        return self._user
+
 
 class AuthService:
     def __init__(self) -> None:
@@ -18,10 +58,20 @@ class AuthService:
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return bool(self.pwd_context.verify(plain_password, hashed_password))
 
+    async def hash_password_async(self, password: str) -> str:
+        return await password_hash_pool.run(self.hash_password, password)
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        return await password_hash_pool.run(
+            self.verify_password, plain_password, hashed_password
+        )
+
     async def authenticate(self, username: str, password: str) -> Optional[User]:
         try:
             user = await User.get(username=username)
-            if self.verify_password(password, user.hashed_password):
+            if await self.verify_password_async(password, user.hashed_password):
                 return user
         except DoesNotExist:
             pass
@@ -38,10 +88,62 @@ class AuthService:
             "gender": user.gender,
         }
 
+    async def authenticate_token(self, token: str) -> User | AuthenticatedUser:
+        """access token 을 검증하고 사용자 정보를 반환합니다. 검증에 실패하면 401 예외를 발생시킵니다."""
+        try:
+            # JWT 토큰 검증
+            payload = jwt_service.decode_token(token)
+            username = payload.get("username")
+
+            # refresh token 으로는 인증할 수 없음
+            if not username or payload.get("type") == REFRESH_TOKEN_TYPE:
+                raise HTTPException(status_code=401, detail="Invalid token")
+
+            # claims-only 모드에서는 토큰의 claim 으로 사용자 정보를 구성 (DB 조회는 필요할 때만)
+            if config.AUTH_CLAIMS_ONLY and "user_id" in payload:
+                return AuthenticatedUser(payload)
+
+            # 사용자 정보 가져오기
+            user = await self.get_current_user(username)
+            if not user:
+                raise HTTPException(status_code=401, detail="User not found")
+
+        except Exception:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        return user
+
+    async def resolve_user(self, user: User | AuthenticatedUser) -> User:
+        """request.state.user 로부터 ORM User 객체를 가져옵니다."""
+        if isinstance(user, User):
+            return user
+        resolved_user = await user.get_user()
+        if resolved_user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        return resolved_user
+
     async def get_current_user(self, username: Optional[str]) -> Optional[User]:
         if username is None:
             return None
+
+        user = user_cache.get(username)
+        if user is not None:
+            return user
+
         try:
-            return await User.get(username=username)
+            user = await User.get(username=username)
         except DoesNotExist:
             return None
+
+        user_cache.set(user)
+        return user
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        user = user_cache.get_by_id(user_id)
+        if user is not None:
+            return user
+
+        user = await User.get_or_none(id=user_id)
+        if user is not None:
+            user_cache.set(user)
+        return user
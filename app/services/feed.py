@@ -0,0 +1,178 @@
+from collections import OrderedDict, deque
+from heapq import merge
+from itertools import islice
+
+from app.configs import config
+from app.models.follows import Follow
+from app.models.reviews import Review
+from app.models.users import User
+from app.services.follow_graph import follow_graph
+
+
+class FeedBuffer:
+    """
+    한 사용자의 홈 피드에 들어갈 리뷰 id 를 오래된 순서로 최대 maxlen 개 보관하는 ring buffer 입니다.
+    complete 는 buffer 에 팔로우 중인 (일반) 작성자의 리뷰가 빠짐없이 들어있는지를 나타내며,
+    maxlen 을 넘어 오래된 id 가 밀려나면 False 가 됩니다.
+    """
+
+    __slots__ = ("review_ids", "complete")
+
+    def __init__(self, review_ids: list[int], maxlen: int, complete: bool) -> None:
+        self.review_ids: deque[int] = deque(review_ids, maxlen=maxlen)
+        self.complete = complete
+
+    def append(self, review_id: int) -> None:
+        if len(self.review_ids) == self.review_ids.maxlen:
+            self.complete = False
+        self.review_ids.append(review_id)
+
+
+class FeedStore:
+    """
+    팔로우한 사용자들의 최신 리뷰로 구성된 홈 피드를 사용자별 FeedBuffer 로 관리합니다.
+
+    - fan-out-on-write: 리뷰가 작성되면 (app/signals/review_signals.py) 작성자의 팔로워 중
+      buffer 가 메모리에 있는 사용자에게만 리뷰 id 를 추가합니다.
+    - fan-out-on-read: 팔로워가 celebrity_threshold 명 이상인 작성자의 리뷰는 buffer 에 넣지 않고
+      피드를 조회할 때 DB 에서 가져와 buffer 의 id 와 병합합니다.
+    - buffer 가 없는 사용자는 조회 시 DB 에서 최신 리뷰 id 로 buffer 를 만들고,
+      전체 id 수가 max_entries 를 넘으면 가장 오래 조회되지 않은 사용자의 buffer 부터 제거합니다.
+    - 팔로우 관계가 바뀌면 invalidate() 로 buffer 를 버리고 다음 조회 때 다시 만듭니다.
+    """
+
+    def __init__(
+        self, buffer_size: int, max_entries: int, celebrity_threshold: int
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.max_entries = max_entries
+        self.celebrity_threshold = celebrity_threshold
+        self._buffers: OrderedDict[int, FeedBuffer] = OrderedDict()
+        self._entries = 0
+        self.evictions = 0
+
+    async def fan_out(self, review: Review) -> None:
+        if not self._buffers:
+            return
+        author = (
+            await User.filter(id=review.user_id).only("id", "follower_count").first()
+        )
+        if author is None or author.follower_count >= self.celebrity_threshold:
+            return
+        followers = await Follow.filter(
+            following_id=review.user_id, is_following=True
+        ).values_list("follower_id")
+        for (follower_id,) in followers:
+            buffer = self._buffers.get(follower_id)
+            if buffer is not None:
+                entries = len(buffer.review_ids)
+                buffer.append(review.id)
+                self._entries += len(buffer.review_ids) - entries
+        self._evict()
+
+    async def read(
+        self, user_id: int, before_id: int | None, limit: int
+    ) -> tuple[list[int], bool]:
+        """
+        before_id 보다 오래된 피드 리뷰 id 를 최신순으로 최대 limit 개 반환합니다.
+        두 번째 값은 다음 페이지가 있는지 여부입니다.
+        """
+        followings = follow_graph.followings(user_id)
+        if not followings:
+            return [], False
+        celebrity_ids = [
+            author_id
+            for (author_id,) in await User.filter(
+                id__in=followings, follower_count__gte=self.celebrity_threshold
+            ).values_list("id")
+        ]
+        celebrity_set = set(celebrity_ids)
+        author_ids = [
+            author_id for author_id in followings if author_id not in celebrity_set
+        ]
+
+        buffer = await self._get_buffer(user_id, author_ids)
+        # 동시에 작성된 리뷰는 id 순서와 다르게 추가될 수 있으므로 정렬 후 사용
+        pushed = sorted(
+            (
+                review_id
+                for review_id in buffer.review_ids
+                if before_id is None or review_id < before_id
+            ),
+            reverse=True,
+        )[: limit + 1]
+        if len(pushed) <= limit and not buffer.complete:
+            # buffer 에서 밀려난 오래된 리뷰는 DB 에서 직접 조회
+            oldest = min(buffer.review_ids)
+            bound = oldest if before_id is None else min(oldest, before_id)
+            pushed += await self._pull(author_ids, bound, limit + 1 - len(pushed))
+        pulled = await self._pull(celebrity_ids, before_id, limit + 1)
+
+        review_ids = list(
+            islice(
+                dict.fromkeys(merge(pushed, pulled, key=lambda id_: -id_)), limit + 1
+            )
+        )
+        return review_ids[:limit], len(review_ids) > limit
+
+    async def _get_buffer(self, user_id: int, author_ids: list[int]) -> FeedBuffer:
+        buffer = self._buffers.get(user_id)
+        if buffer is not None:
+            self._buffers.move_to_end(user_id)
+            return buffer
+
+        recent_ids = await self._pull(author_ids, None, self.buffer_size + 1)
+        buffer = FeedBuffer(
+            list(reversed(recent_ids[: self.buffer_size])),
+            maxlen=self.buffer_size,
+            complete=len(recent_ids) <= self.buffer_size,
+        )
+        self._buffers[user_id] = buffer
+        self._entries += len(buffer.review_ids)
+        self._evict(keep=user_id)
+        return buffer
+
+    async def _pull(
+        self, author_ids: list[int], before_id: int | None, limit: int
+    ) -> list[int]:
+        if not author_ids or limit <= 0:
+            return []
+        queryset = Review.filter(user_id__in=author_ids)
+        if before_id is not None:
+            queryset = queryset.filter(id__lt=before_id)
+        rows = await queryset.order_by("-id").limit(limit).values_list("id")
+        return [review_id for (review_id,) in rows]
+
+    def _evict(self, keep: int | None = None) -> None:
+        while self._entries > self.max_entries and self._buffers:
+            user_id, buffer = next(iter(self._buffers.items()))
+            if user_id == keep:
+                break
+            del self._buffers[user_id]
+            self._entries -= len(buffer.review_ids)
+            self.evictions += 1
+
+    def invalidate(self, user_id: int) -> None:
+        buffer = self._buffers.pop(user_id, None)
+        if buffer is not None:
+            self._entries -= len(buffer.review_ids)
+
+    def clear(self) -> None:
+        self._buffers.clear()
+        self._entries = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "buffers": len(self._buffers),
+            "entries": self._entries,
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+feed_store = FeedStore(
+    buffer_size=config.FEED_BUFFER_SIZE,
+    max_entries=config.FEED_MAX_ENTRIES,
+    celebrity_threshold=config.FEED_CELEBRITY_FOLLOWER_THRESHOLD,
+)
@@ -0,0 +1,136 @@
+from typing import Any
+
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from app.models.follows import Follow
+from app.models.users import User
+from app.services.auth import AuthenticatedUser
+from app.services.feed import feed_store
+from app.services.follow_graph import follow_graph
+from app.utils.websocket import manager
+
+
+class FollowService:
+    """
+    여러 사용자를 한 번에 팔로우/언팔로우하는 기능을 제공합니다.
+
+    한 트랜잭션 안에서 bulk_create 와 조건부 update 로 처리하므로 사용자 수와 관계없이 쿼리 수가 일정합니다.
+    bulk 작업은 post_save 시그널을 발생시키지 않으므로 app/signals/follow_signals.py 가 하던
+    카운터, 팔로우 그래프, 알림 갱신을 여기서 직접 처리합니다.
+    """
+
+    async def follow_many(
+        self, user: User | AuthenticatedUser, user_ids: list[int]
+    ) -> list[int]:
+        """user_ids 를 팔로우하고, 새로 팔로우 상태가 된 사용자 id 목록을 반환합니다."""
+        try:
+            changed_ids = await self._follow_many(user, user_ids)
+        except IntegrityError:
+            # select_for_update 는 이미 있는 row 만 잠그므로, 동시 요청이 같은 (follower, following) row 를
+            # 먼저 만들면 bulk_create 가 실패함. 다시 시도하면 그 row 를 잠그고 기존 row 로 처리
+            changed_ids = await self._follow_many(user, user_ids)
+
+        if changed_ids:
+            feed_store.invalidate(user.id)
+        for user_id in changed_ids:
+            follow_graph.add(user.id, user_id)
+            await manager.send_notification(
+                user_id=user_id, message=f"{user.username}님이 팔로우 하셨습니다."
+            )
+        return changed_ids
+
+    async def _follow_many(
+        self, user: User | AuthenticatedUser, user_ids: list[int]
+    ) -> list[int]:
+        async with in_transaction() as connection:
+            rows = (
+                await Follow.filter(follower_id=user.id, following_id__in=user_ids)
+                .select_for_update()
+                .using_db(connection)
+                .values_list("following_id", "is_following")
+            )
+            existing = {
+                following_id: is_following for following_id, is_following in rows
+            }
+            created_ids = [user_id for user_id in user_ids if user_id not in existing]
+            reactivated_ids = [
+                user_id
+                for user_id, is_following in existing.items()
+                if not is_following
+            ]
+
+            await Follow.bulk_create(
+                [
+                    Follow(follower_id=user.id, following_id=user_id)
+                    for user_id in created_ids
+                ],
+                using_db=connection,
+            )
+            if reactivated_ids:
+                await (
+                    Follow.filter(follower_id=user.id, following_id__in=reactivated_ids)
+                    .using_db(connection)
+                    .update(is_following=True, updated_at=timezone.now())
+                )
+            changed_ids = created_ids + reactivated_ids
+            await self._update_counts(user.id, changed_ids, 1, connection)
+        return changed_ids
+
+    async def unfollow_many(
+        self, user: User | AuthenticatedUser, user_ids: list[int]
+    ) -> list[int]:
+        """user_ids 를 언팔로우하고, 실제로 팔로우 상태가 해제된 사용자 id 목록을 반환합니다."""
+        async with in_transaction() as connection:
+            changed_ids = [
+                following_id
+                for (following_id,) in await Follow.filter(
+                    follower_id=user.id, following_id__in=user_ids, is_following=True
+                )
+                .select_for_update()
+                .using_db(connection)
+                .values_list("following_id")
+            ]
+            if changed_ids:
+                await (
+                    Follow.filter(follower_id=user.id, following_id__in=changed_ids)
+                    .using_db(connection)
+                    .update(is_following=False, updated_at=timezone.now())
+                )
+            await self._update_counts(user.id, changed_ids, -1, connection)
+
+        if changed_ids:
+            feed_store.invalidate(user.id)
+        for user_id in changed_ids:
+            follow_graph.remove(user.id, user_id)
+        return changed_ids
+
+    async def get_follow_status(self, user_id: int, user_ids: list[int]) -> set[int]:
+        """user_ids 중 user_id 가 팔로우하고 있는 사용자 id 를 (follower, following) 인덱스로 한 번에 조회합니다."""
+        rows = await Follow.filter(
+            follower_id=user_id, following_id__in=user_ids, is_following=True
+        ).values_list("following_id")
+        return {following_id for (following_id,) in rows}
+
+    async def _update_counts(
+        self, user_id: int, changed_ids: list[int], delta: int, connection: Any
+    ) -> None:
+        if not changed_ids:
+            return
+        await (
+            User.filter(id__in=changed_ids)
+            .using_db(connection)
+            .update(
+                follower_count=F("follower_count") + delta, updated_at=timezone.now()
+            )
+        )
+        await (
+            User.filter(id=user_id)
+            .using_db(connection)
+            .update(
+                following_count=F("following_count") + delta * len(changed_ids),
+                updated_at=timezone.now(),
+            )
+        )
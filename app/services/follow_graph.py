@@ -0,0 +1,151 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from heapq import nlargest
+from typing import Iterable
+
+from app.configs import config
+from app.models.follows import Follow
+
+
+class FollowGraph:
+    """
+    활성 팔로우(is_following=True) 관계를 프로세스 메모리에 보관하는 그래프입니다.
+
+    스냅샷은 CSR(Compressed Sparse Row) 형태로, 팔로워 순서대로 팔로잉 id 를 이어붙인 targets 배열과
+    팔로워별 시작 위치를 담은 offsets 배열, user id -> 행 번호 dict 로 구성됩니다.
+    각 행은 정렬되어 있어 bisect 로 관계 존재 여부를 확인할 수 있습니다.
+
+    스냅샷 이후의 팔로우/언팔로우는 _added/_removed 델타에 기록하고 조회 시 합쳐서 사용하며,
+    델타가 compact_threshold 를 넘으면 DB 조회 없이 메모리에서 스냅샷을 다시 만듭니다.
+    스냅샷은 애플리케이션 시작 시 load() 로 만들어지고, app/signals/follow_signals.py 에서 갱신됩니다.
+    """
+
+    def __init__(self, compact_threshold: int) -> None:
+        self.compact_threshold = compact_threshold
+        self._rows: dict[int, int] = {}
+        self._offsets = array("q", [0])
+        self._targets = array("q")
+        self._added: dict[int, set[int]] = {}
+        self._removed: dict[int, set[int]] = {}
+        self._delta_size = 0
+
+    async def load(self) -> None:
+        edges = (
+            await Follow.filter(is_following=True)
+            .order_by("follower_id", "following_id")
+            .values_list("follower_id", "following_id")
+        )
+        self._build(edges)
+
+    def _build(self, edges: Iterable[tuple[int, int]]) -> None:
+        """(팔로워, 팔로잉) 순서로 정렬된 관계 목록으로 스냅샷을 만들고 델타를 비웁니다."""
+        rows: dict[int, int] = {}
+        offsets = array("q", [0])
+        targets = array("q")
+        previous_follower = None
+        for follower_id, following_id in edges:
+            if follower_id != previous_follower:
+                if previous_follower is not None:
+                    offsets.append(len(targets))
+                rows[follower_id] = len(rows)
+                previous_follower = follower_id
+            targets.append(following_id)
+        if previous_follower is not None:
+            offsets.append(len(targets))
+
+        self._rows, self._offsets, self._targets = rows, offsets, targets
+        self._added, self._removed = {}, {}
+        self._delta_size = 0
+
+    def _snapshot_slice(self, user_id: int) -> tuple[int, int]:
+        row = self._rows.get(user_id)
+        if row is None:
+            return 0, 0
+        return self._offsets[row], self._offsets[row + 1]
+
+    def _in_snapshot(self, follower_id: int, following_id: int) -> bool:
+        start, end = self._snapshot_slice(follower_id)
+        index = bisect_left(self._targets, following_id, start, end)
+        return index < end and self._targets[index] == following_id
+
+    def followings(self, user_id: int) -> list[int]:
+        start, end = self._snapshot_slice(user_id)
+        removed = self._removed.get(user_id)
+        added = self._added.get(user_id)
+        if not removed and not added:
+            return self._targets[start:end].tolist()
+        result = [
+            following_id
+            for following_id in self._targets[start:end]
+            if not removed or following_id not in removed
+        ]
+        if added:
+            result.extend(added)
+        return result
+
+    def add(self, follower_id: int, following_id: int) -> None:
+        removed = self._removed.get(follower_id)
+        if removed and following_id in removed:
+            removed.discard(following_id)
+            self._delta_size -= 1
+        elif not self._in_snapshot(follower_id, following_id):
+            added = self._added.setdefault(follower_id, set())
+            if following_id not in added:
+                added.add(following_id)
+                self._delta_size += 1
+        self._compact_if_needed()
+
+    def remove(self, follower_id: int, following_id: int) -> None:
+        added = self._added.get(follower_id)
+        if added and following_id in added:
+            added.discard(following_id)
+            self._delta_size -= 1
+        elif self._in_snapshot(follower_id, following_id):
+            removed = self._removed.setdefault(follower_id, set())
+            if following_id not in removed:
+                removed.add(following_id)
+                self._delta_size += 1
+        self._compact_if_needed()
+
+    def _compact_if_needed(self) -> None:
+        if self._delta_size < self.compact_threshold:
+            return
+        follower_ids = sorted(self._rows.keys() | self._added.keys())
+        self._build(
+            (follower_id, following_id)
+            for follower_id in follower_ids
+            for following_id in sorted(self.followings(follower_id))
+        )
+
+    def suggestions(self, user_id: int, limit: int) -> list[tuple[int, int]]:
+        """
+        내가 팔로우하는 사용자들이 팔로우하는(2-hop) 사용자를 공통 팔로우 수 기준으로 추천합니다.
+        (user id, 공통 팔로우 수) 목록을 공통 팔로우 수 내림차순, id 오름차순으로 반환합니다.
+        """
+        followings = self.followings(user_id)
+        mutual_counts: Counter[int] = Counter()
+        for following_id in followings:
+            if following_id in self._added or following_id in self._removed:
+                mutual_counts.update(self.followings(following_id))
+            else:
+                # 델타가 없는 사용자는 배열 slice 를 그대로 집계 (C 구현이라 빠름)
+                start, end = self._snapshot_slice(following_id)
+                mutual_counts.update(self._targets[start:end])
+
+        for excluded_id in (user_id, *followings):
+            mutual_counts.pop(excluded_id, None)
+        return nlargest(
+            limit, mutual_counts.items(), key=lambda item: (item[1], -item[0])
+        )
+
+    def clear(self) -> None:
+        self._build(())
+
+    def __len__(self) -> int:
+        added = sum(len(following_ids) for following_ids in self._added.values())
+        removed = sum(len(following_ids) for following_ids in self._removed.values())
+        return len(self._targets) + added - removed
+
+
+follow_graph = FollowGraph(compact_threshold=config.FOLLOW_GRAPH_COMPACT_THRESHOLD)
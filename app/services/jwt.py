@@ -1,3 +1,6 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -6,6 +9,15 @@ import jwt
 from fastapi import HTTPException, Response, status
 
 from app.configs import config
+from app.models.users import User
+from app.utils.cache import TTLCache
+
+REFRESH_TOKEN_TYPE = "refresh"
+
+# 검증이 끝난 토큰의 payload 를 토큰 digest 기준으로 보관합니다. 각 항목은 토큰의 exp 시각에 만료됩니다.
+verified_token_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    maxsize=config.JWT_CACHE_MAXSIZE, ttl=config.JWT_CACHE_TTL_SECONDS
+)
 
 
 class JWTService:
@@ -22,12 +34,31 @@ class JWTService:
         return jwt.encode(payload, self._secret_key, algorithm=self.algorithm)
 
     def decode_token(self, token: str) -> Any:
-        """JWT 토큰을 디코딩하는 public 메서드"""
+        """
+        JWT 토큰을 디코딩하는 public 메서드
+
+        같은 토큰이 반복해서 전달되는 경우가 대부분이므로, 한 번 검증에 성공한 토큰은
+        verified_token_cache 에 저장해두고 exp 시각까지 서명 검증 없이 payload 를 반환합니다.
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        cached_payload = verified_token_cache.get(digest)
+        if cached_payload is not None:
+            return dict(cached_payload)
+
         try:
-            return jwt.decode(token, self._secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self._secret_key, algorithms=[self.algorithm])
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
+        expires_in = (
+            payload["exp"] - time.time()
+            if isinstance(payload.get("exp"), int)
+            else None
+        )
+        if expires_in is None or expires_in > 0:
+            verified_token_cache.set(digest, payload, ttl=expires_in)
+        return dict(payload)
+
     def _decode(self, token: str) -> Any:
         try:
             return jwt.decode(token, self._secret_key, algorithms=[self.algorithm])
@@ -40,8 +71,42 @@ class JWTService:
     def create_access_token(self, data: dict[str, Any]) -> str:
         return self._create_token(data, self.access_token_expires_in)
 
+    def get_access_token_claims(self, user: User) -> dict[str, Any]:
+        """
+        access token 에 담을 claim 을 생성합니다.
+        AUTH_CLAIMS_ONLY 모드에서는 요청마다 DB 를 조회하지 않도록 UserResponse 에 필요한 필드를 함께 담습니다.
+        """
+        claims: dict[str, Any] = {"username": user.username}
+        if config.AUTH_CLAIMS_ONLY:
+            claims.update(
+                {
+                    "user_id": user.id,
+                    "age": user.age,
+                    "gender": str(user.gender),
+                    "profile_image_url": user.profile_image_url,
+                }
+            )
+        return claims
+
     def create_refresh_token(self, data: dict[str, Any]) -> str:
-        return self._create_token(data, self.refresh_token_expires_in)
+        """refresh token 에는 교체/폐기를 추적하기 위한 고유 식별자(jti)와 토큰 타입을 담습니다."""
+        return self._create_token(
+            {**data, "jti": uuid.uuid4().hex, "type": REFRESH_TOKEN_TYPE},
+            self.refresh_token_expires_in,
+        )
+
+    def attach_access_token_in_response_cookie(
+        self, access_token: str, response: Response
+    ) -> Response:
+        response.set_cookie(
+            key="access_token",
+            value=access_token,
+            expires=self.access_token_expires_in * 60,
+            httponly=False,
+            secure=False,
+            samesite="lax",
+        )
+        return response
 
     def attach_jwt_token_in_response_cookie(
         self, access_token: str, refresh_token: str, response: Response
@@ -0,0 +1,266 @@
+import codecs
+import csv
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from enum import StrEnum
+from typing import Any
+
+import orjson
+from pydantic import TypeAdapter, ValidationError
+from tortoise.transactions import in_transaction
+
+from app.configs import config
+from app.models.movies import Movie
+from app.schemas.movies import CreateMovieRequest
+from app.services.movie_search import movie_search_index
+from app.services.response_cache import MOVIE_LIST_TAG, response_cache
+
+# 한 번에 검증하는 row 목록 - row 마다 모델을 검증하는 대신 pydantic-core 에서 batch 전체를 한 번에 검증
+MOVIE_ROWS_ADAPTER = TypeAdapter(list[CreateMovieRequest])
+# UTF-8 로 디코딩할 수 없는 줄, IMPORT_MAX_RECORD_BYTES 를 넘는 줄/record 의 오류
+INVALID_UTF8_ERROR: dict[str, Any] = {"loc": [], "msg": "Invalid UTF-8"}
+RECORD_TOO_LONG_ERROR: dict[str, Any] = {"loc": [], "msg": "Row is too long"}
+
+
+class MovieImportFormatEnum(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class MovieImportResult:
+    """
+    가져오기 진행 상황입니다. 실패한 row 수는 모두 세지만,
+    파일 전체의 오류가 메모리에 쌓이지 않도록 오류 내용은 max_errors 개까지만 보관합니다.
+    """
+
+    def __init__(self, max_errors: int) -> None:
+        self.max_errors = max_errors
+        self.processed = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: list[dict[str, Any]] = []
+
+    def add_error(self, line: int, errors: list[dict[str, Any]]) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "errors": errors})
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[str | dict[str, Any]]:
+    """
+    byte chunk 를 줄 단위로 나누어 UTF-8 로 디코딩합니다. 줄바꿈 문자는 유지하며 UTF-8 BOM 은 제거합니다.
+    줄바꿈 byte 는 멀티바이트 문자 안에 나타나지 않으므로 byte 단위로 나눈 뒤 줄마다 디코딩하며,
+    chunk 경계에서 잘린 줄은 다음 chunk 와 이어 붙입니다. 새로 받은 chunk 만 탐색하므로 줄 길이와 관계없이 선형 시간입니다.
+
+    디코딩할 수 없거나 IMPORT_MAX_RECORD_BYTES 를 넘는 줄은 값을 저장하지 않도록 줄 대신 오류를 반환하며,
+    너무 긴 줄은 줄바꿈이 나올 때까지 나머지를 버려 메모리 사용량이 늘어나지 않도록 합니다.
+    """
+    max_bytes = config.IMPORT_MAX_RECORD_BYTES
+    line = bytearray()
+    is_first_line = True
+    is_too_long = False
+
+    def finish_line() -> str | dict[str, Any]:
+        nonlocal is_first_line, is_too_long
+        if is_first_line and line.startswith(codecs.BOM_UTF8):
+            del line[: len(codecs.BOM_UTF8)]
+        is_first_line = False
+        if is_too_long:
+            result: str | dict[str, Any] = RECORD_TOO_LONG_ERROR
+        else:
+            try:
+                result = line.decode("utf-8")
+            except UnicodeDecodeError:
+                result = INVALID_UTF8_ERROR
+        line.clear()
+        is_too_long = False
+        return result
+
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if not is_too_long:
+                line += memoryview(chunk)[start : len(chunk) if end == -1 else end + 1]
+                if len(line) > max_bytes:
+                    is_too_long = True
+                    line.clear()
+            if end == -1:
+                break
+            yield finish_line()
+            start = end + 1
+    if line or is_too_long:
+        yield finish_line()
+
+
+async def iter_ndjson_rows(
+    lines: AsyncIterable[str | dict[str, Any]],
+) -> AsyncIterator[tuple[int, Any, list[dict[str, Any]]]]:
+    """(줄 번호, JSON 객체, 파싱 오류) 를 반환합니다. 빈 줄은 건너뜁니다."""
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if isinstance(line, dict):
+            yield line_number, None, [line]
+            continue
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield line_number, None, [{"loc": [], "msg": f"Invalid JSON: {e}"}]
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, [{"loc": [], "msg": "Row must be a JSON object"}]
+            continue
+        yield line_number, row, []
+
+
+async def iter_csv_rows(
+    lines: AsyncIterable[str | dict[str, Any]],
+) -> AsyncIterator[tuple[int, Any, list[dict[str, Any]]]]:
+    """
+    첫 row 를 컬럼 이름으로 사용하여 (시작 줄 번호, row dict, 파싱 오류) 를 반환합니다.
+    따옴표 안에 줄바꿈이 있는 값(줄거리 등)도 처리할 수 있도록, 따옴표 개수가 짝수가 될 때까지 줄을 모아
+    하나의 record 로 파싱합니다. record 의 크기가 IMPORT_MAX_RECORD_BYTES 를 넘으면 row 오류로 처리합니다.
+    cast 컬럼은 export 와 같은 JSON 배열 문자열입니다.
+    """
+    header: list[str] | None = None
+    # 이어 붙일 줄 - 줄마다 문자열을 이어 붙이거나 따옴표를 다시 세지 않도록 목록, 크기, 따옴표 개수를 따로 보관
+    parts: list[str] = []
+    size = quotes = 0
+    line_number = start_line = 0
+    async for line in lines:
+        line_number += 1
+        if not size:
+            start_line = line_number
+        if isinstance(line, dict):
+            # 이어 붙이던 record 도 함께 버림
+            yield start_line, None, [line]
+            parts, size, quotes = [], 0, 0
+            continue
+        size += len(line)
+        quotes += line.count('"')
+        if size > config.IMPORT_MAX_RECORD_BYTES:
+            # 다음 record 를 올바르게 찾도록 record 가 끝날 때까지 따옴표만 세고 나머지는 버림
+            parts.clear()
+        else:
+            parts.append(line)
+        if quotes % 2:
+            continue
+        if size > config.IMPORT_MAX_RECORD_BYTES:
+            yield start_line, None, [RECORD_TOO_LONG_ERROR]
+            parts, size, quotes = [], 0, 0
+            continue
+        values = next(csv.reader(["".join(parts)]), [])
+        parts, size, quotes = [], 0, 0
+        if not any(value.strip() for value in values):
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start_line, None, [
+                {
+                    "loc": [],
+                    "msg": f"Expected {len(header)} columns, got {len(values)}",
+                }
+            ]
+            continue
+        row: dict[str, Any] = dict(zip(header, values))
+        if "cast" in row:
+            try:
+                row["cast"] = orjson.loads(row["cast"])
+            except orjson.JSONDecodeError as e:
+                yield start_line, None, [{"loc": ["cast"], "msg": f"Invalid JSON: {e}"}]
+                continue
+        yield start_line, row, []
+    if size:
+        yield start_line, None, [{"loc": [], "msg": "Unterminated quoted value"}]
+
+
+ROW_PARSERS = {
+    MovieImportFormatEnum.CSV: iter_csv_rows,
+    MovieImportFormatEnum.NDJSON: iter_ndjson_rows,
+}
+
+
+def validate_rows(
+    rows: list[tuple[int, Any]], result: MovieImportResult
+) -> list[CreateMovieRequest]:
+    """
+    batch 전체를 한 번에 검증합니다. 실패한 row 가 있으면 오류를 row 별로 기록하고,
+    나머지 row 만 다시 한 번 검증하여 반환합니다.
+    """
+    try:
+        return MOVIE_ROWS_ADAPTER.validate_python([row for _, row in rows])
+    except ValidationError as exc:
+        failed: dict[int, list[dict[str, Any]]] = {}
+        for error in exc.errors(include_url=False, include_input=False):
+            index, *loc = error["loc"]
+            failed.setdefault(int(index), []).append({"loc": loc, "msg": error["msg"]})
+    for index, errors in failed.items():
+        result.add_error(rows[index][0], errors)
+    return MOVIE_ROWS_ADAPTER.validate_python(
+        [row for index, (_, row) in enumerate(rows) if index not in failed]
+    )
+
+
+async def insert_movies(movies: list[CreateMovieRequest]) -> None:
+    """
+    검증된 영화를 트랜잭션 하나에서 bulk_create 로 저장합니다.
+    bulk_create 는 post_save 시그널을 발생시키지 않으므로 검색 색인 갱신과 응답 캐시 무효화를 직접 수행합니다.
+    bulk_create 는 DB 에 따라 생성된 id 를 돌려주지 않으므로, 저장 전 가장 큰 id 이후의 영화를 색인합니다.
+    (그 사이 다른 요청으로 추가된 영화가 함께 색인되어도 같은 값으로 덮어쓸 뿐입니다.)
+    """
+    async with in_transaction() as connection:
+        last = (
+            await Movie.all().using_db(connection).order_by("-id").first().values("id")
+        )
+        await Movie.bulk_create(
+            [Movie(**movie.model_dump()) for movie in movies], using_db=connection
+        )
+    await movie_search_index.index(
+        Movie.filter(id__gt=last["id"] if last else 0), batch_size=len(movies)
+    )
+    await response_cache.invalidate(MOVIE_LIST_TAG)
+
+
+async def import_movies(
+    chunks: AsyncIterable[bytes],
+    file_format: MovieImportFormatEnum,
+    chunk_size: int,
+    max_errors: int,
+    on_progress: Callable[[MovieImportResult], None] | None = None,
+) -> MovieImportResult:
+    """
+    CSV/NDJSON 파일을 chunk_size row 씩 읽어 CreateMovieRequest 로 검증한 뒤 저장합니다.
+
+    파일은 byte chunk 로 스트리밍되며 한 번에 chunk_size row 만 메모리에 올립니다.
+    잘못된 row 는 건너뛰고 줄 번호와 함께 오류를 기록하며, chunk 를 저장할 때마다 on_progress 를 호출합니다.
+    """
+    result = MovieImportResult(max_errors=max_errors)
+    batch: list[tuple[int, Any]] = []
+
+    async def flush() -> None:
+        movies = validate_rows(batch, result)
+        if movies:
+            await insert_movies(movies)
+        result.processed += len(batch)
+        result.imported += len(movies)
+        batch.clear()
+        if on_progress is not None:
+            on_progress(result)
+
+    async for line_number, row, errors in ROW_PARSERS[file_format](iter_lines(chunks)):
+        if errors:
+            result.processed += 1
+            result.add_error(line_number, errors)
+            continue
+        batch.append((line_number, row))
+        if len(batch) >= chunk_size:
+            await flush()
+    if batch:
+        await flush()
+    return result
@@ -0,0 +1,240 @@
+import math
+import re
+import unicodedata
+from collections import Counter
+from heapq import heappush, heapreplace
+from typing import Any
+
+from tortoise.queryset import QuerySet
+
+from app.models.movies import Movie
+from app.utils.pagination import iter_value_batches
+
+# 한글 음절 연속 구간과 그 밖의 단어 문자(악센트가 있는 라틴 문자 등, 밑줄 제외) 연속 구간을 토큰 후보로 사용
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+
+# 필드별 가중치 - 제목과 출연진 이름이 줄거리보다 더 중요하게 반영되도록 term frequency 에 곱함
+FIELD_WEIGHTS = {"title": 3, "cast": 2, "plot": 1}
+
+INDEXED_FIELDS = ("title", "plot", "cast", "genre", "playtime", "poster_image_url")
+
+
+def is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    한글 이외의 문자는 단어 단위로, 한글은 띄어쓰기/조사와 관계없이 부분 일치하도록 음절 bigram 으로 나눕니다.
+    한 음절 한글 단어는 그대로 unigram 으로 사용합니다.
+    조합형 문자("e" + 결합 악센트, 자모로 나뉜 한글)도 같은 토큰이 되도록 NFKC 로 정규화합니다.
+    예: "어벤져스는" -> ["어벤", "벤져", "져스", "스는"], "Amélie" -> ["amélie"]
+    """
+    tokens: list[str] = []
+    for word in TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if is_hangul(word[0]) and len(word) > 1:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+class MovieSearchIndex:
+    """
+    영화 제목, 줄거리, 출연진 이름을 대상으로 BM25 점수를 계산하는 프로세스 메모리 역색인입니다.
+
+    term -> {movie id: 가중 term frequency} posting 과 문서 길이를 보관하고,
+    검색 결과에 필요한 영화 정보도 함께 저장하여 검색 시 DB 를 조회하지 않습니다.
+    문서를 교체/삭제할 수 있도록 movie id -> term frequency 도 보관합니다.
+
+    검색 시에는 term 별로 BM25 점수(idf 제외)가 높은 순서로 정렬한 posting 을 만들어 캐싱하고,
+    여러 term 의 정렬된 posting 을 같은 깊이씩 읽으며 아직 보지 못한 문서가 얻을 수 있는 최대 점수가
+    현재 limit 번째 점수보다 낮아지면 중단합니다(Threshold Algorithm).
+    따라서 많은 영화에 등장하는 term 이 포함되어도 posting 전체를 읽지 않습니다.
+
+    한글은 bigram 으로 색인하므로 한 음절 검색어("뷔")는 음절 -> 그 음절을 포함하는 bigram 목록으로
+    확장하여 검색합니다.
+
+    색인은 애플리케이션 시작 시 load() 로 만들어지고,
+    app/signals/movie_signals.py 의 post_save/post_delete 시그널에서 갱신됩니다.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[int, int]] = {}
+        self._doc_terms: dict[int, Counter[str]] = {}
+        self._doc_lengths: dict[int, int] = {}
+        self._documents: dict[int, dict[str, Any]] = {}
+        self._total_length = 0
+        # term -> (정렬 시점의 평균 문서 길이, 점수 내림차순 movie id 목록, 점수 목록)
+        self._ranked: dict[str, tuple[float, list[int], list[float]]] = {}
+        # 한글 음절 -> 그 음절을 포함하는 bigram term 목록
+        self._syllable_terms: dict[str, set[str]] = {}
+
+    async def load(self, batch_size: int = 1000) -> None:
+        self.clear()
+        await self.index(Movie.all(), batch_size)
+
+    async def index(self, queryset: QuerySet[Movie], batch_size: int = 1000) -> None:
+        """시그널을 거치지 않고 추가/수정된 영화(bulk_create 등)를 색인에 반영합니다."""
+        async for rows in iter_value_batches(queryset, INDEXED_FIELDS, batch_size):
+            for row in rows:
+                self.upsert(row)
+
+    def upsert(self, movie: dict[str, Any]) -> None:
+        movie_id = movie["id"]
+        self.remove(movie_id)
+
+        cast_names = " ".join(
+            str(member.get("name", "")) for member in movie.get("cast") or []
+        )
+        terms: Counter[str] = Counter()
+        for field, text in (
+            ("title", movie["title"]),
+            ("cast", cast_names),
+            ("plot", movie["plot"]),
+        ):
+            for token in tokenize(text):
+                terms[token] += FIELD_WEIGHTS[field]
+
+        for term, frequency in terms.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = {}
+                if len(term) == 2 and is_hangul(term[0]):
+                    for syllable in term:
+                        self._syllable_terms.setdefault(syllable, set()).add(term)
+            posting[movie_id] = frequency
+            self._ranked.pop(term, None)
+        length = sum(terms.values())
+        self._doc_terms[movie_id] = terms
+        self._doc_lengths[movie_id] = length
+        self._total_length += length
+        self._documents[movie_id] = {
+            "id": movie_id,
+            "title": movie["title"],
+            "genre": movie["genre"],
+            "playtime": movie["playtime"],
+            "poster_image_url": movie.get("poster_image_url"),
+        }
+
+    def remove(self, movie_id: int) -> None:
+        terms = self._doc_terms.pop(movie_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            posting = self._postings[term]
+            del posting[movie_id]
+            self._ranked.pop(term, None)
+            if not posting:
+                del self._postings[term]
+                if len(term) == 2 and is_hangul(term[0]):
+                    for syllable in set(term):
+                        bigrams = self._syllable_terms[syllable]
+                        bigrams.discard(term)
+                        if not bigrams:
+                            del self._syllable_terms[syllable]
+        self._total_length -= self._doc_lengths.pop(movie_id)
+        del self._documents[movie_id]
+
+    def _term_score(
+        self, frequency: int, movie_id: int, average_length: float
+    ) -> float:
+        """idf 를 제외한 BM25 term 점수"""
+        norm = self.k1 * (
+            1 - self.b + self.b * self._doc_lengths[movie_id] / average_length
+        )
+        return frequency * (self.k1 + 1) / (frequency + norm)
+
+    def _ranked_posting(
+        self, term: str, average_length: float
+    ) -> tuple[float, list[int], list[float]]:
+        ranked = self._ranked.get(term)
+        # 문서가 추가/삭제되어 평균 문서 길이가 10% 이상 달라지면 다시 정렬
+        if ranked is None or abs(ranked[0] - average_length) > average_length * 0.1:
+            scored = sorted(
+                (
+                    (self._term_score(frequency, movie_id, average_length), movie_id)
+                    for movie_id, frequency in self._postings[term].items()
+                ),
+                key=lambda item: (-item[0], item[1]),
+            )
+            ranked = (
+                average_length,
+                [movie_id for _, movie_id in scored],
+                [score for score, _ in scored],
+            )
+            self._ranked[term] = ranked
+        return ranked
+
+    def search(self, query: str, limit: int) -> list[dict[str, Any]]:
+        document_count = len(self._doc_lengths)
+        if not document_count:
+            return []
+        average_length = self._total_length / document_count or 1
+
+        query_terms = set()
+        for token in tokenize(query):
+            query_terms.add(token)
+            if len(token) == 1 and is_hangul(token):
+                query_terms.update(self._syllable_terms.get(token, ()))
+
+        term_lists = []
+        for term in query_terms:
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(
+                1 + (document_count - len(posting) + 0.5) / (len(posting) + 0.5)
+            )
+            ranked_average, movie_ids, scores = self._ranked_posting(
+                term, average_length
+            )
+            term_lists.append((idf, posting, ranked_average, movie_ids, scores))
+
+        seen: set[int] = set()
+        top: list[tuple[float, int]] = []  # (점수, -movie id) 최소 힙
+        max_depth = max((len(term[3]) for term in term_lists), default=0)
+        for depth in range(max_depth):
+            threshold = 0.0
+            for term_idf, _, _, movie_ids, scores in term_lists:
+                if depth >= len(movie_ids):
+                    continue
+                threshold += term_idf * scores[depth]
+                movie_id = movie_ids[depth]
+                if movie_id in seen:
+                    continue
+                seen.add(movie_id)
+                score = sum(
+                    idf * self._term_score(posting[movie_id], movie_id, ranked_average)
+                    for idf, posting, ranked_average, _, _ in term_lists
+                    if movie_id in posting
+                )
+                if len(top) < limit:
+                    heappush(top, (score, -movie_id))
+                elif (score, -movie_id) > top[0]:
+                    heapreplace(top, (score, -movie_id))
+            # 남은 문서가 얻을 수 있는 최대 점수가 limit 번째 점수보다 낮으면 중단
+            if len(top) >= limit and top[0][0] >= threshold:
+                break
+
+        return [
+            {**self._documents[-negative_id], "score": round(score, 4)}
+            for score, negative_id in sorted(top, reverse=True)
+        ]
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_lengths.clear()
+        self._documents.clear()
+        self._ranked.clear()
+        self._syllable_terms.clear()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+movie_search_index = MovieSearchIndex()
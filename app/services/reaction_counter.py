@@ -0,0 +1,88 @@
+import random
+from typing import Any
+
+from tortoise import timezone
+from tortoise.expressions import F
+from tortoise.functions import Coalesce, Sum
+
+from app.configs import config
+from app.models.likes import MovieReactionCounterShard, ReactionTypeEnum
+from app.models.movies import Movie
+
+REACTION_COUNT_FIELDS = {
+    ReactionTypeEnum.LIKE: "like_count",
+    ReactionTypeEnum.DISLIKE: "dislike_count",
+}
+
+
+class ReactionCounter:
+    """
+    영화의 좋아요/싫어요 수를 movies 테이블에 비정규화하여 관리합니다.
+
+    카운터는 F 표현식으로 DB 에서 원자적으로 증감합니다.
+    좋아요 수가 REACTION_COUNTER_HOT_THRESHOLD 이상인 인기 영화는 movies row 하나에 갱신이 몰리지 않도록
+    REACTION_COUNTER_SHARDS 개의 shard row 중 하나에 증감하고,
+    조회 시 movies 의 값과 shard 합계를 한 번의 LEFT JOIN 집계 쿼리로 더합니다.
+    shard 에 쌓인 값은 app/commands/fold_reaction_counters.py 로 주기적으로 movies 에 합칩니다.
+    """
+
+    async def apply(self, movie_id: int, deltas: dict[str, int], using_db: Any) -> None:
+        updates: dict[str, Any] = {
+            field: F(field) + delta for field, delta in deltas.items() if delta
+        }
+        if not updates:
+            return
+        updates["updated_at"] = timezone.now()
+        # 인기 영화가 아니면 조건부 update 한 번으로 끝남
+        updated = await (
+            Movie.filter(
+                id=movie_id, like_count__lt=config.REACTION_COUNTER_HOT_THRESHOLD
+            )
+            .using_db(using_db)
+            .update(**updates)
+        )
+        if updated:
+            return
+
+        shard, _ = await MovieReactionCounterShard.get_or_create(
+            movie_id=movie_id,
+            shard=random.randrange(config.REACTION_COUNTER_SHARDS),
+            using_db=using_db,
+        )
+        await (
+            MovieReactionCounterShard.filter(id=shard.id)
+            .using_db(using_db)
+            .update(**updates)
+        )
+
+    async def get_counts(self, movie_ids: list[int]) -> dict[int, dict[str, int]]:
+        """movie_ids 의 좋아요/싫어요 수를 한 번의 쿼리로 조회합니다. 없는 영화는 결과에서 빠집니다."""
+        rows = (
+            await Movie.filter(id__in=movie_ids)
+            .annotate(
+                shard_like_count=Coalesce(
+                    Sum("reaction_counter_shards__like_count"), 0
+                ),
+                shard_dislike_count=Coalesce(
+                    Sum("reaction_counter_shards__dislike_count"), 0
+                ),
+            )
+            .group_by("id")
+            .values(
+                "id",
+                "like_count",
+                "dislike_count",
+                "shard_like_count",
+                "shard_dislike_count",
+            )
+        )
+        return {
+            row["id"]: {
+                "like_count": row["like_count"] + int(row["shard_like_count"]),
+                "dislike_count": row["dislike_count"] + int(row["shard_dislike_count"]),
+            }
+            for row in rows
+        }
+
+
+reaction_counter = ReactionCounter()
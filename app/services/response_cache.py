@@ -0,0 +1,273 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+from fastapi import Request, Response
+
+from app.configs import config
+from app.utils.conditional import (
+    is_not_modified,
+    not_modified_response,
+    validator_headers,
+)
+
+# 태그 - 응답에 포함된 데이터를 나타내며, 해당 데이터가 바뀌면 app/signals/cache_signals.py 에서 무효화
+MOVIE_LIST_TAG = "movies"
+# 좋아요 수로 정렬한 영화 목록은 리액션이 바뀔 때마다 순서가 달라질 수 있으므로 따로 무효화
+POPULAR_MOVIE_LIST_TAG = "movies:like_count"
+
+# body 외에 key, 헤더, 파이썬 객체가 차지하는 메모리를 대략적으로 더함
+ENTRY_OVERHEAD_BYTES = 256
+
+
+def movie_tag(movie_id: int) -> str:
+    return f"movie:{movie_id}"
+
+
+def movie_reviews_tag(movie_id: int) -> str:
+    return f"movie:{movie_id}:reviews"
+
+
+def review_likes_tag(review_id: int) -> str:
+    return f"review:{review_id}:likes"
+
+
+class CachedResponse:
+    """캐시에 저장되는 응답 - 인코딩된 JSON body 와 304 판단에 필요한 검증자(ETag, Last-Modified)"""
+
+    __slots__ = ("body", "etag", "last_modified")
+
+    def __init__(
+        self, body: bytes, etag: str | None, last_modified: datetime | None
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + ENTRY_OVERHEAD_BYTES
+
+
+class ResponseCacheBackend(ABC):
+    """
+    응답 캐시를 저장하는 인터페이스입니다.
+    여러 워커가 캐시와 무효화를 공유해야 한다면 Redis 등 외부 저장소를 사용하는 구현체로 교체합니다.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> CachedResponse | None:
+        """만료되지 않은 항목을 반환합니다. 없으면 None 을 반환합니다."""
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: CachedResponse, tags: Iterable[str], ttl: float
+    ) -> None:
+        """value 를 ttl 초 동안 저장하고, tags 중 하나가 무효화되면 함께 지워지도록 기록합니다."""
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """tags 중 하나라도 붙어있는 항목을 모두 지웁니다."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int | float]:
+        """hit/miss 횟수와 hit ratio 등 캐시 상태를 반환합니다."""
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """
+    프로세스 메모리에 응답을 저장하는 LRU 캐시입니다.
+
+    항목 수 대신 저장된 body 크기의 합이 max_bytes 를 넘지 않도록 가장 오래 사용되지 않은 항목부터 제거하고,
+    max_entry_bytes 보다 큰 응답은 다른 항목을 모두 밀어내지 않도록 저장하지 않습니다.
+    태그 -> key 색인을 보관하여 태그 무효화 시 해당 항목만 찾아 지웁니다.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        # key -> (만료 시각, 응답, 태그)
+        self._data: OrderedDict[str, tuple[float, CachedResponse, tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        self._tags: dict[str, set[str]] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get(self, key: str) -> CachedResponse | None:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def set(
+        self, key: str, value: CachedResponse, tags: Iterable[str], ttl: float
+    ) -> None:
+        self._remove(key)
+        if value.size > self.max_entry_bytes:
+            return
+        tags = tuple(tags)
+        self._data[key] = (time.monotonic() + ttl, value, tags)
+        self._bytes += value.size
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                self._remove(key)
+                self.invalidations += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        _, value, tags = entry
+        self._bytes -= value.size
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._tags.clear()
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cache_key(request: Request) -> str:
+    """경로와 정렬한 query string 으로 key 를 만듭니다. 파라미터 순서가 달라도 같은 항목을 사용합니다."""
+    query = "&".join(
+        f"{key}={value}" for key, value in sorted(request.query_params.multi_items())
+    )
+    return f"{request.url.path}?{query}"
+
+
+class ResponseCache:
+    """
+    조회가 수정보다 훨씬 많은 GET 엔드포인트의 응답 body 를 캐싱합니다.
+
+    캐시에 있으면 DB 를 조회하지 않고 저장된 body 를 반환하며,
+    If-None-Match / If-Modified-Since 가 저장된 검증자와 일치하면 304 를 반환합니다.
+    항목은 응답에 포함된 데이터의 태그와 함께 저장되고,
+    데이터가 바뀌면 app/signals/cache_signals.py 의 post_save/post_delete 시그널에서 태그로 무효화됩니다.
+    시그널이 발생하지 않는 쿼리셋 update 나 다른 프로세스에서의 변경은 ttl 이 지나야 반영됩니다.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        # 무효화 횟수와 태그별 마지막 무효화 시점 - 응답을 만드는 동안 그 응답의 태그가 무효화되었다면
+        # 이미 오래된 응답일 수 있으므로 저장하지 않음. 다른 태그의 무효화는 저장 여부에 영향을 주지 않음
+        self._generation = 0
+        self._tag_generations: dict[str, int] = {}
+        # 응답을 만드는 중인 요청 수 - 없으면 태그별 무효화 시점을 기록할 필요가 없으므로 비움
+        self._building = 0
+
+    async def serve(
+        self,
+        request: Request,
+        tags: Iterable[str],
+        build: Callable[[], Awaitable[Response]],
+        ttl: float | None = None,
+    ) -> Response:
+        key = cache_key(request)
+        cached = await self.backend.get(key)
+        if cached is not None:
+            if cached.etag is not None and is_not_modified(
+                request, cached.etag, cached.last_modified
+            ):
+                return not_modified_response(cached.etag, cached.last_modified)
+            return self._to_response(cached)
+
+        tags = tuple(tags)
+        generation = self._generation
+        self._building += 1
+        try:
+            response = await build()
+            is_stale = any(
+                self._tag_generations.get(tag, 0) > generation for tag in tags
+            )
+        finally:
+            self._building -= 1
+            if not self._building:
+                self._tag_generations.clear()
+        if response.status_code != 200:
+            return response
+
+        last_modified = response.headers.get("last-modified")
+        cached = CachedResponse(
+            body=bytes(response.body),
+            etag=response.headers.get("etag"),
+            last_modified=(
+                parsedate_to_datetime(last_modified) if last_modified else None
+            ),
+        )
+        if not is_stale:
+            await self.backend.set(key, cached, tags, self.ttl if ttl is None else ttl)
+        response.headers["X-Cache"] = "MISS"
+        return response
+
+    @staticmethod
+    def _to_response(cached: CachedResponse) -> Response:
+        headers = (
+            validator_headers(cached.etag, cached.last_modified)
+            if cached.etag is not None
+            else {}
+        )
+        headers["X-Cache"] = "HIT"
+        return Response(
+            content=cached.body, media_type="application/json", headers=headers
+        )
+
+    async def invalidate(self, *tags: str) -> None:
+        if self._building:
+            self._generation += 1
+            for tag in tags:
+                self._tag_generations[tag] = self._generation
+        await self.backend.invalidate(tags)
+
+    def stats(self) -> dict[str, int | float]:
+        return self.backend.stats()
+
+
+response_cache_backend = InMemoryResponseCacheBackend(
+    max_bytes=config.RESPONSE_CACHE_MAX_BYTES,
+    max_entry_bytes=config.RESPONSE_CACHE_MAX_ENTRY_BYTES,
+)
+response_cache = ResponseCache(
+    backend=response_cache_backend, ttl=config.RESPONSE_CACHE_TTL_SECONDS
+)
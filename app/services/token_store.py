@@ -0,0 +1,70 @@
+import time
+from abc import ABC, abstractmethod
+
+
+class RefreshTokenStore(ABC):
+    """
+    refresh token 의 폐기(revocation)와 교체(rotation) 상태를 저장하는 인터페이스입니다.
+    여러 워커가 상태를 공유해야 한다면 Redis 등 공용 저장소를 사용하는 구현체로 교체합니다.
+    """
+
+    @abstractmethod
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """jti 를 토큰 만료 시각(expires_at, unix timestamp)까지 폐기 상태로 기록합니다."""
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool:
+        """jti 가 폐기되었는지 확인합니다."""
+
+    @abstractmethod
+    async def consume(self, jti: str, expires_at: float) -> bool:
+        """
+        토큰을 한 번 사용된 것으로 기록합니다.
+        이미 폐기된 토큰이면 False 를 반환하며, 확인과 기록은 원자적으로 수행되어야 합니다.
+        """
+
+
+class InMemoryRefreshTokenStore(RefreshTokenStore):
+    """
+    프로세스 메모리에 폐기된 jti 와 만료 시각을 저장하는 구현체입니다.
+    만료된 토큰은 어차피 검증 단계에서 거부되므로 purge_interval 마다 만료된 항목을 정리합니다.
+    """
+
+    def __init__(self, purge_interval: int = 1000) -> None:
+        self.purge_interval = purge_interval
+        self._revoked: dict[str, float] = {}
+        self._writes = 0
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        self._revoked[jti] = expires_at
+        self._writes += 1
+        if self._writes % self.purge_interval == 0:
+            self.purge_expired()
+
+    async def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    async def consume(self, jti: str, expires_at: float) -> bool:
+        # 이벤트 루프는 단일 스레드이고 await 지점이 없으므로 확인과 기록이 원자적으로 수행됨
+        if jti in self._revoked:
+            return False
+        await self.revoke(jti, expires_at)
+        return True
+
+    def purge_expired(self) -> None:
+        now = time.time()
+        self._revoked = {
+            jti: expires_at
+            for jti, expires_at in self._revoked.items()
+            if expires_at > now
+        }
+
+    def clear(self) -> None:
+        self._revoked.clear()
+        self._writes = 0
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+refresh_token_store = InMemoryRefreshTokenStore()
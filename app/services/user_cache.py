@@ -0,0 +1,57 @@
+import copy
+
+from app.configs import config
+from app.models.users import User
+from app.utils.cache import TTLCache
+
+
+class UserCache:
+    """
+    인증된 사용자(User)를 username 기준으로 캐싱합니다.
+
+    username 이 변경되면 변경 전 username 으로 캐싱된 항목도 지워야 하므로
+    user id -> username 매핑을 함께 보관합니다. 두 캐시 모두 같은 크기/만료 정책을 따릅니다.
+    캐시 무효화는 app/signals/user_signals.py 의 post_save/post_delete 시그널에서 호출됩니다.
+
+    핸들러가 수정 API 에서 User 객체의 필드를 바꾼 뒤 저장에 실패하면 시그널이 발생하지 않으므로,
+    요청끼리 같은 객체를 공유하지 않도록 저장할 때와 꺼낼 때 모두 얕은 복사본을 사용합니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._users: TTLCache[str, User] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._usernames: TTLCache[int, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, username: str) -> User | None:
+        user = self._users.get(username)
+        return None if user is None else copy.copy(user)
+
+    def get_by_id(self, user_id: int) -> User | None:
+        username = self._usernames.get(user_id)
+        if username is None:
+            return None
+        user = self._users.get(username)
+        if user is None or user.id != user_id:
+            return None
+        return copy.copy(user)
+
+    def set(self, user: User) -> None:
+        self._users.set(user.username, copy.copy(user))
+        self._usernames.set(user.id, user.username)
+
+    def invalidate(self, user: User) -> None:
+        self._users.pop(user.username)
+        previous_username = self._usernames.pop(user.id)
+        if previous_username is not None:
+            self._users.pop(previous_username)
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._usernames.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        return self._users.stats()
+
+
+user_cache = UserCache(
+    maxsize=config.USER_CACHE_MAXSIZE, ttl=config.USER_CACHE_TTL_SECONDS
+)
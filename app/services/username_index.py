@@ -0,0 +1,68 @@
+from bisect import bisect_left, insort
+
+from app.models.users import User
+
+
+class UsernameIndex:
+    """
+    username 자동완성(prefix 검색)을 위한 프로세스 메모리 인덱스입니다.
+
+    (소문자 username, user id) 튜플을 정렬된 리스트로 보관하여 bisect 로 prefix 의 시작 위치를 찾고,
+    prefix 가 일치하는 동안만 순회하므로 DB 의 LIKE 검색 없이 O(log n + limit) 로 응답합니다.
+    username 이 변경되면 이전 항목을 지워야 하므로 user id -> username 매핑을 함께 보관합니다.
+    인덱스는 애플리케이션 시작 시 load() 로 만들어지고,
+    app/signals/user_signals.py 의 post_save/post_delete 시그널에서 갱신됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[str, int]] = []
+        self._usernames: dict[int, str] = {}
+
+    async def load(self) -> None:
+        rows = await User.all().values_list("id", "username")
+        self._usernames = {user_id: username for user_id, username in rows}
+        self._entries = sorted(
+            (username.lower(), user_id) for user_id, username in rows
+        )
+
+    def upsert(self, user_id: int, username: str) -> None:
+        previous_username = self._usernames.get(user_id)
+        if previous_username == username:
+            return
+        if previous_username is not None:
+            self._remove_entry(previous_username, user_id)
+        self._usernames[user_id] = username
+        insort(self._entries, (username.lower(), user_id))
+
+    def remove(self, user_id: int) -> None:
+        username = self._usernames.pop(user_id, None)
+        if username is not None:
+            self._remove_entry(username, user_id)
+
+    def search(self, prefix: str, limit: int) -> list[dict[str, int | str]]:
+        key = prefix.lower()
+        results: list[dict[str, int | str]] = []
+        index = bisect_left(self._entries, (key, 0))
+        while index < len(self._entries) and len(results) < limit:
+            lowered, user_id = self._entries[index]
+            if not lowered.startswith(key):
+                break
+            results.append({"id": user_id, "username": self._usernames[user_id]})
+            index += 1
+        return results
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._usernames.clear()
+
+    def _remove_entry(self, username: str, user_id: int) -> None:
+        entry = (username.lower(), user_id)
+        index = bisect_left(self._entries, entry)
+        if index < len(self._entries) and self._entries[index] == entry:
+            del self._entries[index]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+username_index = UsernameIndex()
@@ -1,5 +1,19 @@
 # signals 모듈을 main.py에서 임포트하면 하위 모듈까지 읽어오도록 임포트해놓음
+import app.signals.cache_signals
 import app.signals.follow_signals
+import app.signals.movie_signals
+import app.signals.reaction_signals
 import app.signals.review_like_signals
+import app.signals.review_signals
+import app.signals.user_signals
 
-__all__ = ["app", "follow_signals", "review_like_signals"]
+__all__ = [
+    "app",
+    "cache_signals",
+    "follow_signals",
+    "movie_signals",
+    "reaction_signals",
+    "review_like_signals",
+    "review_signals",
+    "user_signals",
+]
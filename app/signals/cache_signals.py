@@ -0,0 +1,89 @@
+from typing import Any
+
+from tortoise.signals import post_delete, post_save, pre_delete
+
+from app.models.likes import MovieReaction, ReviewLike
+from app.models.movies import Movie
+from app.models.reviews import Review
+from app.models.users import User
+from app.services.response_cache import (
+    MOVIE_LIST_TAG,
+    POPULAR_MOVIE_LIST_TAG,
+    movie_reviews_tag,
+    movie_tag,
+    response_cache,
+    review_likes_tag,
+)
+
+
+@post_save(Movie)
+@post_delete(Movie)
+async def movie_cache_signals(sender: Any, instance: Movie, *args: Any) -> None:
+    # 영화가 삭제되면 리뷰도 ON DELETE CASCADE 로 지워지므로 리뷰 목록도 함께 무효화
+    await response_cache.invalidate(
+        MOVIE_LIST_TAG, movie_tag(instance.id), movie_reviews_tag(instance.id)
+    )
+
+
+@pre_delete(Movie)
+async def movie_reviews_cache_signals(
+    sender: Any, instance: Movie, using_db: Any, **kwargs: Any
+) -> None:
+    # 영화가 삭제되면 리뷰와 리뷰 좋아요가 ON DELETE CASCADE 로 지워져 시그널이 발생하지 않으므로
+    # 영화에 달린 리뷰의 좋아요 수 캐시를 미리 무효화
+    review_ids = (
+        await Review.filter(movie_id=instance.id).using_db(using_db).values_list("id")
+    )
+    if review_ids:
+        await response_cache.invalidate(
+            *(review_likes_tag(review_id) for (review_id,) in review_ids)
+        )
+
+
+@post_save(MovieReaction)
+@post_delete(MovieReaction)
+async def movie_reaction_cache_signals(
+    sender: Any, instance: MovieReaction, *args: Any
+) -> None:
+    # 좋아요 수는 쿼리셋 update 로 갱신되어 Movie 시그널이 발생하지 않으므로 리액션 시그널에서 무효화
+    await response_cache.invalidate(POPULAR_MOVIE_LIST_TAG)
+
+
+@post_save(Review)
+@post_delete(Review)
+async def review_cache_signals(sender: Any, instance: Review, *args: Any) -> None:
+    await response_cache.invalidate(
+        movie_reviews_tag(instance.movie_id), review_likes_tag(instance.id)
+    )
+
+
+@post_save(ReviewLike)
+@post_delete(ReviewLike)
+async def review_like_cache_signals(
+    sender: Any, instance: ReviewLike, *args: Any
+) -> None:
+    await response_cache.invalidate(review_likes_tag(instance.review_id))
+
+
+@pre_delete(User)
+async def user_cache_signals(
+    sender: Any, instance: User, using_db: Any, **kwargs: Any
+) -> None:
+    # 사용자가 삭제되면 리뷰/리뷰 좋아요/리액션이 ON DELETE CASCADE 로 지워져 시그널이 발생하지 않으므로
+    # 사용자가 작성한 리뷰와 좋아요를 누른 리뷰의 캐시를 미리 무효화
+    reviews = (
+        await Review.filter(user_id=instance.id)
+        .using_db(using_db)
+        .values_list("id", "movie_id")
+    )
+    liked_review_ids = (
+        await ReviewLike.filter(user_id=instance.id)
+        .using_db(using_db)
+        .values_list("review_id")
+    )
+    await response_cache.invalidate(
+        POPULAR_MOVIE_LIST_TAG,
+        *(movie_reviews_tag(movie_id) for _, movie_id in reviews),
+        *(review_likes_tag(review_id) for review_id, _ in reviews),
+        *(review_likes_tag(review_id) for (review_id,) in liked_review_ids),
+    )
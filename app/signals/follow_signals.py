@@ -1,23 +1,111 @@
 from typing import Any
-from tortoise.signals import post_save
+
+from tortoise import timezone
+from tortoise.expressions import F
+from tortoise.signals import post_delete, post_save, pre_delete
 
 from app.models.follows import Follow
+from app.models.users import User
+from app.services.feed import feed_store
+from app.services.follow_graph import follow_graph
 from app.utils.websocket import manager
 
 
+def follow_count_delta(instance: Follow, created: bool, update_fields: Any) -> int:
+    """
+    저장된 Follow 가 팔로우 수를 얼마나 바꾸는지 계산합니다.
+    기존 row 는 is_following 을 update_fields 로 지정해 저장한 경우에만 상태가 바뀐 것으로 봅니다.
+    """
+    if created:
+        return 1 if instance.is_following else 0
+    if update_fields and "is_following" in update_fields:
+        return 1 if instance.is_following else -1
+    return 0
+
+
+async def update_follow_counts(instance: Follow, delta: int, using_db: Any) -> None:
+    # F 표현식으로 DB 에서 원자적으로 증감하므로 동시 요청에도 값이 유실되지 않음
+    await (
+        User.filter(id=instance.following_id)
+        .using_db(using_db)
+        .update(follower_count=F("follower_count") + delta, updated_at=timezone.now())
+    )
+    await (
+        User.filter(id=instance.follower_id)
+        .using_db(using_db)
+        .update(following_count=F("following_count") + delta, updated_at=timezone.now())
+    )
+
+
 @post_save(Follow)
 async def follow_signals(
-    sender: Any, 
-    instance: Follow, 
-    created: bool, 
-    using_db: Any, 
-    update_fields: Any, 
-    **kwargs: Any
+    sender: Any,
+    instance: Follow,
+    created: bool,
+    using_db: Any,
+    update_fields: Any,
+    **kwargs: Any,
 ) -> None:
+    delta = follow_count_delta(instance, created, update_fields)
+    if delta:
+        await update_follow_counts(instance, delta, using_db)
+        if delta > 0:
+            follow_graph.add(instance.follower_id, instance.following_id)
+        else:
+            follow_graph.remove(instance.follower_id, instance.following_id)
+        feed_store.invalidate(instance.follower_id)
+
     if created or instance.is_following:
         await instance.fetch_related("follower", "following")
 
         await manager.send_notification(
             user_id=instance.following.id,
-            message=f"{instance.follower.username}님이 팔로우 하셨습니다."
+            message=f"{instance.follower.username}님이 팔로우 하셨습니다.",
         )
+
+
+@post_delete(Follow)
+async def follow_deleted_signals(
+    sender: Any, instance: Follow, using_db: Any, **kwargs: Any
+) -> None:
+    if instance.is_following:
+        await update_follow_counts(instance, -1, using_db)
+        follow_graph.remove(instance.follower_id, instance.following_id)
+        feed_store.invalidate(instance.follower_id)
+
+
+@pre_delete(User)
+async def user_follows_deleted_signals(
+    sender: Any, instance: User, using_db: Any, **kwargs: Any
+) -> None:
+    # 사용자가 삭제되면 follows row 는 DB 의 ON DELETE CASCADE 로 지워져 시그널이 발생하지 않으므로
+    # 상대방의 카운터와 팔로우 그래프를 미리 갱신함
+    follows = Follow.filter(is_following=True).using_db(using_db)
+    following_ids = [
+        following_id
+        for (following_id,) in await follows.filter(
+            follower_id=instance.id
+        ).values_list("following_id")
+    ]
+    follower_ids = [
+        follower_id
+        for (follower_id,) in await follows.filter(
+            following_id=instance.id
+        ).values_list("follower_id")
+    ]
+    await (
+        User.filter(id__in=following_ids)
+        .using_db(using_db)
+        .update(follower_count=F("follower_count") - 1, updated_at=timezone.now())
+    )
+    await (
+        User.filter(id__in=follower_ids)
+        .using_db(using_db)
+        .update(following_count=F("following_count") - 1, updated_at=timezone.now())
+    )
+    for following_id in following_ids:
+        follow_graph.remove(instance.id, following_id)
+    for follower_id in follower_ids:
+        follow_graph.remove(follower_id, instance.id)
+        feed_store.invalidate(follower_id)
+    feed_store.invalidate(instance.id)
@@ -0,0 +1,35 @@
+from typing import Any
+
+from tortoise.signals import post_delete, post_save
+
+from app.models.movies import Movie
+from app.services.movie_search import movie_search_index
+
+
+@post_save(Movie)
+async def movie_saved_signals(
+    sender: Any,
+    instance: Movie,
+    created: bool,
+    using_db: Any,
+    update_fields: Any,
+    **kwargs: Any,
+) -> None:
+    movie_search_index.upsert(
+        {
+            "id": instance.id,
+            "title": instance.title,
+            "plot": instance.plot,
+            "cast": instance.cast,
+            "genre": instance.genre,
+            "playtime": instance.playtime,
+            "poster_image_url": instance.poster_image_url,
+        }
+    )
+
+
+@post_delete(Movie)
+async def movie_deleted_signals(
+    sender: Any, instance: Movie, using_db: Any, **kwargs: Any
+) -> None:
+    movie_search_index.remove(instance.id)
@@ -0,0 +1,73 @@
+from typing import Any
+
+from tortoise import timezone
+from tortoise.expressions import F
+from tortoise.signals import post_delete, post_save, pre_delete
+
+from app.models.likes import MovieReaction
+from app.models.movies import Movie
+from app.models.users import User
+from app.services.reaction_counter import REACTION_COUNT_FIELDS, reaction_counter
+
+
+def reaction_count_deltas(
+    instance: MovieReaction, created: bool, update_fields: Any
+) -> dict[str, int]:
+    """
+    저장된 MovieReaction 이 영화의 좋아요/싫어요 수를 얼마나 바꾸는지 계산합니다.
+    기존 row 는 type 을 update_fields 로 지정해 저장한 경우에만 좋아요/싫어요가 바뀐 것으로 봅니다.
+    """
+    field = REACTION_COUNT_FIELDS[instance.type]
+    if created:
+        return {field: 1}
+    if update_fields and "type" in update_fields:
+        return {
+            other_field: 1 if other_field == field else -1
+            for other_field in REACTION_COUNT_FIELDS.values()
+        }
+    return {}
+
+
+@post_save(MovieReaction)
+async def movie_reaction_signals(
+    sender: Any,
+    instance: MovieReaction,
+    created: bool,
+    using_db: Any,
+    update_fields: Any,
+    **kwargs: Any,
+) -> None:
+    deltas = reaction_count_deltas(instance, created, update_fields)
+    await reaction_counter.apply(instance.movie_id, deltas, using_db)
+
+
+@post_delete(MovieReaction)
+async def movie_reaction_deleted_signals(
+    sender: Any, instance: MovieReaction, using_db: Any, **kwargs: Any
+) -> None:
+    await reaction_counter.apply(
+        instance.movie_id, {REACTION_COUNT_FIELDS[instance.type]: -1}, using_db
+    )
+
+
+@pre_delete(User)
+async def user_reactions_deleted_signals(
+    sender: Any, instance: User, using_db: Any, **kwargs: Any
+) -> None:
+    # 사용자가 삭제되면 movie_reactions row 는 ON DELETE CASCADE 로 지워져 시그널이 발생하지 않으므로
+    # 사용자가 남긴 리액션만큼 영화의 카운터를 미리 줄임
+    for reaction_type, field in REACTION_COUNT_FIELDS.items():
+        movie_ids = [
+            movie_id
+            for (movie_id,) in await MovieReaction.filter(
+                user_id=instance.id, type=reaction_type
+            )
+            .using_db(using_db)
+            .values_list("movie_id")
+        ]
+        if movie_ids:
+            await (
+                Movie.filter(id__in=movie_ids)
+                .using_db(using_db)
+                .update(**{field: F(field) - 1, "updated_at": timezone.now()})
+            )
@@ -0,0 +1,19 @@
+from typing import Any
+
+from tortoise.signals import post_save
+
+from app.models.reviews import Review
+from app.services.feed import feed_store
+
+
+@post_save(Review)
+async def review_created_signals(
+    sender: Any,
+    instance: Review,
+    created: bool,
+    using_db: Any,
+    update_fields: Any,
+    **kwargs: Any,
+) -> None:
+    if created:
+        await feed_store.fan_out(instance)
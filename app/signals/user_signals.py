@@ -0,0 +1,28 @@
+from typing import Any
+
+from tortoise.signals import post_delete, post_save
+
+from app.models.users import User
+from app.services.user_cache import user_cache
+from app.services.username_index import username_index
+
+
+@post_save(User)
+async def user_saved_signals(
+    sender: Any,
+    instance: User,
+    created: bool,
+    using_db: Any,
+    update_fields: Any,
+    **kwargs: Any,
+) -> None:
+    user_cache.invalidate(instance)
+    username_index.upsert(instance.id, instance.username)
+
+
+@post_delete(User)
+async def user_deleted_signals(
+    sender: Any, instance: User, using_db: Any, **kwargs: Any
+) -> None:
+    user_cache.invalidate(instance)
+    username_index.remove(instance.id)
@@ -0,0 +1,43 @@
+import httpx
+import pytest
+from fastapi import status
+from starlette.types import Receive, Scope, Send
+from tortoise.contrib.test import TestCase
+
+from app.middleware.auth import AuthMiddleware
+
+
+async def failing_app(scope: Scope, receive: Receive, send: Send) -> None:
+    raise RuntimeError("boom")
+
+
+async def failing_stream_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    raise RuntimeError("boom")
+
+
+class TestAuthMiddleware(TestCase):
+    async def test_unhandled_exception_becomes_json_500(self) -> None:
+        # given
+        transport = httpx.ASGITransport(app=AuthMiddleware(failing_app))
+
+        # when
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get("/movies")
+
+        # then
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json() == {"detail": "boom"}
+
+    async def test_exception_after_response_started_is_propagated(self) -> None:
+        # given
+        transport = httpx.ASGITransport(app=AuthMiddleware(failing_stream_app))
+
+        # when / then
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            with pytest.raises(RuntimeError):
+                await client.get("/movies")
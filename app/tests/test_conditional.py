@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from app.utils.conditional import is_not_modified, make_etag, validator_headers
+
+UPDATED_AT = datetime(2026, 10, 17, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def make_request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (key.replace("_", "-").encode(), value.encode())
+                for key, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_make_etag_is_strong_or_weak() -> None:
+    # when
+    strong = make_etag("movie", 1, UPDATED_AT)
+    weak = make_etag("movie", 1, UPDATED_AT, weak=True)
+
+    # then
+    assert strong.startswith('"') and strong.endswith('"')
+    assert weak == f"W/{strong}"
+    assert make_etag("movie", 1, UPDATED_AT, ("id",)) != strong
+
+
+def test_if_none_match_uses_weak_comparison() -> None:
+    # given
+    etag = make_etag("movie", 1, UPDATED_AT)
+
+    # then
+    assert is_not_modified(make_request(if_none_match=etag), etag)
+    assert is_not_modified(make_request(if_none_match=f'"other", W/{etag}'), etag)
+    assert is_not_modified(make_request(if_none_match="*"), etag)
+    assert not is_not_modified(make_request(if_none_match='"other"'), etag)
+    assert not is_not_modified(make_request(), etag, UPDATED_AT)
+
+
+def test_if_modified_since_is_ignored_when_if_none_match_is_present() -> None:
+    # given
+    etag = make_etag("movie", 1, UPDATED_AT)
+    last_modified = validator_headers(etag, UPDATED_AT)["Last-Modified"]
+
+    # then
+    assert last_modified == "Sat, 17 Oct 2026 09:30:15 GMT"
+    assert is_not_modified(
+        make_request(if_modified_since=last_modified), etag, UPDATED_AT
+    )
+    assert not is_not_modified(
+        make_request(if_modified_since="Sat, 17 Oct 2026 09:30:14 GMT"),
+        etag,
+        UPDATED_AT,
+    )
+    assert not is_not_modified(
+        make_request(if_modified_since="not a date"), etag, UPDATED_AT
+    )
+    assert not is_not_modified(
+        make_request(if_none_match='"other"', if_modified_since=last_modified),
+        etag,
+        UPDATED_AT,
+    )
@@ -0,0 +1,81 @@
+import json
+from unittest.mock import patch
+
+import httpx
+from fastapi import status
+from tortoise.contrib.test import TestCase
+
+from app.configs import config
+from app.models.movies import Movie
+from app.models.users import GenderEnum, User
+from main import app
+
+
+class TestExportRouter(TestCase):
+    async def test_api_export_users(self) -> None:
+        # given
+        for i in range(5):
+            await User.create(
+                username=f"testuser{i}",
+                hashed_password="hashed",
+                age=20 + i,
+                gender=GenderEnum.MALE,
+            )
+
+        # when
+        with patch.object(config, "EXPORT_BATCH_SIZE", 2):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.get("/export/users.ndjson")
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        users = await User.filter().order_by("id")
+        assert [row["id"] for row in rows] == [user.id for user in users]
+        assert rows[0]["username"] == users[0].username
+        assert "hashed_password" not in rows[0]
+
+    async def test_api_export_movies(self) -> None:
+        # given
+        movie = await Movie.create(
+            title="test",
+            plot="test 중 입니다.",
+            cast=(cast := [{"name": "lee2", "role": "actor"}]),
+            playtime=240,
+            genre="SF",
+        )
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/export/movies.ndjson")
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows == [
+            {
+                "id": movie.id,
+                "title": "test",
+                "plot": "test 중 입니다.",
+                "cast": cast,
+                "playtime": 240,
+                "genre": "SF",
+                "poster_image_url": None,
+                "created_at": rows[0]["created_at"],
+            }
+        ]
+
+    async def test_api_export_when_resource_is_invalid(self) -> None:
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/export/follows.ndjson")
+
+        # then
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
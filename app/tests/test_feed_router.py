@@ -0,0 +1,146 @@
+from unittest.mock import patch
+
+import httpx
+from fastapi import status
+from tortoise.contrib.test import TestCase
+
+from app.models.follows import Follow
+from app.models.movies import Movie
+from app.models.reviews import Review
+from app.models.users import GenderEnum, User
+from app.services.feed import feed_store
+from main import app
+
+
+class TestFeedRouter(TestCase):
+    async def _login(self, client: httpx.AsyncClient, username: str) -> int:
+        create_response = await client.post(
+            url="/users",
+            json={
+                "username": username,
+                "password": "password123",
+                "age": 20,
+                "gender": GenderEnum.MALE,
+            },
+        )
+        await client.post(
+            url="/users/login",
+            json={"username": username, "password": "password123"},
+        )
+        return int(create_response.json())
+
+    async def _create_user(self, username: str) -> User:
+        return await User.create(
+            username=username, hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+
+    async def _create_reviews(self, author: User, count: int) -> list[int]:
+        review_ids = []
+        for i in range(count):
+            movie = await Movie.create(
+                title=f"movie{i}", plot="plot", cast=[], playtime=100, genre="SF"
+            )
+            review = await Review.create(
+                user_id=author.id, movie_id=movie.id, title="title", content="content"
+            )
+            review_ids.append(review.id)
+        return review_ids
+
+    async def _read_all_pages(self, client: httpx.AsyncClient, limit: int) -> list[int]:
+        review_ids: list[int] = []
+        params: dict[str, str | int] = {"limit": limit}
+        while True:
+            page = (await client.get(url="/users/me/feed", params=params)).json()
+            review_ids += [review["id"] for review in page["items"]]
+            if page["next_cursor"] is None:
+                return review_ids
+            params["cursor"] = page["next_cursor"]
+
+    async def test_api_get_my_feed_with_fan_out_on_write(self) -> None:
+        # given
+        author, other_author, stranger = [
+            await self._create_user(username)
+            for username in ["author", "other_author", "stranger"]
+        ]
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await self._login(client, "testuser")
+            await client.post(
+                url="/users/me/follow",
+                json={"user_ids": [author.id, other_author.id]},
+            )
+            old_review_ids = await self._create_reviews(author, 2)
+            await self._create_reviews(stranger, 1)
+            first_read = await client.get(url="/users/me/feed")
+
+            # when
+            new_review_ids = await self._create_reviews(other_author, 2)
+            feed_review_ids = await self._read_all_pages(client, limit=3)
+
+        # then
+        assert first_read.status_code == status.HTTP_200_OK
+        assert feed_review_ids == sorted(old_review_ids + new_review_ids, reverse=True)
+        assert feed_store.stats()["entries"] == 4
+
+    async def test_api_get_my_feed_with_fan_out_on_read_for_celebrity(self) -> None:
+        # given
+        celebrity, author = [
+            await self._create_user(username) for username in ["celebrity", "author"]
+        ]
+        await Follow.create(follower_id=author.id, following_id=celebrity.id)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await self._login(client, "testuser")
+            await client.post(
+                url="/users/me/follow", json={"user_ids": [celebrity.id, author.id]}
+            )
+            with patch.object(feed_store, "celebrity_threshold", 2):
+                await client.get(url="/users/me/feed")
+                review_ids = await self._create_reviews(celebrity, 2)
+                review_ids += await self._create_reviews(author, 1)
+
+                # when
+                feed_review_ids = await self._read_all_pages(client, limit=2)
+
+        # then
+        assert feed_review_ids == sorted(review_ids, reverse=True)
+        # celebrity 의 리뷰는 buffer 에 저장되지 않음
+        assert feed_store.stats()["entries"] == 1
+
+    async def test_api_get_my_feed_beyond_buffer_size(self) -> None:
+        # given
+        author = await self._create_user("author")
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await self._login(client, "testuser")
+            await client.post(url=f"/users/{author.id}/follow")
+            with patch.object(feed_store, "buffer_size", 2):
+                await client.get(url="/users/me/feed")
+                review_ids = await self._create_reviews(author, 5)
+
+                # when
+                feed_review_ids = await self._read_all_pages(client, limit=2)
+
+        # then
+        assert feed_review_ids == sorted(review_ids, reverse=True)
+        assert feed_store.stats()["entries"] == 2
+
+    async def test_feed_store_evicts_least_recently_read_buffer(self) -> None:
+        # given
+        author = await self._create_user("author")
+        readers = [await self._create_user(f"reader{i}") for i in range(2)]
+        for reader in readers:
+            await Follow.create(follower_id=reader.id, following_id=author.id)
+        await self._create_reviews(author, 2)
+
+        # when
+        with patch.object(feed_store, "max_entries", 3):
+            for reader in readers:
+                await feed_store.read(reader.id, None, limit=10)
+
+        # then
+        assert feed_store.stats()["buffers"] == 1
+        assert feed_store.evictions == 1
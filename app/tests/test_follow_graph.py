@@ -0,0 +1,47 @@
+from app.services.follow_graph import FollowGraph
+
+
+def test_follow_graph_suggests_friends_of_friends_by_mutual_count() -> None:
+    # given
+    graph = FollowGraph(compact_threshold=100)
+    for follower_id, following_id in [(1, 2), (1, 3), (2, 4), (3, 4), (3, 5), (2, 1)]:
+        graph.add(follower_id, following_id)
+
+    # when
+    suggestions = graph.suggestions(1, limit=10)
+
+    # then
+    assert suggestions == [(4, 2), (5, 1)]
+
+
+def test_follow_graph_keeps_deltas_consistent_across_compaction() -> None:
+    # given
+    graph = FollowGraph(compact_threshold=3)
+    graph.add(1, 2)
+    graph.add(1, 3)
+    graph.add(2, 3)  # 델타가 3 개가 되어 스냅샷으로 합쳐짐
+
+    # when
+    graph.remove(1, 2)
+    graph.add(1, 4)
+    graph.add(1, 2)
+    graph.remove(1, 4)
+
+    # then
+    assert sorted(graph.followings(1)) == [2, 3]
+    assert graph.followings(2) == [3]
+    assert len(graph) == 3
+
+
+def test_follow_graph_ignores_duplicate_events() -> None:
+    # given
+    graph = FollowGraph(compact_threshold=100)
+    graph.add(1, 2)
+
+    # when
+    graph.add(1, 2)
+    graph.remove(1, 3)
+
+    # then
+    assert graph.followings(1) == [2]
+    assert len(graph) == 1
@@ -0,0 +1,232 @@
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+from fastapi import status
+from tortoise.contrib.test import TestCase
+from tortoise.exceptions import IntegrityError
+
+from app.models.follows import Follow
+from app.models.users import GenderEnum, User
+from app.services.follow import FollowService
+from main import app
+
+
+class TestFollowRouter(TestCase):
+    async def _login(self, client: httpx.AsyncClient, username: str) -> int:
+        create_response = await client.post(
+            url="/users",
+            json={
+                "username": username,
+                "password": "password123",
+                "age": 20,
+                "gender": GenderEnum.MALE,
+            },
+        )
+        await client.post(
+            url="/users/login",
+            json={"username": username, "password": "password123"},
+        )
+        return int(create_response.json())
+
+    async def _create_user(self, username: str) -> User:
+        return await User.create(
+            username=username, hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+
+    async def test_api_follow_and_unfollow_update_counters(self) -> None:
+        # given
+        target = await self._create_user("target")
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            user_id = await self._login(client, "testuser")
+
+            # when
+            await client.post(url=f"/users/{target.id}/follow")
+            await client.post(url=f"/users/{target.id}/follow")
+            followed_profile = await client.get(url=f"/users/{target.id}/profile")
+            await client.post(url=f"/users/{target.id}/unfollow")
+            await client.post(url=f"/users/{target.id}/unfollow")
+            unfollowed_profile = await client.get(url=f"/users/{target.id}/profile")
+            my_profile = await client.get(url=f"/users/{user_id}/profile")
+
+        # then
+        assert followed_profile.status_code == status.HTTP_200_OK
+        assert followed_profile.json()["follower_count"] == 1
+        assert unfollowed_profile.json()["follower_count"] == 0
+        assert my_profile.json()["following_count"] == 0
+
+    async def test_api_get_user_profile_revalidates_after_follow(self) -> None:
+        # given
+        target = await self._create_user("target")
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await self._login(client, "testuser")
+            first = await client.get(url=f"/users/{target.id}/profile")
+            etag = first.headers["ETag"]
+
+            # when
+            revalidated = await client.get(
+                url=f"/users/{target.id}/profile", headers={"If-None-Match": etag}
+            )
+            await client.post(url=f"/users/{target.id}/follow")
+            after_follow = await client.get(
+                url=f"/users/{target.id}/profile", headers={"If-None-Match": etag}
+            )
+
+        # then
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        # 팔로워 수는 F 표현식으로 갱신되지만 updated_at 도 함께 갱신되어 새 ETag 가 만들어짐
+        assert after_follow.status_code == status.HTTP_200_OK
+        assert after_follow.json()["follower_count"] == 1
+
+    async def test_api_get_user_profile_when_user_not_found(self) -> None:
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await self._login(client, "testuser")
+            response = await client.get(url="/users/999999/profile")
+
+        # then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_api_delete_user_decrements_counters_of_followed_users(
+        self,
+    ) -> None:
+        # given
+        target = await self._create_user("target")
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await self._login(client, "testuser")
+            await client.post(url=f"/users/{target.id}/follow")
+
+            # when
+            await client.delete(url="/users/me")
+
+        # then
+        await target.refresh_from_db()
+        assert target.follower_count == 0
+
+    async def test_api_get_my_suggestions(self) -> None:
+        # given
+        friend, other_friend, suggested = [
+            await self._create_user(username)
+            for username in ["friend", "other_friend", "suggested"]
+        ]
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await self._login(client, "testuser")
+            await client.post(url=f"/users/{friend.id}/follow")
+            await client.post(url=f"/users/{other_friend.id}/follow")
+            await Follow.create(follower_id=friend.id, following_id=suggested.id)
+            await Follow.create(follower_id=other_friend.id, following_id=suggested.id)
+            await Follow.create(follower_id=friend.id, following_id=other_friend.id)
+
+            # when
+            response = await client.get(url="/users/me/suggestions")
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "id": suggested.id,
+                "username": "suggested",
+                "profile_image_url": None,
+                "mutual_count": 2,
+            }
+        ]
+
+    async def test_api_bulk_follow_and_follow_status(self) -> None:
+        # given
+        targets = [await self._create_user(f"target{i}") for i in range(3)]
+        target_ids = [target.id for target in targets]
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            user_id = await self._login(client, "testuser")
+            await client.post(url=f"/users/{target_ids[0]}/follow")
+            await client.post(url=f"/users/{target_ids[0]}/unfollow")
+
+            # when
+            follow_response = await client.post(
+                url="/users/me/follow",
+                json={"user_ids": [*target_ids, target_ids[1], user_id]},
+            )
+            await client.post(
+                url="/users/me/unfollow", json={"user_ids": [target_ids[2]]}
+            )
+            status_response = await client.get(
+                url="/users/me/follow_status", params={"ids": target_ids}
+            )
+
+        # then
+        assert follow_response.status_code == status.HTTP_200_OK
+        assert [follow["following_id"] for follow in follow_response.json()] == (
+            target_ids
+        )
+        assert status_response.json() == [
+            {"user_id": target_ids[0], "is_following": True},
+            {"user_id": target_ids[1], "is_following": True},
+            {"user_id": target_ids[2], "is_following": False},
+        ]
+        targets = await User.filter(id__in=target_ids).order_by("id")
+        assert [target.follower_count for target in targets] == [1, 1, 0]
+        assert (await User.get(id=user_id)).following_count == 2
+        assert await Follow.filter(follower_id=user_id).count() == 3
+
+    async def test_api_bulk_follow_retries_when_follow_is_created_concurrently(
+        self,
+    ) -> None:
+        # given
+        target = await self._create_user("target")
+        follow_many = FollowService._follow_many
+
+        async def follow_created_by_other_request(
+            service: FollowService, user: Any, user_ids: list[int]
+        ) -> list[int]:
+            if not await Follow.exists(follower_id=user.id):
+                # 다른 요청이 먼저 같은 팔로우 row 를 만들어 bulk_create 가 unique 제약에 걸린 상황
+                await Follow.create(follower_id=user.id, following_id=target.id)
+                raise IntegrityError("Duplicate entry")
+            return await follow_many(service, user, user_ids)
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            user_id = await self._login(client, "testuser")
+
+            # when
+            with patch.object(
+                FollowService, "_follow_many", follow_created_by_other_request
+            ):
+                response = await client.post(
+                    url="/users/me/follow", json={"user_ids": [target.id]}
+                )
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert await Follow.filter(follower_id=user_id).count() == 1
+        assert (await User.get(id=target.id)).follower_count == 1
+        assert (await User.get(id=user_id)).following_count == 1
+
+    async def test_api_bulk_follow_when_user_not_found(self) -> None:
+        # given
+        target = await self._create_user("target")
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await self._login(client, "testuser")
+
+            # when
+            response = await client.post(
+                url="/users/me/follow", json={"user_ids": [target.id, 999999]}
+            )
+
+        # then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert await Follow.filter(following_id=target.id).count() == 0
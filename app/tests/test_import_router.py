@@ -0,0 +1,261 @@
+import json
+from collections.abc import AsyncIterator
+from unittest.mock import patch
+
+import httpx
+from fastapi import status
+from tortoise.contrib.test import TestCase
+
+from app.configs import config
+from app.models.movies import Movie
+from app.models.users import GenderEnum
+from main import app
+
+
+def ndjson(*rows: object) -> bytes:
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode()
+
+
+async def login(client: httpx.AsyncClient, username: str = "admin") -> int:
+    response = await client.post(
+        url="/users",
+        json={
+            "username": username,
+            "password": "password123",
+            "age": 20,
+            "gender": GenderEnum.MALE,
+        },
+    )
+    await client.post(
+        url="/users/login", json={"username": username, "password": "password123"}
+    )
+    return int(response.json())
+
+
+class TestImportRouter(TestCase):
+    async def test_api_import_movies_ndjson(self) -> None:
+        # given
+        movie = {
+            "title": "어벤져스",
+            "plot": "히어로들이 모인다",
+            "cast": [{"name": "lee", "role": "actor"}],
+            "playtime": 143,
+            "genre": "SF",
+        }
+        content = (
+            ndjson(movie, {**movie, "title": "인터스텔라"})
+            + b"\n"
+            + b"{not json}\n"
+            + ndjson(
+                {**movie, "playtime": "long"},
+                {**movie, "cast": [{"name": "kim"}]},
+                {**movie, "title": "기생충"},
+            )
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            admin_id = await login(client)
+            await client.get("/movies", params={"fields": "title"})
+
+            # when
+            with patch.object(config, "ADMIN_USER_IDS", [admin_id]):
+                response = await client.post(
+                    "/import/movies.ndjson", params={"chunk_size": 2}, content=content
+                )
+            movies = await client.get("/movies", params={"fields": "title"})
+            search = await client.get("/movies/search", params={"q": "인터스텔라"})
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["processed"] == 6
+        assert response_json["imported"] == 3
+        assert response_json["failed"] == 3
+        assert [error["line"] for error in response_json["errors"]] == [4, 5, 6]
+        assert response_json["errors"][1]["errors"][0]["loc"] == ["playtime"]
+        assert response_json["errors"][2]["errors"][0]["loc"] == ["cast", 0, "role"]
+        assert sorted(movie["title"] for movie in movies.json()) == [
+            "기생충",
+            "어벤져스",
+            "인터스텔라",
+        ]
+        assert [movie["title"] for movie in search.json()] == ["인터스텔라"]
+
+    async def test_api_import_movies_csv_streamed_in_small_chunks(self) -> None:
+        # given
+        content = (
+            "﻿title,plot,cast,playtime,genre\n"
+            '기생충,"반지하 가족의\n이야기","[{""name"": ""송강호"", ""role"": ""actor""}]",132,Horror\n'
+            "잘못된 행,줄거리\n"
+            "인셉션,꿈속의 꿈,[],148,Unknown\n"
+            '테넷,"시간을 거스르는 ""작전""",[],150,Action\n'
+        ).encode()
+
+        async def stream() -> AsyncIterator[bytes]:
+            # 한글 멀티바이트 문자와 줄이 chunk 경계에서 잘리도록 작게 나누어 전송
+            for i in range(0, len(content), 5):
+                yield content[i : i + 5]
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            with patch.object(config, "ADMIN_USER_IDS", [await login(client)]):
+                response = await client.post("/import/movies.csv", content=stream())
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["imported"] == 2
+        assert response_json["failed"] == 2
+        assert [error["line"] for error in response_json["errors"]] == [4, 5]
+        assert response_json["errors"][1]["errors"][0]["loc"] == ["genre"]
+        movies = await Movie.all().order_by("id")
+        assert movies[0].title == "기생충"
+        assert movies[0].plot == "반지하 가족의\n이야기"
+        assert movies[0].cast == [{"name": "송강호", "role": "actor"}]
+        assert movies[1].plot == '시간을 거스르는 "작전"'
+
+    async def test_api_import_movies_from_export(self) -> None:
+        # given
+        await Movie.create(
+            title="test",
+            plot="test 중 입니다.",
+            cast=[{"name": "lee2", "role": "actor"}],
+            playtime=240,
+            genre="SF",
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            exported = await client.get("/export/movies.ndjson")
+
+            # when
+            with patch.object(config, "ADMIN_USER_IDS", [await login(client)]):
+                response = await client.post(
+                    "/import/movies.ndjson", content=exported.content
+                )
+
+        # then
+        assert response.json()["imported"] == 1
+        rows = await Movie.all().order_by("id").values("title", "cast", "genre")
+        assert rows[0] == rows[1]
+
+    async def test_api_import_movies_with_invalid_format(self) -> None:
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            with patch.object(config, "ADMIN_USER_IDS", [await login(client)]):
+                response = await client.post("/import/movies.xml", content=b"<movies/>")
+
+        # then
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_api_import_movies_reports_invalid_utf8_lines(self) -> None:
+        # given
+        movie = {
+            "title": "기생충",
+            "plot": "반지하 가족의 이야기",
+            "cast": [],
+            "playtime": 132,
+            "genre": "Horror",
+        }
+        content = (
+            ndjson(movie)
+            + json.dumps(
+                {**movie, "title": "잘못된 인코딩"}, ensure_ascii=False
+            ).encode("euc-kr")
+            + b"\n"
+            + ndjson({**movie, "title": "인셉션"})
+        )
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            with patch.object(config, "ADMIN_USER_IDS", [await login(client)]):
+                response = await client.post("/import/movies.ndjson", content=content)
+
+        # then
+        response_json = response.json()
+        assert response_json["imported"] == 2
+        assert response_json["errors"] == [
+            {"line": 2, "errors": [{"loc": [], "msg": "Invalid UTF-8"}]}
+        ]
+        assert [movie.title for movie in await Movie.all().order_by("id")] == [
+            "기생충",
+            "인셉션",
+        ]
+
+    async def test_api_import_movies_reports_too_long_rows(self) -> None:
+        # given
+        movie = {
+            "title": "기생충",
+            "plot": "반지하 가족의 이야기",
+            "cast": [],
+            "playtime": 132,
+            "genre": "Horror",
+        }
+        ndjson_content = (
+            ndjson(movie, {**movie, "plot": "가" * 1000}) + b"x" * 10_000 + b"\n"
+        ) + ndjson({**movie, "title": "인셉션"})
+        csv_content = (
+            "title,plot,cast,playtime,genre\n"
+            '기생충,"반지하 가족의\n' + "이야기\n" * 200 + '",[],132,Horror\n'
+            "인셉션,꿈속의 꿈,[],148,Action\n"
+        ).encode()
+
+        async def stream(content: bytes) -> AsyncIterator[bytes]:
+            # 줄바꿈 없이 길게 이어지는 줄도 chunk 단위로 전송
+            for i in range(0, len(content), 100):
+                yield content[i : i + 100]
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            with (
+                patch.object(config, "ADMIN_USER_IDS", [await login(client)]),
+                patch.object(config, "IMPORT_MAX_RECORD_BYTES", 500),
+            ):
+                ndjson_response = await client.post(
+                    "/import/movies.ndjson", content=stream(ndjson_content)
+                )
+                csv_response = await client.post(
+                    "/import/movies.csv", content=stream(csv_content)
+                )
+
+        # then
+        too_long = [{"loc": [], "msg": "Row is too long"}]
+        assert ndjson_response.json()["imported"] == 2
+        assert ndjson_response.json()["errors"] == [
+            {"line": 2, "errors": too_long},
+            {"line": 3, "errors": too_long},
+        ]
+        assert csv_response.json()["imported"] == 1
+        assert csv_response.json()["errors"][0] == {"line": 2, "errors": too_long}
+        assert [movie.title for movie in await Movie.all().order_by("id")] == [
+            "기생충",
+            "인셉션",
+            "인셉션",
+        ]
+
+    async def test_api_import_movies_requires_admin(self) -> None:
+        # given
+        content = ndjson({"title": "test"})
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            # when
+            anonymous = await client.post("/import/movies.ndjson", content=content)
+            admin_id = await login(client, "admin")
+            await login(client, "user")
+            with patch.object(config, "ADMIN_USER_IDS", [admin_id]):
+                forbidden = await client.post("/import/movies.ndjson", content=content)
+
+        # then
+        assert anonymous.status_code == status.HTTP_401_UNAUTHORIZED
+        assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+        assert await Movie.all().count() == 0
@@ -0,0 +1,42 @@
+import pytest
+from fastapi import HTTPException
+
+from app.services.jwt import JWTService, verified_token_cache
+
+
+def test_decode_token_caches_verified_token() -> None:
+    # given
+    jwt_service = JWTService()
+    token = jwt_service.create_access_token({"username": "testuser"})
+
+    # when
+    first = jwt_service.decode_token(token)
+    second = jwt_service.decode_token(token)
+
+    # then
+    assert first == second
+    assert first["username"] == "testuser"
+    assert verified_token_cache.hits == 1
+    assert verified_token_cache.misses == 1
+
+
+def test_decode_token_does_not_cache_invalid_token() -> None:
+    # when
+    with pytest.raises(HTTPException):
+        JWTService().decode_token("invalid")
+
+    # then
+    assert len(verified_token_cache) == 0
+
+
+def test_decode_token_does_not_cache_expired_token() -> None:
+    # given
+    jwt_service = JWTService()
+    token = jwt_service._create_token({"username": "testuser"}, expires_in=-1)
+
+    # when
+    with pytest.raises(HTTPException):
+        jwt_service.decode_token(token)
+
+    # then
+    assert len(verified_token_cache) == 0
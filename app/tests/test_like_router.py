@@ -0,0 +1,208 @@
+import asyncio
+from unittest.mock import ANY, patch
+
+import httpx
+from fastapi import status
+from tortoise.contrib.test import TestCase, TruncationTestCase
+
+from app.models.movies import Movie
+from app.models.users import GenderEnum, User
+from app.services.reaction_counter import reaction_counter
+from main import app
+
+
+class TestLikeRouter(TestCase):
+    async def test_api_like_movie(self) -> None:
+        # given
+        movie = await Movie.create(
+            title="test",
+            plot="test 중 입니다.",
+            cast=[{"name": "lee2", "role": "actor"}],
+            playtime=240,
+            genre="SF",
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            create_response = await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": "password123",
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": "password123"},
+            )
+
+            # when
+            response = await client.post(url=f"/likes/movies/{movie.id}/like")
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["user_id"] == create_response.json()
+        assert response_json["movie_id"] == movie.id
+        assert response_json["type"] == "like"
+
+    async def test_movie_reaction_counts_follow_reactions(self) -> None:
+        # given
+        movie = await Movie.create(
+            title="test",
+            plot="test 중 입니다.",
+            cast=[{"name": "lee2", "role": "actor"}],
+            playtime=240,
+            genre="SF",
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": "password123",
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": "password123"},
+            )
+
+            # when
+            await client.post(url=f"/likes/movies/{movie.id}/like")
+            await client.post(url=f"/likes/movies/{movie.id}/like")
+            await movie.refresh_from_db()
+            liked_count = (movie.like_count, movie.dislike_count)
+            await client.post(url=f"/likes/movies/{movie.id}/dislike")
+            await movie.refresh_from_db()
+            disliked_count = (movie.like_count, movie.dislike_count)
+            await client.post(url=f"/likes/movies/{movie.id}/like")
+            await (await User.get(username="testuser")).delete()
+            await movie.refresh_from_db()
+
+        # then
+        assert liked_count == (1, 0)
+        assert disliked_count == (0, 1)
+        assert (movie.like_count, movie.dislike_count) == (0, 0)
+
+    async def test_api_first_dislike_applies_one_counter_delta(self) -> None:
+        # given
+        movie = await Movie.create(
+            title="test",
+            plot="test 중 입니다.",
+            cast=[{"name": "lee2", "role": "actor"}],
+            playtime=240,
+            genre="SF",
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": "password123",
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": "password123"},
+            )
+
+            # when
+            with patch.object(
+                reaction_counter, "apply", wraps=reaction_counter.apply
+            ) as apply:
+                response = await client.post(url=f"/likes/movies/{movie.id}/dislike")
+            await movie.refresh_from_db()
+
+        # then
+        assert response.json()["type"] == "dislike"
+        apply.assert_awaited_once_with(movie.id, {"dislike_count": 1}, ANY)
+        assert (movie.like_count, movie.dislike_count) == (0, 1)
+
+    async def test_api_like_movie_when_movie_does_not_exist(self) -> None:
+        # given
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": "password123",
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": "password123"},
+            )
+
+            # when
+            response = await client.post(url="/likes/movies/999999/like")
+
+        # then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_api_like_movie_when_user_is_not_logged_in(self) -> None:
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(url="/likes/movies/1/like")
+
+        # then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestConcurrentReactions(TruncationTestCase):
+    # 트랜잭션 안에서 실행되는 TestCase 에서는 동시 요청의 트랜잭션이 같은 savepoint 를 공유하므로 truncation 으로 격리
+    async def test_concurrent_reaction_flips_change_counts_once(self) -> None:
+        # given
+        movie = await Movie.create(
+            title="test",
+            plot="test 중 입니다.",
+            cast=[{"name": "lee2", "role": "actor"}],
+            playtime=240,
+            genre="SF",
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": "password123",
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": "password123"},
+            )
+            await client.post(url=f"/likes/movies/{movie.id}/like")
+
+            # when
+            responses = await asyncio.gather(
+                *(
+                    client.post(url=f"/likes/movies/{movie.id}/dislike")
+                    for _ in range(3)
+                )
+            )
+            await movie.refresh_from_db()
+
+        # then
+        assert [response.json()["type"] for response in responses] == ["dislike"] * 3
+        assert (movie.like_count, movie.dislike_count) == (0, 1)
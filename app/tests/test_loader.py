@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from tortoise.contrib.test import TestCase
+
+from app.models.movies import Movie
+from app.utils.loader import DataLoader, ModelLoader
+
+
+class TestDataLoader(TestCase):
+    async def test_loads_in_same_tick_are_coalesced(self) -> None:
+        # given
+        batches: list[list[int]] = []
+
+        async def batch_load(keys: list[int]) -> dict[int, str]:
+            batches.append(keys)
+            return {key: f"value{key}" for key in keys if key != 3}
+
+        loader = DataLoader(batch_load)
+
+        # when
+        values = list(
+            await asyncio.gather(
+                loader.load(1), loader.load(2), loader.load(2), loader.load(3)
+            )
+        )
+        cached = await loader.load(1)
+        more = await loader.load_many([2, 4])
+
+        # then
+        assert values == ["value1", "value2", "value2", None]
+        assert cached == "value1"
+        assert more == ["value2", "value4"]
+        assert batches == [[1, 2, 3], [4]]
+
+    async def test_failed_batch_can_be_retried(self) -> None:
+        # given
+        calls = 0
+
+        async def batch_load(keys: list[int]) -> dict[int, int]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("db down")
+            return {key: key for key in keys}
+
+        loader = DataLoader(batch_load)
+
+        # when
+        with pytest.raises(RuntimeError):
+            await loader.load(1)
+        value = await loader.load(1)
+
+        # then
+        assert value == 1
+        assert calls == 2
+
+    async def test_cancelled_batch_cancels_pending_loads(self) -> None:
+        # given
+        calls = 0
+
+        async def batch_load(keys: list[int]) -> dict[int, int]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise asyncio.CancelledError
+            return {key: key for key in keys}
+
+        loader = DataLoader(batch_load)
+
+        # when
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(loader.load(1), timeout=1)
+        value = await loader.load(1)
+
+        # then
+        assert value == 1
+
+    async def test_model_loader_returns_instances_by_id(self) -> None:
+        # given
+        movies = [
+            await Movie.create(
+                title=f"test{i}", plot="test", cast=[], playtime=100, genre="SF"
+            )
+            for i in range(2)
+        ]
+        loader = ModelLoader(Movie)
+
+        # when
+        loaded = await loader.load_many([movies[1].id, 999_999, movies[0].id])
+
+        # then
+        assert [movie.title if movie else None for movie in loaded] == [
+            "test1",
+            None,
+            "test0",
+        ]
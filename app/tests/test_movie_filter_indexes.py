@@ -0,0 +1,50 @@
+from tortoise import Tortoise
+from tortoise.contrib.test import TestCase
+
+from app.routers.movies import filter_movies
+from app.schemas.movies import MovieSearchParams
+
+
+class TestMovieFilterIndexes(TestCase):
+    async def explain(self, params: MovieSearchParams) -> list[str]:
+        queryset = filter_movies(params)
+        if params.sort:
+            id_order = "-id" if params.sort.startswith("-") else "id"
+            queryset = queryset.order_by(params.sort, id_order)
+        sql = queryset.limit(21).sql(params_inline=True)
+        connection = Tortoise.get_connection("models")
+        rows = await connection.execute_query_dict(f"EXPLAIN QUERY PLAN {sql}")
+        return [row["detail"] for row in rows]
+
+    async def test_movie_filter_shapes_use_index(self) -> None:
+        # given
+        filter_shapes = [
+            MovieSearchParams(title="test"),
+            MovieSearchParams(genre="SF"),
+            MovieSearchParams(genres=["SF", "Action"]),
+            MovieSearchParams(playtime_min=90, playtime_max=120),
+            MovieSearchParams(created_after="2026-01-01T00:00:00"),
+            MovieSearchParams(sort="-like_count"),
+            MovieSearchParams(sort="-created_at"),
+            MovieSearchParams(sort="playtime"),
+            MovieSearchParams(genre="SF", sort="-like_count"),
+            MovieSearchParams(genres=["SF", "Action"], sort="-created_at"),
+            MovieSearchParams(genre="Comedy", playtime_min=90, playtime_max=120),
+            MovieSearchParams(playtime_max=100, sort="-like_count"),
+            MovieSearchParams(
+                created_after="2026-01-01T00:00:00",
+                created_before="2026-02-01T00:00:00",
+                sort="-created_at",
+            ),
+        ]
+
+        for params in filter_shapes:
+            # when
+            plan = await self.explain(params)
+
+            # then
+            movie_steps = [step for step in plan if "movies" in step]
+            assert movie_steps, plan
+            for step in movie_steps:
+                # 전체 테이블 스캔은 "SCAN movies" 로만 표시되고 인덱스 사용 시 "USING ... INDEX" 가 붙음
+                assert "INDEX" in step, (params, plan)
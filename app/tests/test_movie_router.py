@@ -2,6 +2,7 @@ import httpx
 from fastapi import status
 from tortoise.contrib.test import TestCase
 
+from app.models.likes import MovieReactionCounterShard
 from app.models.movies import Movie
 from main import app
 
@@ -104,6 +105,257 @@ class TestMovieRouter(TestCase):
         assert response_json[0]["genre"] == genre
         assert response_json[0]["playtime"] == playtime
 
+    async def test_api_get_movies_with_cursor_pagination(self) -> None:
+        # given
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            for i in range(3):
+                await client.post(
+                    "/movies",
+                    json={
+                        "title": f"test{i}",
+                        "plot": "test 중 입니다.",
+                        "cast": [{"name": "lee2", "role": "actor"}],
+                        "playtime": 240,
+                        "genre": "SF",
+                    },
+                )
+
+            # when
+            first_page = await client.get("/movies", params={"genre": "SF", "limit": 2})
+            second_page = await client.get(
+                "/movies",
+                params={
+                    "genre": "SF",
+                    "limit": 2,
+                    "cursor": first_page.json()["next_cursor"],
+                },
+            )
+
+        # then
+        assert first_page.status_code == status.HTTP_200_OK
+        movies = await Movie.filter(genre="SF").order_by("id")
+        items = first_page.json()["items"] + second_page.json()["items"]
+        assert [movie["id"] for movie in items] == [movie.id for movie in movies]
+        assert second_page.json()["next_cursor"] is None
+
+    async def test_api_get_movies_with_range_filters_and_sort(self) -> None:
+        # given
+        for title, playtime, genre, like_count in [
+            ("short", 80, "SF", 5),
+            ("medium", 110, "Action", 9),
+            ("long", 150, "SF", 1),
+            ("comedy", 100, "Comedy", 7),
+        ]:
+            await Movie.create(
+                title=title,
+                plot="test 중 입니다.",
+                cast=[],
+                playtime=playtime,
+                genre=genre,
+                like_count=like_count,
+            )
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            filtered = await client.get(
+                "/movies",
+                params={
+                    "genres": ["SF", "Action"],
+                    "playtime_min": 90,
+                    "sort": "-like_count",
+                    "fields": "title",
+                },
+            )
+            by_playtime = await client.get(
+                "/movies", params={"sort": "playtime", "fields": "title"}
+            )
+            invalid_range = await client.get(
+                "/movies", params={"playtime_min": 120, "playtime_max": 90}
+            )
+
+        # then
+        assert filtered.status_code == status.HTTP_200_OK
+        assert [movie["title"] for movie in filtered.json()] == ["medium", "long"]
+        assert [movie["title"] for movie in by_playtime.json()] == [
+            "short",
+            "comedy",
+            "medium",
+            "long",
+        ]
+        assert invalid_range.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_api_get_movies_sorted_by_popularity_with_cursor(self) -> None:
+        # given
+        for i, like_count in enumerate([3, 8, 3, 1, 8]):
+            await Movie.create(
+                title=f"test{i}",
+                plot="test 중 입니다.",
+                cast=[],
+                playtime=100,
+                genre="SF",
+                like_count=like_count,
+            )
+
+        # when
+        items = []
+        params: dict[str, str | int] = {"sort": "-like_count", "limit": 2}
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            while True:
+                page = (await client.get("/movies", params=params)).json()
+                items += page["items"]
+                if page["next_cursor"] is None:
+                    break
+                params["cursor"] = page["next_cursor"]
+
+        # then
+        movies = await Movie.filter().order_by("-like_count", "-id")
+        assert [movie["id"] for movie in items] == [movie.id for movie in movies]
+
+    async def test_api_get_movies_with_sparse_fields(self) -> None:
+        # given
+        await Movie.create(
+            title="test", plot="test 중 입니다.", cast=[], playtime=240, genre="SF"
+        )
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/movies", params={"fields": "title,genre"})
+            single_response = await client.get(
+                f"/movies/{response.json()[0]['id']}", params={"fields": "playtime"}
+            )
+            invalid_response = await client.get("/movies", params={"fields": "secret"})
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert list(response.json()[0]) == ["id", "title", "genre"]
+        assert single_response.json() == {
+            "id": response.json()[0]["id"],
+            "playtime": 240,
+        }
+        assert invalid_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "secret" in invalid_response.json()["detail"]
+
+    async def test_api_search_movies(self) -> None:
+        # given
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            for title, plot in [
+                ("기생충", "반지하 가족의 이야기"),
+                ("인터스텔라", "우주로 떠난 가족을 기다리는 이야기"),
+            ]:
+                await client.post(
+                    "/movies",
+                    json={
+                        "title": title,
+                        "plot": plot,
+                        "cast": [{"name": "송강호", "role": "actor"}],
+                        "playtime": 130,
+                        "genre": "SF",
+                    },
+                )
+            parasite = await Movie.get(title="기생충")
+            await client.patch(f"/movies/{parasite.id}", json={"title": "괴물"})
+
+            # when
+            response = await client.get("/movies/search", params={"q": "가족 우주"})
+            renamed_response = await client.get(
+                "/movies/search", params={"q": "기생충"}
+            )
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert [movie["title"] for movie in response.json()] == ["인터스텔라", "괴물"]
+        assert response.json()[0]["score"] > response.json()[1]["score"]
+        assert renamed_response.json() == []
+
+    async def test_api_get_movies_reaction_counts(self) -> None:
+        # given
+        movies = [
+            await Movie.create(
+                title=f"test{i}",
+                plot="test 중 입니다.",
+                cast=[],
+                playtime=100,
+                genre="SF",
+                like_count=i,
+                dislike_count=i * 2,
+            )
+            for i in range(3)
+        ]
+        await MovieReactionCounterShard.create(
+            movie_id=movies[2].id, shard=0, like_count=5, dislike_count=1
+        )
+        await MovieReactionCounterShard.create(
+            movie_id=movies[2].id, shard=1, like_count=5, dislike_count=0
+        )
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/movies/reaction_counts",
+                params={"ids": [movies[2].id, movies[0].id, 999_999, movies[2].id]},
+            )
+            single_response = await client.get(f"/movies/{movies[1].id}/reaction_count")
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"movie_id": movies[2].id, "like_count": 12, "dislike_count": 5},
+            {"movie_id": movies[0].id, "like_count": 0, "dislike_count": 0},
+        ]
+        assert single_response.json() == {
+            "movie_id": movies[1].id,
+            "like_count": 1,
+            "dislike_count": 2,
+        }
+
+    async def test_api_get_movies_batch(self) -> None:
+        # given
+        movies = [
+            await Movie.create(
+                title=f"test{i}",
+                plot="test 중 입니다.",
+                cast=[],
+                playtime=100,
+                genre="SF",
+            )
+            for i in range(3)
+        ]
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                "/movies/batch",
+                params={
+                    "ids": [movies[2].id, 999_999, movies[0].id, movies[2].id],
+                    "fields": "title",
+                },
+            )
+            too_many = await client.get(
+                "/movies/batch", params={"ids": list(range(1, 102))}
+            )
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"id": movies[2].id, "title": "test2"},
+            {"id": movies[0].id, "title": "test0"},
+        ]
+        assert too_many.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     async def test_api_get_movie(self) -> None:
         # given
         async with httpx.AsyncClient(
@@ -137,6 +389,117 @@ class TestMovieRouter(TestCase):
         assert response_json["playtime"] == playtime
         assert response_json["genre"] == genre
 
+    async def test_api_get_movie_with_conditional_request(self) -> None:
+        # given
+        movie = await Movie.create(
+            title="test", plot="test 중 입니다.", cast=[], playtime=240, genre="SF"
+        )
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first = await client.get(f"/movies/{movie.id}")
+            etag = first.headers["ETag"]
+
+            # when
+            revalidated = await client.get(
+                f"/movies/{movie.id}", headers={"If-None-Match": etag}
+            )
+            since = await client.get(
+                f"/movies/{movie.id}",
+                headers={"If-Modified-Since": first.headers["Last-Modified"]},
+            )
+            sparse = await client.get(
+                f"/movies/{movie.id}",
+                params={"fields": "title"},
+                headers={"If-None-Match": etag},
+            )
+            await client.patch(f"/movies/{movie.id}", json={"title": "changed"})
+            after_update = await client.get(
+                f"/movies/{movie.id}", headers={"If-None-Match": etag}
+            )
+
+        # then
+        assert first.status_code == status.HTTP_200_OK
+        assert not etag.startswith("W/")
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        assert revalidated.headers["ETag"] == etag
+        assert revalidated.content == b""
+        assert since.status_code == status.HTTP_304_NOT_MODIFIED
+        assert sparse.status_code == status.HTTP_200_OK
+        assert after_update.status_code == status.HTTP_200_OK
+        assert after_update.json()["title"] == "changed"
+        assert after_update.headers["ETag"] != etag
+
+    async def test_api_get_movies_with_conditional_request(self) -> None:
+        # given
+        movie = await Movie.create(
+            title="test", plot="test 중 입니다.", cast=[], playtime=240, genre="SF"
+        )
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first = await client.get("/movies", params={"limit": 10})
+            etag = first.headers["ETag"]
+
+            # when
+            revalidated = await client.get(
+                "/movies", params={"limit": 10}, headers={"If-None-Match": etag}
+            )
+            unpaginated = await client.get("/movies")
+            await Movie.create(
+                title="new", plot="test 중 입니다.", cast=[], playtime=100, genre="SF"
+            )
+            after_create = await client.get(
+                "/movies", params={"limit": 10}, headers={"If-None-Match": etag}
+            )
+            unpaginated_after_delete = await client.get(
+                "/movies", headers={"If-None-Match": unpaginated.headers["ETag"]}
+            )
+            await movie.delete()
+            after_delete = await client.get(
+                "/movies",
+                headers={"If-None-Match": unpaginated_after_delete.headers["ETag"]},
+            )
+
+        # then
+        assert etag.startswith("W/")
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        assert after_create.status_code == status.HTTP_200_OK
+        assert len(after_create.json()["items"]) == 2
+        assert unpaginated_after_delete.status_code == status.HTTP_200_OK
+        assert after_delete.status_code == status.HTTP_200_OK
+        assert len(after_delete.json()) == 1
+
+    async def test_api_get_full_last_page_is_modified_when_next_page_appears(
+        self,
+    ) -> None:
+        # given
+        await Movie.create(
+            title="test", plot="test 중 입니다.", cast=[], playtime=240, genre="SF"
+        )
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first = await client.get("/movies", params={"limit": 1})
+
+            # when
+            await Movie.create(
+                title="new", plot="test 중 입니다.", cast=[], playtime=100, genre="SF"
+            )
+            response = await client.get(
+                "/movies",
+                params={"limit": 1},
+                headers={"If-None-Match": first.headers["ETag"]},
+            )
+
+        # then
+        assert first.json()["next_cursor"] is None
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["next_cursor"] is not None
+
     async def test_api_get_movie_when_movie_id_is_invalid(self) -> None:
         # when
         async with httpx.AsyncClient(
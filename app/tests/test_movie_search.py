@@ -0,0 +1,86 @@
+from typing import Any
+
+from app.services.movie_search import MovieSearchIndex, tokenize
+
+
+def _movie(
+    movie_id: int, title: str, plot: str = "", cast: tuple[str, ...] = ()
+) -> dict[str, Any]:
+    return {
+        "id": movie_id,
+        "title": title,
+        "plot": plot,
+        "cast": [{"name": name, "role": "actor"} for name in cast],
+        "genre": "SF",
+        "playtime": 100,
+        "poster_image_url": None,
+    }
+
+
+def test_tokenize_splits_korean_into_bigrams_and_latin_into_words() -> None:
+    assert tokenize("어벤져스: Endgame 2019") == [
+        "어벤",
+        "벤져",
+        "져스",
+        "endgame",
+        "2019",
+    ]
+
+
+def test_tokenize_keeps_accented_latin_words() -> None:
+    # "é" 를 결합 문자로 적은 경우도 같은 토큰
+    assert tokenize("Amélie") == tokenize("Ame\u0301lie") == ["amélie"]
+
+
+def test_movie_search_index_ranks_title_matches_higher() -> None:
+    # given
+    index = MovieSearchIndex()
+    index.upsert(_movie(1, "우주 전쟁", plot="외계인이 지구를 침공한다"))
+    index.upsert(_movie(2, "평범한 하루", plot="우주 비행사가 꿈인 소년"))
+    index.upsert(_movie(3, "Space Cowboy", cast=("Tom Hanks",)))
+
+    # when
+    korean_results = index.search("우주", limit=10)
+    cast_results = index.search("hanks", limit=10)
+
+    # then
+    assert [movie["id"] for movie in korean_results] == [1, 2]
+    assert [movie["id"] for movie in cast_results] == [3]
+
+
+def test_movie_search_index_upsert_and_remove() -> None:
+    # given
+    index = MovieSearchIndex()
+    index.upsert(_movie(1, "Interstellar"))
+
+    # when
+    index.upsert(_movie(1, "Inception"))
+    index.upsert(_movie(2, "Interstellar"))
+    index.remove(2)
+
+    # then
+    assert index.search("interstellar", limit=10) == []
+    assert [movie["title"] for movie in index.search("inception", limit=10)] == [
+        "Inception"
+    ]
+    assert len(index) == 1
+
+
+def test_movie_search_index_matches_single_syllable_korean_query() -> None:
+    # given
+    index = MovieSearchIndex()
+    index.upsert(_movie(1, "뷔페", plot="호텔 뷔페에서 벌어지는 일"))
+    index.upsert(_movie(2, "콘서트", cast=("뷔",)))
+    index.upsert(_movie(3, "아멜리에", plot="몽마르트의 카페"))
+    index.upsert(_movie(4, "Amélie", cast=("Audrey Tautou",)))
+
+    # when
+    syllable_results = index.search("뷔", limit=10)
+    accented_results = index.search("amélie", limit=10)
+    index.remove(1)
+    removed_results = index.search("뷔", limit=10)
+
+    # then
+    assert {movie["id"] for movie in syllable_results} == {1, 2}
+    assert [movie["id"] for movie in accented_results] == [4]
+    assert [movie["id"] for movie in removed_results] == [2]
@@ -0,0 +1,27 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from main import app
+
+
+def test_websocket_notifications_when_token_is_missing() -> None:
+    # when
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with TestClient(app).websocket_connect("/notifications"):
+            pass
+
+    # then
+    assert exc_info.value.code == 4001
+
+
+def test_websocket_notifications_when_token_is_invalid() -> None:
+    # when
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with TestClient(app).websocket_connect(
+            "/notifications", headers={"Authorization": "Bearer invalid"}
+        ):
+            pass
+
+    # then
+    assert exc_info.value.code == 4001
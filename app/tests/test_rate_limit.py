@@ -0,0 +1,40 @@
+from tortoise.contrib.test import TestCase
+
+from app.utils.rate_limit import InMemoryRateLimitBackend
+
+
+class TestRateLimitBackend(TestCase):
+    async def test_acquire_allows_burst_up_to_capacity(self) -> None:
+        # given
+        backend = InMemoryRateLimitBackend()
+
+        # when
+        results = [
+            await backend.acquire("key", capacity=3, period=60) for _ in range(4)
+        ]
+
+        # then
+        assert results[:3] == [0.0, 0.0, 0.0]
+        assert 0 < results[3] <= 20
+
+    async def test_acquire_tracks_keys_separately(self) -> None:
+        # given
+        backend = InMemoryRateLimitBackend()
+        await backend.acquire("a", capacity=1, period=60)
+
+        # when
+        retry_after = await backend.acquire("b", capacity=1, period=60)
+
+        # then
+        assert retry_after == 0.0
+
+    async def test_sweep_removes_idle_keys(self) -> None:
+        # given
+        backend = InMemoryRateLimitBackend()
+        await backend.acquire("key", capacity=10, period=0.001)
+
+        # when
+        backend.sweep(now=backend._tats["key"] + 1)
+
+        # then
+        assert len(backend) == 0
@@ -0,0 +1,100 @@
+from typing import Any
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+import app.signals  # noqa: F401  리액션 카운터 시그널 등록
+from app.commands.fold_reaction_counters import fold_reaction_counters
+from app.configs import config
+from app.models.likes import (
+    MovieReaction,
+    MovieReactionCounterShard,
+    ReactionTypeEnum,
+)
+from app.models.movies import Movie
+from app.models.users import GenderEnum, User
+from app.services.reaction_counter import reaction_counter
+
+
+class TestReactionCounter(TestCase):
+    async def test_hot_movie_reactions_are_sharded_and_folded(self) -> None:
+        # given
+        hot_count = config.REACTION_COUNTER_HOT_THRESHOLD
+        movie = await Movie.create(
+            title="hot",
+            plot="test 중 입니다.",
+            cast=[],
+            playtime=100,
+            genre="SF",
+            like_count=hot_count,
+        )
+        users = [
+            await User.create(
+                username=f"user{i}", hashed_password="x", age=20, gender=GenderEnum.MALE
+            )
+            for i in range(5)
+        ]
+
+        # when
+        for user in users:
+            await MovieReaction.create(user_id=user.id, movie_id=movie.id)
+        reaction = await MovieReaction.get(user_id=users[0].id)
+        reaction.type = ReactionTypeEnum.DISLIKE
+        await reaction.save(update_fields=["type"])
+        await movie.refresh_from_db()
+        movie_row_count = movie.like_count
+        counts = await reaction_counter.get_counts([movie.id])
+        folded = await fold_reaction_counters()
+        folded_again = await fold_reaction_counters()
+        await movie.refresh_from_db()
+        await reaction_counter.apply(movie.id, {"like_count": 1}, None)
+
+        # then
+        # 인기 영화의 증감은 movies row 대신 shard row 에 쌓임
+        assert movie_row_count == hot_count
+        assert counts[movie.id] == {"like_count": hot_count + 4, "dislike_count": 1}
+        assert folded == 1
+        assert folded_again == 0
+        assert (movie.like_count, movie.dislike_count) == (hot_count + 4, 1)
+        # shard row 는 남겨두고 합친 값만큼 빼므로, 이후의 증감은 남아 있는 shard 에 다시 쌓임
+        shards = await MovieReactionCounterShard.filter(movie_id=movie.id).values(
+            "like_count", "dislike_count"
+        )
+        assert sum(shard["like_count"] for shard in shards) == 1
+        assert sum(shard["dislike_count"] for shard in shards) == 0
+        assert await reaction_counter.get_counts([movie.id]) == {
+            movie.id: {"like_count": hot_count + 5, "dislike_count": 1}
+        }
+
+    async def test_fold_between_shard_lookup_and_update_keeps_increment(self) -> None:
+        # given
+        hot_count = config.REACTION_COUNTER_HOT_THRESHOLD
+        movie = await Movie.create(
+            title="hot",
+            plot="test 중 입니다.",
+            cast=[],
+            playtime=100,
+            genre="SF",
+            like_count=hot_count,
+        )
+        get_or_create = MovieReactionCounterShard.get_or_create
+
+        async def get_or_create_then_fold(*args: Any, **kwargs: Any) -> Any:
+            # apply() 가 shard 를 조회한 직후 fold 가 실행되는 상황
+            result = await get_or_create(*args, **kwargs)
+            await fold_reaction_counters()
+            return result
+
+        with patch.object(config, "REACTION_COUNTER_SHARDS", 1):
+            await reaction_counter.apply(movie.id, {"like_count": 1}, None)
+
+            # when
+            with patch.object(
+                MovieReactionCounterShard, "get_or_create", get_or_create_then_fold
+            ):
+                await reaction_counter.apply(movie.id, {"like_count": 1}, None)
+
+        # then
+        assert await reaction_counter.get_counts([movie.id]) == {
+            movie.id: {"like_count": hot_count + 2, "dislike_count": 0}
+        }
@@ -0,0 +1,36 @@
+from tortoise.contrib.test import TestCase
+
+from app.commands.reconcile_follow_counts import reconcile_follow_counts
+from app.models.follows import Follow
+from app.models.users import GenderEnum, User
+
+
+class TestReconcileFollowCounts(TestCase):
+    async def test_reconcile_follow_counts_fixes_drifted_counters(self) -> None:
+        # given
+        users = [
+            await User.create(
+                username=f"user{i}", hashed_password="x", age=20, gender=GenderEnum.MALE
+            )
+            for i in range(3)
+        ]
+        await Follow.create(follower_id=users[0].id, following_id=users[2].id)
+        await Follow.create(follower_id=users[1].id, following_id=users[2].id)
+        await Follow.create(
+            follower_id=users[2].id, following_id=users[0].id, is_following=False
+        )
+        # 시그널을 거치지 않는 bulk update 로 카운터를 어긋나게 만듦
+        await User.all().update(follower_count=7, following_count=7)
+
+        # when
+        fixed = await reconcile_follow_counts(batch_size=2)
+
+        # then
+        assert fixed == 3
+        counts = (
+            await User.all()
+            .order_by("id")
+            .values_list("follower_count", "following_count")
+        )
+        assert counts == [(0, 1), (0, 1), (2, 0)]
+        assert await reconcile_follow_counts() == 0
@@ -0,0 +1,270 @@
+import asyncio
+
+import httpx
+from fastapi import Response, status
+from starlette.requests import Request
+from tortoise.contrib.test import TestCase
+
+from app.models.likes import MovieReaction, ReactionTypeEnum, ReviewLike
+from app.models.movies import Movie
+from app.models.reviews import Review
+from app.models.users import GenderEnum, User
+from app.services.response_cache import (
+    CachedResponse,
+    InMemoryResponseCacheBackend,
+    ResponseCache,
+    response_cache,
+)
+from main import app
+
+
+def make_request(path: str, query_string: str = "") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query_string.encode(),
+            "headers": [],
+        }
+    )
+
+
+class TestInMemoryResponseCacheBackend(TestCase):
+    async def test_evicts_least_recently_used_entries_over_byte_budget(self) -> None:
+        # given
+        body = b"x" * 1000
+        backend = InMemoryResponseCacheBackend(max_bytes=2600, max_entry_bytes=2000)
+        await backend.set("a", CachedResponse(body, None, None), ["t"], ttl=60)
+        await backend.set("b", CachedResponse(body, None, None), ["t"], ttl=60)
+        await backend.get("a")
+
+        # when
+        await backend.set("c", CachedResponse(body, None, None), ["t"], ttl=60)
+        await backend.set("big", CachedResponse(body * 3, None, None), ["t"], ttl=60)
+
+        # then
+        assert await backend.get("b") is None
+        assert await backend.get("a") is not None
+        assert await backend.get("c") is not None
+        assert await backend.get("big") is None
+        stats = backend.stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= backend.max_bytes
+
+    async def test_invalidate_removes_only_tagged_entries(self) -> None:
+        # given
+        backend = InMemoryResponseCacheBackend(max_bytes=10_000, max_entry_bytes=10_000)
+        await backend.set("a", CachedResponse(b"a", None, None), ["movie:1"], ttl=60)
+        await backend.set(
+            "b", CachedResponse(b"b", None, None), ["movie:1", "movies"], ttl=60
+        )
+        await backend.set("c", CachedResponse(b"c", None, None), ["movies"], ttl=60)
+        await backend.set("d", CachedResponse(b"d", None, None), ["movie:2"], ttl=0.01)
+
+        # when
+        await backend.invalidate(["movie:1"])
+        await asyncio.sleep(0.02)
+
+        # then
+        assert await backend.get("a") is None
+        assert await backend.get("b") is None
+        assert await backend.get("d") is None
+        assert await backend.get("c") is not None
+        stats = backend.stats()
+        assert stats["size"] == 1
+        assert stats["invalidations"] == 2
+        assert stats["hit_ratio"] == 1 / 4
+
+    async def test_response_built_during_invalidation_is_not_stored(self) -> None:
+        # given
+        cache = ResponseCache(
+            InMemoryResponseCacheBackend(max_bytes=10_000, max_entry_bytes=10_000),
+            ttl=60,
+        )
+
+        async def build() -> Response:
+            # 응답을 만드는 도중 다른 요청이 데이터를 수정한 상황
+            await cache.invalidate("movie:1")
+            return Response(content=b"{}", media_type="application/json")
+
+        # when
+        await cache.serve(make_request("/movies/1"), ["movie:1"], build)
+
+        # then
+        assert cache.stats()["size"] == 0
+
+    async def test_response_built_during_unrelated_invalidation_is_stored(
+        self,
+    ) -> None:
+        # given
+        cache = ResponseCache(
+            InMemoryResponseCacheBackend(max_bytes=10_000, max_entry_bytes=10_000),
+            ttl=60,
+        )
+
+        async def build() -> Response:
+            # 응답을 만드는 도중 다른 영화가 수정된 상황
+            await cache.invalidate("movie:2")
+            return Response(content=b"{}", media_type="application/json")
+
+        # when
+        await cache.serve(make_request("/movies/1"), ["movie:1"], build)
+
+        # then
+        assert cache.stats()["size"] == 1
+
+
+class TestResponseCacheRouter(TestCase):
+    async def _create_movie(self, title: str = "movie") -> Movie:
+        return await Movie.create(
+            title=title, plot="plot", cast=[], playtime=100, genre="SF"
+        )
+
+    async def test_api_get_movie_is_served_from_cache_until_updated(self) -> None:
+        # given
+        movie = await self._create_movie()
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first = await client.get(f"/movies/{movie.id}")
+
+            # when
+            second = await client.get(f"/movies/{movie.id}")
+            not_modified = await client.get(
+                f"/movies/{movie.id}", headers={"If-None-Match": first.headers["ETag"]}
+            )
+            await client.patch(f"/movies/{movie.id}", json={"title": "updated"})
+            after_update = await client.get(f"/movies/{movie.id}")
+
+        # then
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.content == first.content
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second.headers["Last-Modified"] == first.headers["Last-Modified"]
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert after_update.headers["X-Cache"] == "MISS"
+        assert after_update.json()["title"] == "updated"
+        assert response_cache.stats()["hits"] == 2
+
+    async def test_api_get_movies_cache_is_invalidated_by_movie_changes(self) -> None:
+        # given
+        movie = await self._create_movie("first")
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.get("/movies", params={"limit": 10, "fields": "id,title"})
+            cached = await client.get(
+                "/movies", params={"fields": "id,title", "limit": 10}
+            )
+
+            # when
+            await self._create_movie("second")
+            after_create = await client.get(
+                "/movies", params={"limit": 10, "fields": "id,title"}
+            )
+            await movie.delete()
+            after_delete = await client.get(
+                "/movies", params={"limit": 10, "fields": "id,title"}
+            )
+
+        # then
+        assert cached.headers["X-Cache"] == "HIT"
+        assert [item["title"] for item in after_create.json()["items"]] == [
+            "first",
+            "second",
+        ]
+        assert [item["title"] for item in after_delete.json()["items"]] == ["second"]
+
+    async def test_api_get_popular_movies_cache_is_invalidated_by_reactions(
+        self,
+    ) -> None:
+        # given
+        first = await self._create_movie("first")
+        second = await self._create_movie("second")
+        user = await User.create(
+            username="user", hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+        params = {"sort": "-like_count", "fields": "id"}
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            before = await client.get("/movies", params=params)
+            other_sort = await client.get("/movies", params={"fields": "id"})
+
+            # when
+            await MovieReaction.create(
+                user_id=user.id, movie_id=first.id, type=ReactionTypeEnum.LIKE
+            )
+            after = await client.get("/movies", params=params)
+            other_sort_after = await client.get("/movies", params={"fields": "id"})
+
+        # then
+        assert [item["id"] for item in before.json()] == [second.id, first.id]
+        assert [item["id"] for item in after.json()] == [first.id, second.id]
+        assert after.headers["X-Cache"] == "MISS"
+        assert other_sort.headers["X-Cache"] == "MISS"
+        assert other_sort_after.headers["X-Cache"] == "HIT"
+
+    async def test_api_review_caches_are_invalidated_by_review_changes(self) -> None:
+        # given
+        movie = await self._create_movie()
+        writer = await User.create(
+            username="writer", hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+        liker = await User.create(
+            username="liker", hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+        review = await Review.create(
+            user_id=writer.id, movie_id=movie.id, title="title", content="content"
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.get(f"/movies/{movie.id}/reviews")
+            await client.get(f"/reviews/{review.id}/like_count")
+            cached_like_count = await client.get(f"/reviews/{review.id}/like_count")
+
+            # when
+            await ReviewLike.create(user_id=liker.id, review_id=review.id)
+            like_count = await client.get(f"/reviews/{review.id}/like_count")
+            await Review.create(
+                user_id=liker.id, movie_id=movie.id, title="second", content="content"
+            )
+            reviews = await client.get(f"/movies/{movie.id}/reviews")
+            await liker.delete()
+            like_count_after_user_delete = await client.get(
+                f"/reviews/{review.id}/like_count"
+            )
+
+        # then
+        assert cached_like_count.headers["X-Cache"] == "HIT"
+        assert like_count.json() == {"review_id": review.id, "like_count": 1}
+        assert [item["title"] for item in reviews.json()] == ["title", "second"]
+        assert like_count_after_user_delete.json()["like_count"] == 0
+
+    async def test_api_review_like_caches_are_invalidated_by_movie_delete(
+        self,
+    ) -> None:
+        # given
+        movie = await self._create_movie()
+        user = await User.create(
+            username="writer", hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+        review = await Review.create(
+            user_id=user.id, movie_id=movie.id, title="title", content="content"
+        )
+        await ReviewLike.create(user_id=user.id, review_id=review.id)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.get(f"/reviews/{review.id}/like_count")
+
+            # when
+            await movie.delete()
+            like_count = await client.get(f"/reviews/{review.id}/like_count")
+
+        # then
+        assert like_count.headers["X-Cache"] == "MISS"
+        assert like_count.json()["like_count"] == 0
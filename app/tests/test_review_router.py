@@ -0,0 +1,96 @@
+import httpx
+from fastapi import status
+from tortoise.contrib.test import TestCase
+
+from app.models.movies import Movie
+from app.models.reviews import Review
+from app.models.users import GenderEnum
+from main import app
+
+
+class TestReviewRouter(TestCase):
+    async def _login(self, client: httpx.AsyncClient, username: str) -> int:
+        create_response = await client.post(
+            url="/users",
+            json={
+                "username": username,
+                "password": "password123",
+                "age": 20,
+                "gender": GenderEnum.MALE,
+            },
+        )
+        await client.post(
+            url="/users/login",
+            json={"username": username, "password": "password123"},
+        )
+        return int(create_response.json())
+
+    async def _create_movie(self) -> Movie:
+        return await Movie.create(
+            title="test",
+            plot="test 중 입니다.",
+            cast=[{"name": "lee2", "role": "actor"}],
+            playtime=240,
+            genre="SF",
+        )
+
+    async def test_api_create_review(self) -> None:
+        # given
+        movie = await self._create_movie()
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            user_id = await self._login(client, "testuser")
+
+            # when
+            response = await client.post(
+                url="/reviews",
+                data={
+                    "movie_id": str(movie.id),
+                    "title": (title := "재밌어요"),
+                    "content": (content := "또 보고 싶어요"),
+                },
+            )
+
+        # then
+        assert response.status_code == status.HTTP_201_CREATED
+        response_json = response.json()
+        assert response_json["user_id"] == user_id
+        assert response_json["movie_id"] == movie.id
+        assert response_json["title"] == title
+        assert response_json["content"] == content
+
+    async def test_api_create_review_when_user_is_not_logged_in(self) -> None:
+        # given
+        movie = await self._create_movie()
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                url="/reviews",
+                data={"movie_id": str(movie.id), "title": "title", "content": "c"},
+            )
+
+        # then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert await Review.filter(movie_id=movie.id).count() == 0
+
+    async def test_api_delete_review_when_user_is_not_owner(self) -> None:
+        # given
+        movie = await self._create_movie()
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            owner_id = await self._login(client, "owner")
+            review = await Review.create(
+                user_id=owner_id, movie_id=movie.id, title="title", content="c"
+            )
+            await self._login(client, "other")
+
+            # when
+            response = await client.delete(url=f"/reviews/{review.id}")
+
+        # then
+        assert response.status_code == status.HTTP_403_FORBIDDEN
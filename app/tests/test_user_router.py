@@ -1,9 +1,15 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
 import httpx
 from fastapi import status
 from tortoise.contrib.test import TestCase
 
+from app.configs import config
 from app.models.users import GenderEnum, User
+from app.services.auth import AuthenticatedUser
 from app.services.jwt import JWTService
+from app.services.user_cache import user_cache
 from main import app
 
 
@@ -98,6 +104,104 @@ class TestUserRouter(TestCase):
             assert response.status_code == status.HTTP_401_UNAUTHORIZED
             assert response.json()["detail"] == "Invalid credentials"
 
+    async def test_api_refresh_access_token(self) -> None:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            # given
+            await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": (password := "password123"),
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            login_response = await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": password},
+            )
+            refresh_token = login_response.cookies.get("refresh_token")
+
+            # when
+            response = await client.post(url="/users/token/refresh")
+            me_response = await client.get(url="/users/me")
+
+            # then
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+            assert response.cookies.get("access_token") is not None
+            assert response.cookies.get("refresh_token") not in (None, refresh_token)
+            assert me_response.status_code == status.HTTP_200_OK
+
+    async def test_api_refresh_access_token_when_refresh_token_is_reused(
+        self,
+    ) -> None:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            # given
+            await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": (password := "password123"),
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            login_response = await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": password},
+            )
+            refresh_token = login_response.cookies["refresh_token"]
+            await client.post(url="/users/token/refresh")
+
+            # when
+            client.cookies.set("refresh_token", refresh_token)
+            response = await client.post(url="/users/token/refresh")
+
+        # then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["detail"] == "Refresh token revoked"
+
+    async def test_api_get_user_when_refresh_token_is_used_as_access_token(
+        self,
+    ) -> None:
+        # given
+        refresh_token = JWTService().create_refresh_token({"username": "testuser"})
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            client.cookies.set("access_token", refresh_token)
+            response = await client.get(url="/users/me")
+
+        # then
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_api_login_user_when_rate_limit_exceeded(self) -> None:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            # given
+            for _ in range(config.LOGIN_RATE_LIMIT_PER_USERNAME):
+                await client.post(
+                    url="/users/login",
+                    json={"username": "invalid", "password": "password12123"},
+                )
+
+            # when
+            response = await client.post(
+                url="/users/login",
+                json={"username": "invalid", "password": "password12123"},
+            )
+
+        # then
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["Retry-After"]) > 0
+
     async def test_api_get_all_users(self) -> None:
         # given
         async with httpx.AsyncClient(
@@ -127,6 +231,62 @@ class TestUserRouter(TestCase):
         assert response_data[0]["age"] == created_users[0].age
         assert response_data[0]["gender"] == created_users[0].gender
 
+    async def test_api_get_all_users_with_cursor_pagination(self) -> None:
+        # given
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            for i in range(3):
+                await client.post(
+                    url="/users",
+                    json={
+                        "username": f"testuser{i}",
+                        "password": "password123",
+                        "age": 20 + i,
+                        "gender": GenderEnum.MALE,
+                    },
+                )
+
+            # when
+            first_page = await client.get(url="/users", params={"limit": 2})
+            second_page = await client.get(
+                url="/users",
+                params={"limit": 2, "cursor": first_page.json()["next_cursor"]},
+            )
+
+        # then
+        assert first_page.status_code == status.HTTP_200_OK
+        assert second_page.status_code == status.HTTP_200_OK
+        created_users = await User.filter().order_by("id")
+        first_items = first_page.json()["items"]
+        second_items = second_page.json()["items"]
+        assert [user["id"] for user in first_items + second_items] == [
+            user.id for user in created_users
+        ]
+        assert second_page.json()["next_cursor"] is None
+
+    async def test_api_get_all_users_when_cursor_is_invalid(self) -> None:
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(url="/users", params={"cursor": "invalid"})
+
+        # then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_api_get_all_users_when_limit_exceeds_max(self) -> None:
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                url="/users", params={"limit": config.PAGINATION_MAX_LIMIT + 1}
+            )
+
+        # then
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     async def test_api_get_all_users_when_user_not_found(self) -> None:
         # when
         async with httpx.AsyncClient(
@@ -169,6 +329,270 @@ class TestUserRouter(TestCase):
         assert user.age == response_data["age"]
         assert user.gender == response_data["gender"]
 
+    async def test_api_get_user_with_sparse_fields(self) -> None:
+        # given
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            user_id = (
+                await client.post(
+                    url="/users",
+                    json={
+                        "username": (username := "testuser"),
+                        "password": (password := "password123"),
+                        "age": 20,
+                        "gender": GenderEnum.MALE,
+                    },
+                )
+            ).json()
+            await client.post(
+                url="/users/login",
+                json={"username": username, "password": password},
+            )
+
+            # when
+            me_response = await client.get(url="/users/me", params={"fields": "age"})
+            list_response = await client.get(
+                url="/users", params={"fields": "username"}
+            )
+
+        # then
+        assert me_response.json() == {"id": user_id, "age": 20}
+        assert list_response.json() == [{"id": user_id, "username": username}]
+
+    async def test_api_get_user_uses_user_cache(self) -> None:
+        # given
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": (password := "password123"),
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": password},
+            )
+
+            # when
+            await client.get(url="/users/me")
+            hits_before = user_cache.stats()["hits"]
+            await client.get(url="/users/me")
+            await client.patch(url="/users/me", json={"age": (updated_age := 30)})
+            response = await client.get(url="/users/me")
+
+        # then
+        assert user_cache.stats()["hits"] > hits_before
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["age"] == updated_age
+
+    async def test_api_failed_update_does_not_change_cached_user(self) -> None:
+        # given
+        await User.create(
+            username="taken", hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            await client.post(
+                url="/users",
+                json={
+                    "username": "testuser",
+                    "password": (password := "password123"),
+                    "age": 20,
+                    "gender": GenderEnum.MALE,
+                },
+            )
+            await client.post(
+                url="/users/login",
+                json={"username": "testuser", "password": password},
+            )
+            await client.get(url="/users/me")
+
+            # when
+            failed = await client.patch(url="/users/me", json={"username": "taken"})
+            response = await client.get(url="/users/me")
+
+        # then
+        assert failed.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["username"] == "testuser"
+
+    async def test_user_cache_returns_copies(self) -> None:
+        # given
+        user = await User.create(
+            username="testuser", hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+        user_cache.set(user)
+
+        # when
+        user.age = 30
+        cached = user_cache.get("testuser")
+        assert cached is not None
+        cached.username = "changed"
+
+        # then
+        cached_again = user_cache.get("testuser")
+        assert cached_again is not None
+        assert cached_again.username == "testuser"
+        assert cached_again.age == 20
+
+    async def test_api_get_user_in_claims_only_mode(self) -> None:
+        with patch.object(config, "AUTH_CLAIMS_ONLY", True):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                # given
+                create_response = await client.post(
+                    url="/users",
+                    json={
+                        "username": (username := "testuser"),
+                        "password": (password := "password123"),
+                        "age": (age := 20),
+                        "gender": GenderEnum.MALE,
+                    },
+                )
+                user_id = create_response.json()
+                await client.post(
+                    url="/users/login",
+                    json={"username": username, "password": password},
+                )
+                # 시그널 없이 DB 에서 직접 삭제해도 claim 만으로 응답이 만들어지는지 확인
+                await User.filter(id=user_id).delete()
+
+                # when
+                response = await client.get(url="/users/me")
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        assert response_data["id"] == user_id
+        assert response_data["username"] == username
+        assert response_data["age"] == age
+
+    async def test_api_update_user_in_claims_only_mode_reissues_access_token(
+        self,
+    ) -> None:
+        with patch.object(config, "AUTH_CLAIMS_ONLY", True):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                # given
+                await client.post(
+                    url="/users",
+                    json={
+                        "username": "testuser",
+                        "password": (password := "password123"),
+                        "age": 20,
+                        "gender": GenderEnum.MALE,
+                    },
+                )
+                await client.post(
+                    url="/users/login",
+                    json={"username": "testuser", "password": password},
+                )
+
+                # when
+                update_response = await client.patch(
+                    url="/users/me", json={"age": (updated_age := 30)}
+                )
+                response = await client.get(url="/users/me")
+
+        # then
+        assert update_response.cookies.get("access_token") is not None
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["age"] == updated_age
+
+    async def test_api_old_token_in_claims_only_mode_resolves_user_by_id(
+        self,
+    ) -> None:
+        with patch.object(config, "AUTH_CLAIMS_ONLY", True):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                # given
+                create_response = await client.post(
+                    url="/users",
+                    json={
+                        "username": "testuser",
+                        "password": (password := "password123"),
+                        "age": 20,
+                        "gender": GenderEnum.MALE,
+                    },
+                )
+                user_id = create_response.json()
+                await client.post(
+                    url="/users/login",
+                    json={"username": "testuser", "password": password},
+                )
+                old_access_token = client.cookies["access_token"]
+                await client.patch(url="/users/me", json={"username": "renamed"})
+                other_response = await client.post(
+                    url="/users",
+                    json={
+                        "username": "testuser",
+                        "password": password,
+                        "age": 30,
+                        "gender": GenderEnum.FEMALE,
+                    },
+                )
+
+            # when
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://test",
+                cookies={"access_token": old_access_token},
+            ) as client:
+                response = await client.patch(url="/users/me", json={"age": 99})
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == user_id
+        assert (await User.get(id=user_id)).age == 99
+        assert (await User.get(id=other_response.json())).age == 30
+
+    async def test_api_follow_in_claims_only_mode_does_not_load_user(self) -> None:
+        # given
+        target = await User.create(
+            username="target", hashed_password="x", age=20, gender=GenderEnum.MALE
+        )
+        with patch.object(config, "AUTH_CLAIMS_ONLY", True):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                await client.post(
+                    url="/users",
+                    json={
+                        "username": "testuser",
+                        "password": (password := "password123"),
+                        "age": 20,
+                        "gender": GenderEnum.MALE,
+                    },
+                )
+                await client.post(
+                    url="/users/login",
+                    json={"username": "testuser", "password": password},
+                )
+
+                # when
+                with patch.object(
+                    AuthenticatedUser, "get_user", autospec=True
+                ) as get_user:
+                    follow_response = await client.post(f"/users/{target.id}/follow")
+                    status_response = await client.get(
+                        "/users/me/follow_status", params={"ids": [target.id]}
+                    )
+
+        # then
+        assert follow_response.status_code == status.HTTP_200_OK
+        assert status_response.json() == [{"user_id": target.id, "is_following": True}]
+        get_user.assert_not_called()
+
     async def test_api_get_user_when_token_has_invalid_value(self) -> None:
         async with httpx.AsyncClient(
             transport=httpx.ASGITransport(app=app), base_url="http://test"
@@ -328,3 +752,95 @@ class TestUserRouter(TestCase):
 
         # then
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_api_autocomplete_users(self) -> None:
+        # given
+        for username in ["testuser", "tester", "other"]:
+            await User.create(
+                username=username, hashed_password="x", age=20, gender=GenderEnum.MALE
+            )
+        renamed = await User.get(username="tester")
+        renamed.username = "renamed"
+        await renamed.save()
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                url="/users/autocomplete", params={"q": "TEST", "limit": 5}
+            )
+            empty_query_response = await client.get(
+                url="/users/autocomplete", params={"q": ""}
+            )
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert [user["username"] for user in response.json()] == ["testuser"]
+        assert empty_query_response.status_code == (
+            status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+
+    async def test_api_search_user_with_age_range_and_genders(self) -> None:
+        # given
+        for i, (age, gender) in enumerate(
+            [(19, GenderEnum.MALE), (25, GenderEnum.FEMALE), (30, GenderEnum.MALE)]
+        ):
+            await User.create(
+                username=f"user{i}", hashed_password="x", age=age, gender=gender
+            )
+
+        # when
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get(
+                url="/users/search",
+                params={
+                    "age_min": 20,
+                    "age_max": 30,
+                    "genders": ["male", "female"],
+                    "fields": "age",
+                },
+            )
+            invalid_range_response = await client.get(
+                url="/users/search", params={"age_min": 30, "age_max": 20}
+            )
+
+        # then
+        assert response.status_code == status.HTTP_200_OK
+        assert [user["age"] for user in response.json()] == [25, 30]
+        assert invalid_range_response.status_code == (
+            status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+
+    async def test_api_search_user_sorted_by_last_login_with_cursor(self) -> None:
+        # given
+        now = datetime.now()
+        last_logins = [None, now - timedelta(days=1), now, now - timedelta(days=1)]
+        for i, last_login in enumerate(last_logins):
+            await User.create(
+                username=f"user{i}",
+                hashed_password="x",
+                age=20,
+                gender=GenderEnum.MALE,
+                last_login=last_login,
+            )
+
+        # when
+        usernames = []
+        cursor = None
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            for _ in range(len(last_logins)):
+                params: dict[str, str | int] = {"sort": "-last_login", "limit": 1}
+                if cursor:
+                    params["cursor"] = cursor
+                page = (await client.get(url="/users/search", params=params)).json()
+                usernames += [user["username"] for user in page["items"]]
+                cursor = page["next_cursor"]
+
+        # then
+        assert usernames == ["user2", "user3", "user1", "user0"]
+        assert cursor is None
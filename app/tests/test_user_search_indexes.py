@@ -0,0 +1,40 @@
+from tortoise import Tortoise
+from tortoise.contrib.test import TestCase
+
+from app.routers.users import filter_users
+from app.schemas.users import UserSearchParams
+
+
+class TestUserSearchIndexes(TestCase):
+    async def explain(self, params: UserSearchParams) -> list[str]:
+        queryset = filter_users(params)
+        if params.sort:
+            id_order = "-id" if params.sort.startswith("-") else "id"
+            queryset = queryset.order_by(params.sort, id_order)
+        sql = queryset.limit(21).sql(params_inline=True)
+        connection = Tortoise.get_connection("models")
+        rows = await connection.execute_query_dict(f"EXPLAIN QUERY PLAN {sql}")
+        return [row["detail"] for row in rows]
+
+    async def test_user_search_filter_shapes_use_index(self) -> None:
+        # given
+        filter_shapes = [
+            UserSearchParams(age_min=20, age_max=30),
+            UserSearchParams(genders=["male", "female"]),
+            UserSearchParams(genders=["female"], age_min=20, age_max=30),
+            UserSearchParams(gender="male", age=20),
+            UserSearchParams(sort="created_at"),
+            UserSearchParams(sort="-last_login"),
+            UserSearchParams(age_min=20, sort="-created_at"),
+        ]
+
+        for params in filter_shapes:
+            # when
+            plan = await self.explain(params)
+
+            # then
+            user_steps = [step for step in plan if "users" in step]
+            assert user_steps, plan
+            for step in user_steps:
+                # 전체 테이블 스캔은 "SCAN users" 로만 표시되고 인덱스 사용 시 "USING ... INDEX" 가 붙음
+                assert "INDEX" in step, (params, plan)
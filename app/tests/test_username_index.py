@@ -0,0 +1,42 @@
+from app.services.username_index import UsernameIndex
+
+
+def test_username_index_search_returns_prefix_matches_in_order() -> None:
+    # given
+    index = UsernameIndex()
+    for user_id, username in enumerate(["Bob", "alice", "alex", "al", "carol"], 1):
+        index.upsert(user_id, username)
+
+    # when
+    results = index.search("AL", limit=2)
+
+    # then
+    assert results == [{"id": 4, "username": "al"}, {"id": 3, "username": "alex"}]
+
+
+def test_username_index_upsert_replaces_previous_username() -> None:
+    # given
+    index = UsernameIndex()
+    index.upsert(1, "alice")
+
+    # when
+    index.upsert(1, "bob")
+
+    # then
+    assert index.search("al", limit=10) == []
+    assert index.search("b", limit=10) == [{"id": 1, "username": "bob"}]
+    assert len(index) == 1
+
+
+def test_username_index_remove() -> None:
+    # given
+    index = UsernameIndex()
+    index.upsert(1, "alice")
+
+    # when
+    index.remove(1)
+    index.remove(1)
+
+    # then
+    assert index.search("a", limit=10) == []
+    assert len(index) == 0
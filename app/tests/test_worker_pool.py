@@ -0,0 +1,75 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException, status
+from tortoise.contrib.test import TestCase
+
+from app.utils.worker_pool import BoundedWorkerPool
+
+
+class TestBoundedWorkerPool(TestCase):
+    async def test_run_executes_function_off_the_event_loop(self) -> None:
+        # given
+        pool = BoundedWorkerPool(
+            max_workers=1, max_pending=0, thread_name_prefix="test"
+        )
+
+        # when
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+
+        # then
+        assert thread_name.startswith("test")
+        assert pool.in_flight == 0
+        pool.shutdown()
+
+    async def test_run_rejects_when_saturated(self) -> None:
+        # given
+        pool = BoundedWorkerPool(
+            max_workers=1, max_pending=0, thread_name_prefix="test"
+        )
+        release = threading.Event()
+        running = asyncio.create_task(pool.run(release.wait, 5))
+        await asyncio.sleep(0)
+
+        # when
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.run(lambda: None)
+
+        # then
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert exc_info.value.headers == {"Retry-After": "1"}
+        release.set()
+        await running
+        pool.shutdown()
+
+    async def test_cancelled_run_holds_slot_until_thread_finishes(self) -> None:
+        # given
+        pool = BoundedWorkerPool(
+            max_workers=1, max_pending=0, thread_name_prefix="test"
+        )
+        started, release = threading.Event(), threading.Event()
+
+        def work() -> None:
+            started.set()
+            release.wait(5)
+
+        running = asyncio.create_task(pool.run(work))
+        await asyncio.to_thread(started.wait, 5)
+
+        # when
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+
+        # then
+        with pytest.raises(HTTPException):
+            await pool.run(lambda: None)
+        release.set()
+        for _ in range(100):
+            if pool.in_flight == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.in_flight == 0
+        assert await pool.run(lambda: "done") == "done"
+        pool.shutdown()
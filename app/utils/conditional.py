@@ -0,0 +1,109 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+from tortoise.functions import Count, Max
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+# 목록의 버전을 확인할 때 조회하는 컬럼 - 전체 row 대신 id 와 updated_at 만 읽음
+VERSION_FIELDS = ("id", "updated_at")
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    """
+    버전 정보(parts)로 ETag 를 만듭니다.
+    같은 버전이면 응답 본문이 바이트 단위로 같은 단일 리소스는 strong ETag 를,
+    여러 row 의 버전으로 만든 목록은 weak ETag(W/ 접두사)를 사용합니다.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def page_version(
+    rows: list[dict[str, Any]], next_cursor: str | None
+) -> tuple[list[tuple[Any, ...]], str | None]:
+    """
+    VERSION_FIELDS 등으로 조회한 페이지 row 들을 순서를 포함한 버전 정보로 바꿉니다.
+    마지막 페이지가 가득 찬 뒤 row 가 추가되면 페이지의 row 는 그대로지만 next_cursor 가 생기므로 함께 포함합니다.
+    """
+    return [tuple(row.values()) for row in rows], next_cursor
+
+
+async def queryset_version(queryset: QuerySet[Any]) -> tuple[int, datetime | None]:
+    """
+    정렬/페이지네이션이 없는 목록의 버전입니다. row 수와 가장 최근 updated_at 을 집계 쿼리 하나로 조회합니다.
+    row 가 추가/수정되면 최근 updated_at 이, 삭제되면 row 수가 바뀝니다.
+    """
+    row = (
+        await queryset.annotate(count=Count("id"), last=Max("updated_at"))
+        .first()
+        .values("count", "last")
+    )
+    return (row["count"], row["last"]) if row else (0, None)
+
+
+async def get_version(
+    model: type[Model], pk: int, *fields: str
+) -> dict[str, Any] | None:
+    """단일 row 의 updated_at(과 fields) 만 조회합니다. row 가 없으면 None 을 반환합니다."""
+    return await model.filter(id=pk).first().values("updated_at", *fields)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match 는 weak 비교를 사용하므로 W/ 접두사를 무시하고 비교 (RFC 9110 13.1.2)
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """
+    요청의 If-None-Match / If-Modified-Since 를 확인하여 304 응답을 보내도 되는지 판단합니다.
+    If-None-Match 가 있으면 If-Modified-Since 는 무시합니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if last_modified is None or if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP-date 는 초 단위이므로 밀리초 이하를 버리고 비교
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(
+    etag: str, last_modified: datetime | None = None
+) -> dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: datetime | None = None) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
+
+
+def with_validators(
+    response: Response, etag: str, last_modified: datetime | None = None
+) -> Response:
+    response.headers.update(validator_headers(etag, last_modified))
+    return response
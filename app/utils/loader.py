@@ -0,0 +1,77 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from tortoise.models import Model
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+M = TypeVar("M", bound=Model)
+
+
+class DataLoader(Generic[K, V]):
+    """
+    같은 이벤트 루프 tick 안에서 요청된 key 를 모아 batch_load 한 번으로 조회합니다.
+
+    load() 는 key 를 대기열에 넣고 future 를 반환하며, 첫 key 가 들어올 때 loop.call_soon 으로
+    dispatch 를 예약합니다. 따라서 asyncio.gather 등으로 동시에 요청한 key 들은 한 번에 조회되고,
+    같은 key 는 future 를 공유하므로 loader 가 살아 있는 동안(요청 하나) 다시 조회하지 않습니다.
+    batch_load 는 key -> 값 dict 를 반환하며, 결과에 없는 key 는 None 으로 전달됩니다.
+    key 하나만 조회하는 곳에서는 묶을 key 가 없어 dispatch 예약과 task 전환 비용만 늘어나므로,
+    여러 key 를 동시에 조회하는 곳(GET /movies/batch 등)에서만 사용합니다.
+    """
+
+    def __init__(self, batch_load: Callable[[list[K]], Awaitable[dict[K, V]]]) -> None:
+        self._batch_load = batch_load
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+
+    def load(self, key: K) -> asyncio.Future[V | None]:
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+        if len(self._queue) == 1:
+            loop.call_soon(lambda: loop.create_task(self._dispatch()))
+        return future
+
+    async def load_many(self, keys: list[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    async def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        try:
+            values = await self._batch_load(keys)
+        except Exception as e:
+            # 실패한 key 는 캐시에서 제거하여 다음 load() 에서 다시 조회할 수 있도록 함
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # dispatch 가 취소되면 기다리던 load() 가 영원히 대기하지 않도록 future 도 함께 취소
+            for key in keys:
+                self._futures.pop(key).cancel()
+            raise
+        for key in keys:
+            future = self._futures[key]
+            # load() 를 기다리던 쪽이 취소되면 future 도 취소된 상태일 수 있음
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+class ModelLoader(DataLoader[int, M]):
+    """model 의 row 를 id 로 조회하는 DataLoader 입니다. 대기 중인 id 를 id__in 쿼리 하나로 조회합니다."""
+
+    def __init__(self, model: type[M]) -> None:
+        super().__init__(self._load_by_ids)
+        self.model = model
+
+    async def _load_by_ids(self, ids: list[int]) -> dict[int, M]:
+        return {
+            instance.pk: instance for instance in await self.model.filter(id__in=ids)
+        }
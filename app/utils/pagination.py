@@ -0,0 +1,181 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, TypeVar
+
+from fastapi import HTTPException
+from tortoise.expressions import Q
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+from app.configs import config
+from app.schemas.pagination import CursorParams
+
+M = TypeVar("M", bound=Model)
+SortValue = datetime | int | None
+
+
+def _encode_payload(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(encoded).decode().rstrip("=")
+
+
+def _decode_payload(cursor: str) -> Any:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_cursor(last_id: int) -> str:
+    """마지막으로 전달한 row 의 id 를 클라이언트가 해석할 필요 없는 불투명한 문자열로 인코딩합니다."""
+    return _encode_payload({"id": last_id})
+
+
+def decode_cursor(cursor: str) -> int:
+    payload = _decode_payload(cursor)
+    last_id = payload.get("id") if isinstance(payload, dict) else None
+    if not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return last_id
+
+
+def encode_sort_cursor(sort_value: SortValue, last_id: int) -> str:
+    """
+    정렬 컬럼 값과 id 를 함께 인코딩합니다. 정렬 값이 같은 row 는 id 로 순서를 정합니다.
+    datetime 은 ISO 8601 문자열로, 정수는 그대로 저장합니다.
+    """
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else sort_value
+    return _encode_payload({"v": value, "id": last_id})
+
+
+def decode_sort_cursor(cursor: str) -> tuple[SortValue, int]:
+    payload = _decode_payload(cursor)
+    if not isinstance(payload, dict) or not isinstance(payload.get("id"), int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    value = payload.get("v")
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return value, payload["id"]
+    try:
+        return datetime.fromisoformat(value), payload["id"]
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after_sort_cursor(
+    sort_field: str, sort_value: SortValue, last_id: int, descending: bool
+) -> Q:
+    """
+    (정렬 컬럼, id) 순서에서 cursor 다음 row 들을 가리키는 조건입니다.
+    NULL 은 오름차순에서 가장 앞, 내림차순에서 가장 뒤에 정렬되므로 (MySQL, sqlite 공통) 따로 처리합니다.
+    """
+    id_lookup = "id__lt" if descending else "id__gt"
+    is_null: dict[str, Any] = {f"{sort_field}__isnull": True}
+    not_null: dict[str, Any] = {f"{sort_field}__isnull": False}
+    if sort_value is None:
+        same_null: dict[str, Any] = {**is_null, id_lookup: last_id}
+        after_nulls = Q(**same_null)
+        # 오름차순이면 NULL 다음에 NULL 이 아닌 row 가 모두 이어짐
+        return after_nulls if descending else after_nulls | Q(**not_null)
+
+    after_value: dict[str, Any] = {
+        f"{sort_field}__{'lt' if descending else 'gt'}": sort_value
+    }
+    same_value: dict[str, Any] = {sort_field: sort_value, id_lookup: last_id}
+    condition = Q(**after_value) | Q(**same_value)
+    # 내림차순이면 NULL 이 아닌 row 다음에 NULL row 가 이어짐
+    return condition | Q(**is_null) if descending else condition
+
+
+async def paginate(
+    queryset: QuerySet[M], params: CursorParams
+) -> tuple[list[M], str | None]:
+    """
+    BaseModel.id 가 단조 증가한다는 점을 이용한 keyset 페이지네이션입니다.
+
+    OFFSET 대신 "id > 마지막 id" 조건과 primary key 정렬을 사용하므로
+    테이블 뒤쪽 페이지에서도 조회 비용이 페이지 크기에만 비례합니다.
+    다음 페이지가 있는지 확인하기 위해 limit + 1 개를 조회합니다.
+    """
+    limit = params.limit or config.PAGINATION_DEFAULT_LIMIT
+    if params.cursor is not None:
+        queryset = queryset.filter(id__gt=decode_cursor(params.cursor))
+
+    rows = await queryset.order_by("id").limit(limit + 1)
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(rows[limit - 1].pk)
+    return rows, None
+
+
+async def paginate_values(
+    queryset: QuerySet[M], params: CursorParams, fields: tuple[str, ...]
+) -> tuple[list[dict[str, Any]], str | None]:
+    """paginate 와 같지만 모델 인스턴스 대신 fields 컬럼만 dict 로 조회합니다. fields 에는 id 가 포함되어야 합니다."""
+    limit = params.limit or config.PAGINATION_DEFAULT_LIMIT
+    if params.cursor is not None:
+        queryset = queryset.filter(id__gt=decode_cursor(params.cursor))
+
+    rows = await queryset.order_by("id").limit(limit + 1).values(*fields)
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(rows[limit - 1]["id"])
+    return rows, None
+
+
+async def paginate_values_by(
+    queryset: QuerySet[M],
+    params: CursorParams,
+    fields: tuple[str, ...],
+    order_by: str,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    paginate_values 와 같지만 id 대신 order_by 컬럼("-" 접두사는 내림차순)으로 정렬합니다.
+
+    cursor 에 마지막 row 의 (정렬 컬럼 값, id) 를 담아 (정렬 컬럼, id) 복합 keyset 으로 조회하므로,
+    정렬 컬럼 인덱스를 그대로 따라 읽을 수 있습니다.
+    """
+    descending = order_by.startswith("-")
+    sort_field = order_by.lstrip("-")
+    limit = params.limit or config.PAGINATION_DEFAULT_LIMIT
+    if params.cursor is not None:
+        sort_value, last_id = decode_sort_cursor(params.cursor)
+        queryset = queryset.filter(
+            _after_sort_cursor(sort_field, sort_value, last_id, descending)
+        )
+
+    rows = (
+        await queryset.order_by(order_by, "-id" if descending else "id")
+        .limit(limit + 1)
+        .values(*dict.fromkeys([*fields, sort_field]))
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_sort_cursor(rows[-1][sort_field], rows[-1]["id"])
+    if sort_field not in fields:
+        for row in rows:
+            del row[sort_field]
+    return rows, next_cursor
+
+
+async def iter_value_batches(
+    queryset: QuerySet[M], fields: tuple[str, ...], batch_size: int
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    queryset 의 row 를 id 순서로 batch_size 개씩 keyset 방식으로 나누어 조회합니다.
+    fields 에 해당하는 컬럼만 dict 형태로 가져오며, 한 번에 한 batch 만 메모리에 올립니다.
+    """
+    last_id = 0
+    while True:
+        rows = await (
+            queryset.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .values("id", *fields)
+        )
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+        last_id = rows[-1]["id"]
@@ -0,0 +1,113 @@
+import math
+import time
+from abc import ABC, abstractmethod
+
+from fastapi import HTTPException, Request, status
+
+from app.configs import config
+
+
+class RateLimitBackend(ABC):
+    """
+    rate limit 상태를 저장하는 인터페이스입니다.
+    여러 워커가 한도를 공유해야 한다면 Redis 등 외부 저장소를 사용하는 구현체로 교체합니다.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str, capacity: int, period: float) -> float:
+        """
+        key 에 요청 1건을 기록합니다. period 초 동안 capacity 건까지 허용됩니다.
+        허용되면 0 을, 거부되면 다시 시도할 수 있을 때까지 남은 시간(초)을 반환합니다.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    GCRA(Generic Cell Rate Algorithm) 방식의 token bucket 을 프로세스 메모리에 저장합니다.
+
+    key 마다 "이론상 다음 요청 도착 시각(TAT)" float 하나만 보관하므로 메모리 사용량이 작습니다.
+    TAT 가 현재 시각보다 과거인 key 는 bucket 이 가득 찬 상태와 같으므로,
+    sweep_interval 초마다 이런 key 를 정리합니다.
+    """
+
+    def __init__(self, sweep_interval: float = 60.0) -> None:
+        self.sweep_interval = sweep_interval
+        self._tats: dict[str, float] = {}
+        self._next_sweep = time.monotonic() + sweep_interval
+
+    async def acquire(self, key: str, capacity: int, period: float) -> float:
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+        emission_interval = period / capacity
+        tat = max(self._tats.get(key, now), now) + emission_interval
+        allow_at = tat - period
+        if now < allow_at:
+            return allow_at - now
+
+        self._tats[key] = tat
+        return 0.0
+
+    def sweep(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._tats = {key: tat for key, tat in self._tats.items() if tat > now}
+        self._next_sweep = now + self.sweep_interval
+
+    def clear(self) -> None:
+        self._tats.clear()
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+class RateLimiter:
+    """
+    name 으로 구분되는 rate limit 규칙입니다. period 초 동안 key 별로 capacity 건까지 허용하고,
+    초과하면 Retry-After 헤더와 함께 429 응답을 발생시킵니다.
+    """
+
+    def __init__(
+        self, name: str, capacity: int, period: float, backend: RateLimitBackend
+    ) -> None:
+        self.name = name
+        self.capacity = capacity
+        self.period = period
+        self.backend = backend
+
+    async def hit(self, key: str) -> None:
+        retry_after = await self.backend.acquire(
+            f"{self.name}:{key}", self.capacity, self.period
+        )
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+
+def get_client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+rate_limit_backend = InMemoryRateLimitBackend()
+
+login_ip_rate_limiter = RateLimiter(
+    name="login:ip",
+    capacity=config.LOGIN_RATE_LIMIT_PER_IP,
+    period=config.RATE_LIMIT_PERIOD_SECONDS,
+    backend=rate_limit_backend,
+)
+login_username_rate_limiter = RateLimiter(
+    name="login:username",
+    capacity=config.LOGIN_RATE_LIMIT_PER_USERNAME,
+    period=config.RATE_LIMIT_PERIOD_SECONDS,
+    backend=rate_limit_backend,
+)
+signup_ip_rate_limiter = RateLimiter(
+    name="signup:ip",
+    capacity=config.SIGNUP_RATE_LIMIT_PER_IP,
+    period=config.RATE_LIMIT_PERIOD_SECONDS,
+    backend=rate_limit_backend,
+)
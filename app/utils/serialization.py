@@ -0,0 +1,56 @@
+from typing import Any
+
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from tortoise.models import Model
+
+
+def response_fields(schema: type[BaseModel]) -> tuple[str, ...]:
+    """응답 스키마의 필드 이름을 DB 에서 조회할 컬럼 목록으로 사용합니다."""
+    return tuple(schema.model_fields)
+
+
+def model_values(instance: Model, fields: tuple[str, ...]) -> dict[str, Any]:
+    """이미 조회한 모델 인스턴스에서 fields 만 골라 .values() 결과와 같은 형태의 dict 로 만듭니다."""
+    return {field: getattr(instance, field) for field in fields}
+
+
+def select_fields(raw_fields: str | None, schema: type[BaseModel]) -> tuple[str, ...]:
+    """
+    fields 쿼리 파라미터(쉼표로 구분된 필드 이름)를 검증하여 조회할 컬럼 목록을 반환합니다.
+
+    전달하지 않으면 응답 스키마의 전체 필드를, 전달하면 id 와 요청한 필드만 반환하며
+    응답 스키마에 없는 필드 이름이 포함되어 있으면 400 예외를 발생시킵니다.
+    """
+    allowed_fields = response_fields(schema)
+    if raw_fields is None:
+        return allowed_fields
+
+    requested_fields = [field.strip() for field in raw_fields.split(",")]
+    requested_fields = [field for field in requested_fields if field]
+    unknown_fields = [
+        field for field in requested_fields if field not in allowed_fields
+    ]
+    if unknown_fields:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown_fields)}. "
+            f"Available fields: {', '.join(allowed_fields)}",
+        )
+    return tuple(dict.fromkeys(["id", *requested_fields]))
+
+
+def list_response(
+    rows: list[dict[str, Any]], paginated: bool, next_cursor: str | None = None
+) -> ORJSONResponse:
+    """
+    .values() 로 조회한 row 를 그대로 orjson 으로 인코딩합니다.
+
+    row 는 이미 DB 스키마(= 응답 스키마)에 맞는 값이므로, 행마다 pydantic 모델을 만들고
+    FastAPI 가 response_model 로 다시 검증하는 과정을 생략합니다.
+    paginated 가 True 이면 CursorPage 와 같은 형태로 응답합니다.
+    """
+    if paginated:
+        return ORJSONResponse({"items": rows, "next_cursor": next_cursor})
+    return ORJSONResponse(rows)
@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ParamSpec, TypeVar
+
+from fastapi import HTTPException, status
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class BoundedWorkerPool:
+    """
+    CPU 를 많이 사용하는 동기 함수를 이벤트 루프 밖의 전용 스레드 풀에서 실행합니다.
+
+    실행 중이거나 대기 중인 작업 수가 max_workers + max_pending 에 도달하면
+    작업을 큐에 쌓지 않고 즉시 503 응답(Retry-After 포함)을 발생시킵니다.
+    이벤트 루프는 단일 스레드이므로 카운터를 별도의 lock 없이 관리합니다.
+    """
+
+    def __init__(
+        self, max_workers: int, max_pending: int, thread_name_prefix: str
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.thread_name_prefix,
+            )
+        return self._executor
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        if self._in_flight >= self.max_workers + self.max_pending:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy. Please try again later.",
+                headers={"Retry-After": "1"},
+            )
+
+        loop = asyncio.get_running_loop()
+        future = self._get_executor().submit(func, *args, **kwargs)
+        self._in_flight += 1
+        # 기다리던 요청이 취소되어도 이미 실행 중인 스레드 작업은 멈추지 않으므로,
+        # 작업이 실제로 끝날 때(또는 실행 전에 취소될 때) 자리를 반환해야 상한이 지켜짐
+        future.add_done_callback(lambda _: self._release(loop))
+        return await asyncio.wrap_future(future)
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        # done callback 은 작업 스레드에서 호출되므로 카운터는 이벤트 루프 스레드에서 감소
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._decrement)
+
+    def _decrement(self) -> None:
+        self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
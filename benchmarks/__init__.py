@@ -0,0 +1 @@
+# Benchmarks 패키지
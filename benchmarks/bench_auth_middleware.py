@@ -0,0 +1,78 @@
+"""
+AuthMiddleware 전/후 비교 벤치마크
+
+기존 BaseHTTPMiddleware 기반 구현과 현재 순수 ASGI 구현을 같은 trivial 라우트에
+붙여 초당 처리 요청 수(requests/sec)를 비교합니다. DB 를 사용하지 않는 공개 경로를
+호출하므로 미들웨어 자체의 오버헤드만 측정됩니다.
+
+사용법: python -m benchmarks.bench_auth_middleware [요청 수]
+"""
+
+import asyncio
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI, HTTPException
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.middleware.auth import AuthMiddleware
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """변경 전 구현과 동일한 경로 판별 로직 (인증 경로는 호출하지 않음)"""
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        try:
+            if request.url.path.startswith("/users"):
+                if request.url.path not in ["/users/login", "/users", "/users/search"]:
+                    raise HTTPException(status_code=401, detail="Access token required")
+            response: Response = await call_next(request)
+            return response
+        except HTTPException as e:
+            return JSONResponse({"detail": e.detail}, status_code=e.status_code)
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+    if legacy:
+        app.add_middleware(LegacyAuthMiddleware)
+    else:
+        app.add_middleware(AuthMiddleware)
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"ping": "pong"}
+
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        for _ in range(100):
+            await client.get("/ping")
+
+        started = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/ping")
+        elapsed = time.perf_counter() - started
+    return requests / elapsed
+
+
+async def main(requests: int) -> None:
+    before = await measure(build_app(legacy=True), requests)
+    after = await measure(build_app(legacy=False), requests)
+    print(f"requests: {requests}")
+    print(f"before (BaseHTTPMiddleware): {before:,.0f} req/s")
+    print(f"after  (pure ASGI)         : {after:,.0f} req/s")
+    print(f"speedup                    : {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,90 @@
+"""
+조건부 GET(ETag / 304) 전/후 비교 벤치마크
+
+출연진(cast JSON)이 큰 영화 데이터를 sqlite 메모리 DB 에 채운 뒤,
+- before: 캐시된 ETag 없이 매번 전체 응답을 받는 요청 (200)
+- after : 이전 응답의 ETag 를 If-None-Match 로 보내는 재검증 요청 (304, 버전 조회만 수행)
+의 요청당 지연시간과 응답 본문 크기를 단일 영화 조회와 목록(100건) 조회로 각각 비교합니다.
+
+사용법: python -m benchmarks.bench_conditional_get [영화 수] [반복 횟수]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+from tortoise import Tortoise
+
+from app.configs.database import TORTOISE_APP_MODELS
+from app.models.movies import Movie
+from app.routers.movies import movie_router
+
+
+async def measure(
+    client: httpx.AsyncClient, url: str, iterations: int, revalidate: bool
+) -> tuple[float, int]:
+    etag = (await client.get(url)).headers["ETag"]
+    headers = {"If-None-Match": etag} if revalidate else {}
+    latencies = []
+    size = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = await client.get(url, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == (304 if revalidate else 200)
+        size = len(response.content)
+    return statistics.median(latencies), size
+
+
+async def main(rows: int, iterations: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    await Movie.bulk_create(
+        [
+            Movie(
+                title=f"movie {i}",
+                plot="plot " * 200,
+                cast=[{"name": f"actor {i}-{j}", "role": "actor"} for j in range(50)],
+                playtime=100,
+                genre="SF",
+            )
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+    movie_id = (await Movie.all().order_by("id").first().values("id"))["id"]
+
+    app = FastAPI()
+    app.include_router(movie_router)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        results = {
+            url: (
+                await measure(client, url, iterations, revalidate=False),
+                await measure(client, url, iterations, revalidate=True),
+            )
+            for url in (f"/movies/{movie_id}", "/movies?limit=100")
+        }
+    await Tortoise.close_connections()
+
+    print(f"movies: {rows}, iterations: {iterations}")
+    for url, ((before_ms, before_size), (after_ms, after_size)) in results.items():
+        print(
+            f"{url:<20} before (200): median {before_ms:.2f} ms, {before_size} bytes"
+            f" / after (304): median {after_ms:.2f} ms, {after_size} bytes"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+        )
+    )
@@ -0,0 +1,110 @@
+"""
+"알 수도 있는 사람" 추천 전/후 비교 벤치마크
+
+sqlite 메모리 DB 에 팔로우 관계를 채운 뒤, 팔로잉이 많은 사용자 한 명에 대해
+- before: follows 테이블 self-join + GROUP BY 로 2-hop 공통 팔로우 수를 계산하는 SQL
+- after : 시작 시 만든 FollowGraph 스냅샷에서 계산하는 현재 방식
+의 요청당 지연시간과 스냅샷 메모리 크기를 비교합니다.
+
+사용법: python -m benchmarks.bench_follow_suggestions [팔로잉 수] [팔로잉당 팔로잉 수] [반복 횟수]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from tortoise import Tortoise
+
+from app.configs.database import TORTOISE_APP_MODELS
+from app.services.follow_graph import FollowGraph
+
+SUGGESTION_SQL = """
+SELECT f2.following_id, COUNT(*) AS mutual_count
+FROM follows f1
+JOIN follows f2 ON f2.follower_id = f1.following_id AND f2.is_following = 1
+WHERE f1.follower_id = ? AND f1.is_following = 1
+  AND f2.following_id != ?
+  AND f2.following_id NOT IN (
+    SELECT following_id FROM follows WHERE follower_id = ? AND is_following = 1
+  )
+GROUP BY f2.following_id
+ORDER BY mutual_count DESC, f2.following_id
+LIMIT 10
+"""
+
+
+async def seed(followings: int, fanout: int) -> int:
+    """사용자 1 이 followings 명을 팔로우하고, 그 사용자들이 각각 fanout 명을 팔로우하도록 채웁니다."""
+    users = followings * 10
+    connection = Tortoise.get_connection("default")
+    await connection.execute_many(
+        "INSERT INTO users (id, username, hashed_password, age, gender, "
+        "follower_count, following_count, created_at) "
+        "VALUES (?, ?, 'x', 20, 'male', 0, 0, CURRENT_TIMESTAMP)",
+        [[user_id, f"user{user_id}"] for user_id in range(1, users + 1)],
+    )
+    random.seed(0)
+    edges = {(1, following_id) for following_id in range(2, followings + 2)}
+    for follower_id in range(2, followings + 2):
+        for following_id in random.sample(range(2, users + 1), fanout):
+            if following_id != follower_id:
+                edges.add((follower_id, following_id))
+    await connection.execute_many(
+        "INSERT INTO follows (follower_id, following_id, is_following, created_at) "
+        "VALUES (?, ?, 1, CURRENT_TIMESTAMP)",
+        [list(edge) for edge in edges],
+    )
+    return len(edges)
+
+
+async def measure(run: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    await run()
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await run()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies)
+
+
+async def main(followings: int, fanout: int, iterations: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    edges = await seed(followings, fanout)
+    connection = Tortoise.get_connection("default")
+
+    graph = FollowGraph(compact_threshold=10_000)
+    started = time.perf_counter()
+    await graph.load()
+    load_ms = (time.perf_counter() - started) * 1000
+
+    async def before() -> Any:
+        return await connection.execute_query(SUGGESTION_SQL, [1, 1, 1])
+
+    async def after() -> Any:
+        return graph.suggestions(1, limit=10)
+
+    before_ms = await measure(before, iterations)
+    after_ms = await measure(after, iterations)
+    await Tortoise.close_connections()
+
+    snapshot_mib = graph._targets.itemsize * len(graph._targets) / 1024 / 1024
+    print(f"edges: {edges}, followings of user 1: {followings}, fanout: {fanout}")
+    print(f"snapshot load: {load_ms:.0f} ms, targets array {snapshot_mib:.1f} MiB")
+    print(f"before (SQL self-join): median {before_ms:.1f} ms")
+    print(f"after  (follow graph) : median {after_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+            int(sys.argv[3]) if len(sys.argv) > 3 else 10,
+        )
+    )
@@ -0,0 +1,50 @@
+"""
+검증된 JWT 캐시 전/후 비교 벤치마크
+
+브라우저가 같은 access_token 쿠키를 반복해서 보내는 상황을 가정하여,
+요청마다 JWTService 를 생성하고 서명을 검증하던 기존 방식과
+공용 JWTService + verified_token_cache 를 사용하는 현재 방식의 요청당 CPU 시간을 비교합니다.
+
+사용법: python -m benchmarks.bench_jwt_decode [반복 횟수]
+"""
+
+import sys
+import time
+from typing import Any, Callable
+
+import jwt
+
+from app.configs import config
+from app.services.jwt import JWTService, verified_token_cache
+
+
+def measure(decode: Callable[[], Any], iterations: int) -> float:
+    started = time.process_time()
+    for _ in range(iterations):
+        decode()
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+def main(iterations: int) -> None:
+    token = JWTService().create_access_token({"username": "benchmark"})
+
+    def before() -> Any:
+        jwt_service = JWTService()
+        return jwt.decode(token, config.SECRET_KEY, algorithms=[jwt_service.algorithm])
+
+    jwt_service = JWTService()
+    verified_token_cache.clear()
+
+    def after() -> Any:
+        return jwt_service.decode_token(token)
+
+    before_us = measure(before, iterations)
+    after_us = measure(after, iterations)
+    print(f"iterations: {iterations}")
+    print(f"before (verify every request): {before_us:.2f} us/request")
+    print(f"after  (verified token cache): {after_us:.2f} us/request")
+    print(f"cache stats                  : {verified_token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,93 @@
+"""
+리뷰 목록 화면의 영화 조회 전/후 비교 벤치마크
+
+sqlite 메모리 DB 에 영화 데이터를 채운 뒤, 리뷰 한 페이지(50건)에 필요한 영화 정보를
+- before: 리뷰마다 GET /movies/{movie_id} 요청 (50 요청, 50 쿼리)
+- after : GET /movies/batch?ids=... 요청 한 번 (DataLoader 가 id__in 쿼리 하나로 조회)
+으로 가져오는 지연시간을 비교합니다.
+
+사용법: python -m benchmarks.bench_movie_batch [영화 수] [반복 횟수]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+from fastapi import FastAPI
+from tortoise import Tortoise
+
+from app.configs.database import TORTOISE_APP_MODELS
+from app.models.movies import Movie
+from app.routers.movies import movie_router
+
+PAGE_SIZE = 50
+
+
+async def measure(
+    run: Callable[[list[int]], Awaitable[Any]], pages: list[list[int]]
+) -> float:
+    latencies = []
+    for movie_ids in pages:
+        started = time.perf_counter()
+        await run(movie_ids)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies)
+
+
+async def main(rows: int, iterations: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    await Movie.bulk_create(
+        [
+            Movie(
+                title=f"movie {i}",
+                plot="plot " * 40,
+                cast=[{"name": f"actor {i}", "role": "actor"}],
+                playtime=100,
+                genre="SF",
+            )
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+    random.seed(0)
+    movie_ids = [movie_id for (movie_id,) in await Movie.all().values_list("id")]
+    pages = [random.sample(movie_ids, PAGE_SIZE) for _ in range(iterations)]
+
+    app = FastAPI()
+    app.include_router(movie_router)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def before(ids: list[int]) -> Any:
+            return [
+                (await client.get(f"/movies/{movie_id}")).json() for movie_id in ids
+            ]
+
+        async def after(ids: list[int]) -> Any:
+            return (await client.get("/movies/batch", params={"ids": ids})).json()
+
+        assert await before(pages[0]) == await after(pages[0])
+        before_ms = await measure(before, pages)
+        after_ms = await measure(after, pages)
+
+    await Tortoise.close_connections()
+    print(f"movies: {rows}, page size: {PAGE_SIZE}, iterations: {iterations}")
+    print(f"before (GET /movies/{{id}} per review): median {before_ms:.2f} ms")
+    print(f"after  (GET /movies/batch)           : median {after_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        )
+    )
@@ -0,0 +1,140 @@
+"""
+GET /movies 필터/정렬 인덱스 전/후 비교 벤치마크
+
+sqlite 메모리 DB 에 영화 데이터를 채우고 ANALYZE 로 통계를 만든 뒤,
+filter_movies 가 만드는 필터/정렬 조합마다 첫 페이지(limit 21) 조회의
+- after : Movie.Meta.indexes 의 복합 인덱스가 있는 상태
+- before: 해당 인덱스를 모두 DROP 한 상태
+지연시간과 EXPLAIN QUERY PLAN 을 비교합니다.
+인덱스가 있는 상태에서 전체 테이블 스캔("SCAN movies")이 남아 있으면 표시합니다.
+
+사용법: python -m benchmarks.bench_movie_filters [영화 수] [반복 횟수]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from tortoise import Tortoise
+
+from app.configs.database import TORTOISE_APP_MODELS
+from app.models.movies import GenreEnum, Movie
+from app.routers.movies import filter_movies
+from app.schemas.movies import MovieSearchParams
+
+STARTED_AT = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+FILTER_SHAPES = [
+    MovieSearchParams(title="movie 777"),
+    MovieSearchParams(genre="SF"),
+    MovieSearchParams(genres=["SF", "Action"]),
+    MovieSearchParams(playtime_min=95, playtime_max=100),
+    MovieSearchParams(created_after="2024-12-01T00:00:00Z"),
+    MovieSearchParams(sort="-like_count"),
+    MovieSearchParams(sort="-created_at"),
+    MovieSearchParams(sort="playtime"),
+    MovieSearchParams(genre="SF", sort="-like_count"),
+    MovieSearchParams(genre="Horror", sort="-created_at"),
+    MovieSearchParams(genres=["SF", "Action"], sort="-like_count"),
+    MovieSearchParams(genre="Comedy", playtime_min=95, playtime_max=100),
+    MovieSearchParams(playtime_min=170, sort="-like_count"),
+    MovieSearchParams(
+        created_after="2024-12-01T00:00:00Z",
+        created_before="2025-01-01T00:00:00Z",
+        sort="-created_at",
+    ),
+]
+
+
+async def seed(rows: int) -> None:
+    random.seed(0)
+    genres = list(GenreEnum)
+    await Movie.bulk_create(
+        [
+            Movie(
+                title=f"movie {i}",
+                plot="plot",
+                cast=[],
+                playtime=random.randint(80, 180),
+                genre=random.choice(genres),
+                like_count=int(random.paretovariate(1.2)) - 1,
+                created_at=STARTED_AT + timedelta(minutes=i * 10),
+            )
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+
+
+def build_sql(params: MovieSearchParams) -> str:
+    queryset = filter_movies(params)
+    if params.sort:
+        id_order = "-id" if params.sort.startswith("-") else "id"
+        queryset = queryset.order_by(params.sort, id_order)
+    return queryset.limit(21).sql(params_inline=True)
+
+
+def describe(params: MovieSearchParams) -> str:
+    return ", ".join(
+        f"{key}={value}"
+        for key, value in params.model_dump(mode="json", exclude_none=True).items()
+    )
+
+
+async def measure(sql: str, iterations: int) -> tuple[float, list[str]]:
+    connection = Tortoise.get_connection("default")
+    plan = [
+        row["detail"]
+        for row in await connection.execute_query_dict(f"EXPLAIN QUERY PLAN {sql}")
+    ]
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await connection.execute_query_dict(sql)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies), plan
+
+
+async def main(rows: int, iterations: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    await seed(rows)
+    connection = Tortoise.get_connection("default")
+    await connection.execute_script("ANALYZE")
+
+    after = [await measure(build_sql(params), iterations) for params in FILTER_SHAPES]
+
+    indexes = await connection.execute_query_dict(
+        "SELECT name FROM sqlite_master WHERE type = 'index' "
+        "AND tbl_name = 'movies' AND name LIKE 'idx_%'"
+    )
+    for index in indexes:
+        await connection.execute_script(f"DROP INDEX {index['name']}")
+    before = [await measure(build_sql(params), iterations) for params in FILTER_SHAPES]
+    await Tortoise.close_connections()
+
+    print(f"movies: {rows}, iterations: {iterations}, dropped indexes: {len(indexes)}")
+    full_scans = 0
+    for params, (before_ms, _), (after_ms, plan) in zip(FILTER_SHAPES, before, after):
+        full_scan = any("movies" in step and "INDEX" not in step for step in plan)
+        full_scans += full_scan
+        print(
+            f"{describe(params):<60} before {before_ms:8.2f} ms"
+            f" / after {after_ms:6.2f} ms{'  FULL SCAN' if full_scan else ''}"
+        )
+        print(f"    plan: {' | '.join(plan)}")
+    print(f"full table scans with indexes: {full_scans}")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+        )
+    )
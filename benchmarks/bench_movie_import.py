@@ -0,0 +1,125 @@
+"""
+영화 대량 등록 전/후 비교 벤치마크
+
+같은 영화 데이터를 sqlite 메모리 DB 에 (검색 색인 갱신 포함)
+- before: 영화마다 POST /movies 를 호출 (row 마다 CreateMovieRequest 검증 + Movie.create)
+- after : NDJSON 파일 하나를 POST /import/movies.ndjson 로 전송 (batch 검증 + chunk 단위 bulk_create)
+로 등록하는 데 걸린 시간과 초당 처리 row 수, tracemalloc 기준 최대 메모리 할당량을 비교합니다.
+
+사용법: python -m benchmarks.bench_movie_import [영화 수] [chunk 크기]
+"""
+
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+import httpx
+from fastapi import FastAPI
+from tortoise import Tortoise
+
+# 두 경로 모두 검색 색인/응답 캐시를 갱신하도록 시그널 등록
+import app.signals  # noqa: F401
+from app.configs import config
+from app.configs.database import TORTOISE_APP_MODELS
+from app.models.movies import Movie
+from app.models.users import GenderEnum, User
+from app.routers.imports import import_router
+from app.routers.movies import movie_router
+from app.services.jwt import JWTService
+from app.services.movie_search import movie_search_index
+
+
+def movie_row(i: int) -> dict[str, object]:
+    return {
+        "title": f"movie {i}",
+        "plot": "plot " * 40,
+        "cast": [{"name": f"actor {i}-{j}", "role": "actor"} for j in range(5)],
+        "playtime": 90 + i % 60,
+        "genre": "SF",
+    }
+
+
+async def ndjson_stream(rows: int) -> AsyncIterator[bytes]:
+    # 파일 전체를 만들지 않고 64KiB 정도씩 전송
+    buffer = []
+    for i in range(rows):
+        buffer.append(json.dumps(movie_row(i)) + "\n")
+        if len(buffer) == 100:
+            yield "".join(buffer).encode()
+            buffer.clear()
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+async def import_one_by_one(client: httpx.AsyncClient, rows: int) -> None:
+    for i in range(rows):
+        response = await client.post("/movies", json=movie_row(i))
+        assert response.status_code == 201
+
+
+async def import_file(client: httpx.AsyncClient, rows: int, chunk_size: int) -> None:
+    response = await client.post(
+        "/import/movies.ndjson",
+        params={"chunk_size": chunk_size},
+        content=ndjson_stream(rows),
+    )
+    assert response.json()["imported"] == rows
+
+
+async def measure(label: str, rows: int, run: Callable[[], Awaitable[None]]) -> None:
+    await Movie.all().delete()
+    movie_search_index.clear()
+    started = time.perf_counter()
+    await run()
+    elapsed = time.perf_counter() - started
+    assert await Movie.all().count() == rows
+
+    # 지연시간에 영향을 주지 않도록 메모리 할당량은 다시 실행하여 측정
+    await Movie.all().delete()
+    movie_search_index.clear()
+    tracemalloc.start()
+    await run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label}: {elapsed:.2f} s, {rows / elapsed:,.0f} rows/s,"
+        f" peak alloc {peak / 1024 / 1024:.1f} MiB"
+    )
+
+
+async def main(rows: int, chunk_size: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    # 가져오기 API 는 관리자만 사용할 수 있으므로 관리자 access token 으로 요청
+    admin = await User.create(
+        username="admin", hashed_password="x", age=20, gender=GenderEnum.MALE
+    )
+    config.ADMIN_USER_IDS = [admin.id]
+    access_token = JWTService().create_access_token({"username": admin.username})
+
+    app = FastAPI()
+    app.include_router(movie_router)
+    app.include_router(import_router)
+    print(f"movies: {rows}, chunk size: {chunk_size}")
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        cookies={"access_token": access_token},
+    ) as client:
+        await measure("before", rows, lambda: import_one_by_one(client, rows))
+        await measure("after ", rows, lambda: import_file(client, rows, chunk_size))
+    await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 1000,
+        )
+    )
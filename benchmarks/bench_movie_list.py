@@ -0,0 +1,110 @@
+"""
+GET /movies 직렬화 경로 전/후 비교 벤치마크
+
+sqlite 메모리 DB 에 영화 데이터를 채운 뒤,
+- before: 모델 인스턴스를 모두 조회하고 행마다 MovieResponse 를 만든 뒤 FastAPI 가 다시 검증/직렬화하던 기존 경로
+- after : 현재 GET /movies 핸들러 (.values() 컬럼 조회 + orjson 인코딩)
+의 요청당 지연시간과 tracemalloc 기준 최대 메모리 할당량을 비교합니다.
+
+사용법: python -m benchmarks.bench_movie_list [영화 수] [반복 횟수]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+
+import httpx
+from fastapi import FastAPI
+from tortoise import Tortoise
+
+from app.configs.database import TORTOISE_APP_MODELS
+from app.models.movies import Movie
+from app.routers.movies import movie_router
+from app.schemas.movies import MovieResponse
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/before/movies")
+    async def get_movies_before() -> list[MovieResponse]:
+        movies = await Movie.filter().all()
+        return [
+            MovieResponse(
+                id=movie.id,
+                title=movie.title,
+                plot=movie.plot,
+                cast=movie.cast,
+                playtime=movie.playtime,
+                genre=movie.genre,
+                poster_image_url=movie.poster_image_url,
+            )
+            for movie in movies
+        ]
+
+    app.include_router(movie_router)
+    return app
+
+
+async def seed(rows: int) -> None:
+    await Movie.bulk_create(
+        [
+            Movie(
+                title=f"movie {i}",
+                plot="plot " * 40,
+                cast=[{"name": f"actor {i}-{j}", "role": "actor"} for j in range(5)],
+                playtime=90 + i % 60,
+                genre="SF",
+            )
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+
+
+async def measure(
+    client: httpx.AsyncClient, url: str, iterations: int
+) -> tuple[float, float]:
+    await client.get(url)
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = await client.get(url)
+        latencies.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200
+
+    tracemalloc.start()
+    await client.get(url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(latencies), peak / 1024 / 1024
+
+
+async def main(rows: int, iterations: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    await seed(rows)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=build_app()), base_url="http://bench"
+    ) as client:
+        before_ms, before_mb = await measure(client, "/before/movies", iterations)
+        after_ms, after_mb = await measure(client, "/movies", iterations)
+
+    await Tortoise.close_connections()
+    print(f"movies: {rows}, iterations: {iterations}")
+    print(f"before: median {before_ms:.1f} ms, peak alloc {before_mb:.1f} MiB")
+    print(f"after : median {after_ms:.1f} ms, peak alloc {after_mb:.1f} MiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+        )
+    )
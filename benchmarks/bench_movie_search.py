@@ -0,0 +1,135 @@
+"""
+영화 전문 검색 벤치마크
+
+sqlite 메모리 DB 에 영화 데이터를 채운 뒤,
+- before: 제목/줄거리 LIKE '%검색어%' 로 일치하는 영화를 모두 읽고 등장 횟수로 순위를 매기는 검색
+- after : 시작 시 만든 MovieSearchIndex 의 BM25 검색 (DB 조회 없음)
+의 요청당 지연시간과 색인 생성 시간을 비교합니다.
+단어 빈도가 Zipf 분포를 따르는 가상의 어휘로 제목과 줄거리를 만듭니다.
+
+사용법: python -m benchmarks.bench_movie_search [영화 수] [반복 횟수]
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from tortoise import Tortoise
+from tortoise.expressions import Q
+
+from app.configs.database import TORTOISE_APP_MODELS
+from app.models.movies import Movie
+from app.services.movie_search import MovieSearchIndex
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def build_vocabulary(size: int) -> list[str]:
+    """한글 2~3음절 단어와 라틴 문자 단어를 섞은 가상의 어휘"""
+    words: set[str] = set()
+    while len(words) < size:
+        if random.random() < 0.5:
+            words.add("".join(random.choices(SYLLABLES, k=random.randint(2, 3))))
+        else:
+            words.add("".join(random.choices(LETTERS, k=random.randint(3, 8))))
+    return sorted(words)
+
+
+random.seed(0)
+VOCABULARY = build_vocabulary(20_000)
+# 실제 문서처럼 단어 빈도가 Zipf 분포를 따르도록 누적 가중치를 만듦
+CUMULATIVE_WEIGHTS = list(
+    itertools.accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1))
+)
+# 흔한 단어 / 중간 빈도 단어 / 드문 단어를 섞은 검색어
+QUERIES = [
+    f"{VOCABULARY[0]} {VOCABULARY[1]}",
+    f"{VOCABULARY[2]} {VOCABULARY[500]}",
+    f"{VOCABULARY[50]} {VOCABULARY[3000]}",
+    f"{VOCABULARY[10]} {VOCABULARY[200]} {VOCABULARY[8000]}",
+    VOCABULARY[15000],
+]
+
+
+def random_text(words: int) -> str:
+    return " ".join(random.choices(VOCABULARY, cum_weights=CUMULATIVE_WEIGHTS, k=words))
+
+
+async def seed(rows: int) -> None:
+    await Movie.bulk_create(
+        [
+            Movie(
+                title=random_text(3),
+                plot=random_text(40),
+                cast=[{"name": f"actor{random.randrange(5000)}", "role": "actor"}],
+                playtime=90 + i % 60,
+                genre="SF",
+            )
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+
+
+async def measure(run: Callable[[str], Awaitable[Any]], iterations: int) -> float:
+    latencies = []
+    for _ in range(iterations):
+        for query in QUERIES:
+            started = time.perf_counter()
+            await run(query)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies)
+
+
+async def main(rows: int, iterations: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    await seed(rows)
+
+    index = MovieSearchIndex()
+    started = time.perf_counter()
+    await index.load()
+    load_ms = (time.perf_counter() - started) * 1000
+
+    async def before(query: str) -> Any:
+        # LIKE 로 일치하는 영화를 모두 읽은 뒤 등장 횟수로 순위를 매김
+        words = query.split()
+        condition = Q()
+        for word in words:
+            condition |= Q(title__icontains=word) | Q(plot__icontains=word)
+        rows = await Movie.filter(condition).values("id", "title", "plot")
+        return heapq.nlargest(
+            20,
+            rows,
+            key=lambda row: sum(
+                (row["title"] + " " + row["plot"]).count(word) for word in words
+            ),
+        )
+
+    async def after(query: str) -> Any:
+        return index.search(query, limit=20)
+
+    before_ms = await measure(before, iterations)
+    after_ms = await measure(after, iterations)
+    await Tortoise.close_connections()
+
+    print(f"movies: {rows}, terms: {len(index._postings)}, load: {load_ms:.0f} ms")
+    print(f"before (LIKE scan + count rank): median {before_ms:.2f} ms")
+    print(f"after  (BM25 inverted index): median {after_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+        )
+    )
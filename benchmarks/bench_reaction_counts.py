@@ -0,0 +1,127 @@
+"""
+영화 그리드 리액션 개수 조회 전/후 비교 벤치마크
+
+sqlite 메모리 DB 에 영화, 사용자, 리액션을 채운 뒤 한 페이지(50편)의 좋아요/싫어요 수를
+- before: 영화마다 movie_reactions 에 COUNT 쿼리 2번 (기존 /movies/{id}/reaction_count 방식, 100 쿼리)
+- after : GET /movies/reaction_counts 가 사용하는 비정규화 카운터 + shard 합계 집계 쿼리 1번
+으로 조회하는 지연시간을 비교합니다.
+
+사용법: python -m benchmarks.bench_reaction_counts [영화 수] [반복 횟수]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from tortoise import Tortoise
+
+from app.configs.database import TORTOISE_APP_MODELS
+from app.models.likes import MovieReaction, ReactionTypeEnum
+from app.models.movies import Movie
+from app.models.users import GenderEnum, User
+from app.services.reaction_counter import reaction_counter
+
+PAGE_SIZE = 50
+USERS = 2000
+
+
+async def seed(rows: int) -> None:
+    random.seed(0)
+    await Movie.bulk_create(
+        [
+            Movie(title=f"movie {i}", plot="plot", cast=[], playtime=100, genre="SF")
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+    await User.bulk_create(
+        [
+            User(
+                username=f"user{i}", hashed_password="x", age=20, gender=GenderEnum.MALE
+            )
+            for i in range(USERS)
+        ],
+        batch_size=1000,
+    )
+    movie_ids = [movie_id for (movie_id,) in await Movie.all().values_list("id")]
+    user_ids = [user_id for (user_id,) in await User.all().values_list("id")]
+    reactions = [
+        MovieReaction(
+            user_id=user_id,
+            movie_id=movie_id,
+            type=random.choice(list(ReactionTypeEnum)),
+        )
+        for user_id in user_ids
+        for movie_id in random.sample(movie_ids, 50)
+    ]
+    await MovieReaction.bulk_create(reactions, batch_size=1000)
+    # bulk_create 는 시그널을 거치지 않으므로 비정규화 카운터를 직접 채움
+    for movie_id in movie_ids:
+        await Movie.filter(id=movie_id).update(
+            like_count=await MovieReaction.filter(
+                movie_id=movie_id, type=ReactionTypeEnum.LIKE
+            ).count(),
+            dislike_count=await MovieReaction.filter(
+                movie_id=movie_id, type=ReactionTypeEnum.DISLIKE
+            ).count(),
+        )
+
+
+async def measure(
+    run: Callable[[list[int]], Awaitable[Any]], pages: list[list[int]]
+) -> float:
+    latencies = []
+    for movie_ids in pages:
+        started = time.perf_counter()
+        await run(movie_ids)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies)
+
+
+async def main(rows: int, iterations: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    await seed(rows)
+
+    movie_ids = [movie_id for (movie_id,) in await Movie.all().values_list("id")]
+    pages = [random.sample(movie_ids, PAGE_SIZE) for _ in range(iterations)]
+
+    async def before(ids: list[int]) -> Any:
+        return {
+            movie_id: {
+                "like_count": await MovieReaction.filter(
+                    movie_id=movie_id, type=ReactionTypeEnum.LIKE
+                ).count(),
+                "dislike_count": await MovieReaction.filter(
+                    movie_id=movie_id, type=ReactionTypeEnum.DISLIKE
+                ).count(),
+            }
+            for movie_id in ids
+        }
+
+    async def after(ids: list[int]) -> Any:
+        return await reaction_counter.get_counts(ids)
+
+    assert await before(pages[0]) == await after(pages[0])
+    before_ms = await measure(before, pages)
+    after_ms = await measure(after, pages)
+    reactions = await MovieReaction.all().count()
+    await Tortoise.close_connections()
+
+    print(f"movies: {rows}, reactions: {reactions}, page size: {PAGE_SIZE}")
+    print(f"before (2 COUNT queries per movie): median {before_ms:.2f} ms")
+    print(f"after  (1 aggregate query)        : median {after_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        )
+    )
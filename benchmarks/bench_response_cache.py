@@ -0,0 +1,131 @@
+"""
+응답 캐시 전/후 비교 벤치마크
+
+출연진(cast JSON)이 큰 영화와 리뷰, 리뷰 좋아요를 sqlite 메모리 DB 에 채운 뒤,
+- before: 요청마다 캐시를 비워 DB 를 조회하고 응답을 만드는 경로
+- after : 캐시에 저장된 응답 body 를 그대로 반환하는 경로
+의 요청당 지연시간을 캐싱 대상 엔드포인트별로 비교합니다.
+
+사용법: python -m benchmarks.bench_response_cache [영화 수] [반복 횟수]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+from tortoise import Tortoise
+
+from app.configs.database import TORTOISE_APP_MODELS
+from app.models.likes import ReviewLike
+from app.models.movies import Movie
+from app.models.reviews import Review
+from app.models.users import GenderEnum, User
+from app.routers.movies import movie_router
+from app.routers.reviews import review_router
+from app.services.response_cache import response_cache, response_cache_backend
+
+
+async def seed(rows: int) -> tuple[int, int]:
+    await Movie.bulk_create(
+        [
+            Movie(
+                title=f"movie {i}",
+                plot="plot " * 200,
+                cast=[{"name": f"actor {i}-{j}", "role": "actor"} for j in range(50)],
+                playtime=100,
+                genre="SF",
+            )
+            for i in range(rows)
+        ],
+        batch_size=1000,
+    )
+    await User.bulk_create(
+        [
+            User(
+                username=f"user{i}",
+                hashed_password="x",
+                age=20,
+                gender=GenderEnum.MALE,
+            )
+            for i in range(200)
+        ]
+    )
+    movie_id = (await Movie.all().order_by("id").first().values("id"))["id"]
+    user_ids = [user_id for (user_id,) in await User.all().values_list("id")]
+    await Review.bulk_create(
+        [
+            Review(user_id=user_id, movie_id=movie_id, title="title", content="content")
+            for user_id in user_ids
+        ]
+    )
+    review_id = (await Review.all().order_by("id").first().values("id"))["id"]
+    await ReviewLike.bulk_create(
+        [ReviewLike(user_id=user_id, review_id=review_id) for user_id in user_ids]
+    )
+    return movie_id, review_id
+
+
+async def measure(
+    client: httpx.AsyncClient, url: str, iterations: int, cached: bool
+) -> float:
+    await client.get(url)
+    latencies = []
+    for _ in range(iterations):
+        if not cached:
+            response_cache_backend.clear()
+        started = time.perf_counter()
+        response = await client.get(url)
+        latencies.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == ("HIT" if cached else "MISS")
+    return statistics.median(latencies)
+
+
+async def main(rows: int, iterations: int) -> None:
+    await Tortoise.init(
+        db_url="sqlite://:memory:", modules={"models": TORTOISE_APP_MODELS}
+    )
+    await Tortoise.generate_schemas()
+    movie_id, review_id = await seed(rows)
+
+    app = FastAPI()
+    app.include_router(movie_router)
+    app.include_router(review_router)
+    urls = (
+        f"/movies/{movie_id}",
+        "/movies?limit=100",
+        "/movies?limit=100&sort=-like_count",
+        f"/movies/{movie_id}/reviews?limit=100",
+        f"/reviews/{review_id}/like_count",
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        results = {
+            url: (
+                await measure(client, url, iterations, cached=False),
+                await measure(client, url, iterations, cached=True),
+            )
+            for url in urls
+        }
+    await Tortoise.close_connections()
+
+    print(f"movies: {rows}, iterations: {iterations}")
+    for url, (before_ms, after_ms) in results.items():
+        print(
+            f"{url:<36} before: median {before_ms:.2f} ms"
+            f" / after: median {after_ms:.2f} ms"
+        )
+    print(f"cache stats: {response_cache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+        )
+    )
@@ -8,6 +8,15 @@ from tortoise.backends.base.config_generator import generate_config
 from tortoise.contrib.test import finalizer, initializer
 
 from app.configs.database import TORTOISE_APP_MODELS
+from app.services.feed import feed_store
+from app.services.follow_graph import follow_graph
+from app.services.jwt import verified_token_cache
+from app.services.movie_search import movie_search_index
+from app.services.response_cache import response_cache_backend
+from app.services.token_store import refresh_token_store
+from app.services.user_cache import user_cache
+from app.services.username_index import username_index
+from app.utils.rate_limit import rate_limit_backend
 
 TEST_BASE_URL = "http://test"
 TEST_DB_LABEL = "models"
@@ -39,3 +48,17 @@ def initialize(request: FixtureRequest) -> Generator[None, None, None]:
 @pytest.fixture(scope="session", autouse=True)
 def event_loop() -> None:
     pass
+
+
+@pytest.fixture(autouse=True)
+def reset_in_memory_state() -> None:
+    # 테스트마다 DB 는 롤백되지만 프로세스 내 캐시는 남아있으므로 초기화
+    user_cache.clear()
+    username_index.clear()
+    follow_graph.clear()
+    feed_store.clear()
+    movie_search_index.clear()
+    verified_token_cache.clear()
+    refresh_token_store.clear()
+    rate_limit_backend.clear()
+    response_cache_backend.clear()
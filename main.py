@@ -2,11 +2,17 @@ from fastapi import FastAPI
 
 from app.configs.database import initialize_tortoise
 from app.middleware.auth import AuthMiddleware
+from app.routers.exports import export_router
+from app.routers.imports import import_router
 from app.routers.movies import movie_router
 from app.routers.users import user_router
 from app.routers.reviews import review_router
 from app.routers.likes import like_router
 from app.routers.notifications import notification_router
+from app.services.auth import password_hash_pool
+from app.services.follow_graph import follow_graph
+from app.services.movie_search import movie_search_index
+from app.services.username_index import username_index
 
 # 시그널 임포트
 import app.signals
@@ -22,10 +28,20 @@ app.include_router(movie_router)
 app.include_router(review_router)
 app.include_router(like_router)
 app.include_router(notification_router)
+app.include_router(export_router)
+app.include_router(import_router)
 
 # initialize_tortoise-orm
 initialize_tortoise(app=app)
 
+# 시작 시 username 자동완성 인덱스, 팔로우 그래프 스냅샷, 영화 검색 색인 생성 (DB 초기화 이후에 실행됨)
+app.add_event_handler("startup", username_index.load)
+app.add_event_handler("startup", follow_graph.load)
+app.add_event_handler("startup", movie_search_index.load)
+
+# 종료 시 비밀번호 해싱 스레드 풀 정리
+app.add_event_handler("shutdown", password_hash_pool.shutdown)
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,122 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `basemodel` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6)
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `users` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `username` VARCHAR(50) NOT NULL UNIQUE,
+    `hashed_password` VARCHAR(128) NOT NULL,
+    `age` INT NOT NULL,
+    `gender` VARCHAR(6) NOT NULL COMMENT 'MALE: male\nFEMALE: female',
+    `profile_image_url` VARCHAR(255),
+    `last_login` DATETIME(6),
+    KEY `idx_users_usernam_266d85` (`username`)
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `movies` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `title` VARCHAR(255) NOT NULL,
+    `plot` LONGTEXT NOT NULL,
+    `cast` JSON NOT NULL,
+    `playtime` INT NOT NULL,
+    `genre` VARCHAR(9) NOT NULL COMMENT 'SF: SF\nROMANTIC: Romantic\nADVENTURE: Adventure\nACTION: Action\nCOMEDY: Comedy\nHORROR: Horror\nFANTASY: Fantasy',
+    `poster_image_url` VARCHAR(255)
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `reviews` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `title` VARCHAR(50) NOT NULL,
+    `content` VARCHAR(255) NOT NULL,
+    `review_image_url` VARCHAR(255),
+    `movie_id` BIGINT NOT NULL,
+    `user_id` BIGINT NOT NULL,
+    UNIQUE KEY `uid_reviews_user_id_44b823` (`user_id`, `movie_id`),
+    CONSTRAINT `fk_reviews_movies_56a147b9` FOREIGN KEY (`movie_id`) REFERENCES `movies` (`id`) ON DELETE CASCADE,
+    CONSTRAINT `fk_reviews_users_8aed0759` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `movie_reactions` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `type` VARCHAR(7) NOT NULL COMMENT 'LIKE: like\nDISLIKE: dislike' DEFAULT 'like',
+    `movie_id` BIGINT NOT NULL,
+    `user_id` BIGINT NOT NULL,
+    UNIQUE KEY `uid_movie_react_user_id_19ad8d` (`user_id`, `movie_id`),
+    CONSTRAINT `fk_movie_re_movies_68679e90` FOREIGN KEY (`movie_id`) REFERENCES `movies` (`id`) ON DELETE CASCADE,
+    CONSTRAINT `fk_movie_re_users_ce8163a3` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `review_likes` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `is_liked` BOOL NOT NULL DEFAULT 1,
+    `review_id` BIGINT NOT NULL,
+    `user_id` BIGINT NOT NULL,
+    UNIQUE KEY `uid_review_like_user_id_c69f9e` (`user_id`, `review_id`),
+    CONSTRAINT `fk_review_l_reviews_6cb49859` FOREIGN KEY (`review_id`) REFERENCES `reviews` (`id`) ON DELETE CASCADE,
+    CONSTRAINT `fk_review_l_users_5cd4a3e1` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `follows` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `is_following` BOOL NOT NULL DEFAULT 1,
+    `follower_id` BIGINT NOT NULL,
+    `following_id` BIGINT NOT NULL,
+    UNIQUE KEY `uid_follows_followe_049d9f` (`follower_id`, `following_id`),
+    CONSTRAINT `fk_follows_users_f7643bca` FOREIGN KEY (`follower_id`) REFERENCES `users` (`id`) ON DELETE CASCADE,
+    CONSTRAINT `fk_follows_users_11cff8f1` FOREIGN KEY (`following_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `aerich` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `version` VARCHAR(255) NOT NULL,
+    `app` VARCHAR(100) NOT NULL,
+    `content` JSON NOT NULL
+) CHARACTER SET utf8mb4;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
+
+
+MODELS_STATE = (
+    "eJztXFtz2jgU/iseP6Uz2U5CLiS8OcQ0bAPsAOl2WzoexRbgiS1TWyRlOvnvK8n3azCB1A"
+    "56w0fnyNJ3Lj5HF36LpqVBw/l4BRzYoz/FlvBbRMCE5Ee68VAQwWIRNlECBvcG474nbGbA"
+    "du9gG6iYNEyB4UBC0qCj2voC6xYiVLQ0DEq0VMKoo1lIWiL95xIq2JpBPIc2afj+g5B1pM"
+    "Ff0PEfFw/KVIeGFhuwrtF3M7qCVwtGu9JnXYQ7jJe+8F5RLWNpopB/scJzCwUCOsKUOoMI"
+    "2gBD+gZsL+kM6AC92fqTcgcbsrijjMhocAqWBo7MeE0YVAtRCMloHDbHGX3LX5eNxslJs3"
+    "F0cn5xdtpsnl0cXRBeNqR0U/PZnXAIiNsVg6X7qdsf04laRE+uBinhmckADFwphncIsGpD"
+    "CokCcBroa9KCdRNmQx2XTECueaIf/R9JBfhwF2nAJ4QqCC1vSzogc9AGyFh56i2Ad9ztya"
+    "Ox1PuHzsR0nJ8Gg0gay7SlwairBPXg/ENcH0Enwr/d8Y1AH4Vvg77MELQcPLPZG0O+8TeR"
+    "jgkssaUg60kBWsQSfaoPzDN1o+lDRM+UcA/Uhydga0qqxWpYebzpJrNhJikAgRlTCwWXDt"
+    "MLL3cOc/JU2GH0woizJBwOjzY82vBoU/1ocxjxHOq47HdKre05sLNVGpVJKJSgtokKd+5E"
+    "JvilGBDN8Jw8nh0VKPCLNGzfSMODs6OEUvpeS4M1PcdQnANnTmx8ARznybIzglE+mBmi28"
+    "H0Ddwihupx42INWAlXLq6sLQ4s+U6lwcwN6x73y3G9Ivi5ob1xfNo8vTg5Pw0iekApCuR+"
+    "0A7BIjPU3A912vhktDQZaF0yBIBUmAIvlP7D9if2pFu5JZjAgBPUkd2nKaTP4gZ2eb6GVS"
+    "YDcGiT50mLXNjWVDegopvE2pSlbZRx9kzhjeD2AuQf8/bG2dkauBKuXGRZWxxbAzhYMayZ"
+    "jspmGXHJLWQZb49vTZIKf9qvqWFCjdvwUYdPTkb27gl2Pg+hARiWacV65cmQdVLNGP/sW6"
+    "pPDVPIaJlFJqCQJFOl3b8SjR7tbOj1VWNQXNNQDP0BbsU+bklHNYZjahmG9eRV2Ztj0WHd"
+    "1B4H0s0+ArHLxR8WN8SM1R+34bBo+YcFML7+w9d/+PpPhVK1ddZ/sI6NUos/gUA9Vyl2Ur"
+    "csDCvDL8bwV0748fnrAmGRvctfxzFT94E66ElfP8TM/XbQ/+SzR4Bt3w6uEniqpJpL4/n3"
+    "aNDPiTEefwLPO0Tm+V3TVXwoGLqDf9QOXTrlYnSTQCYiBO0gie7CACs/1q65sBYV2ePVNT"
+    "snUq61uGZXIWqKo05LGHUmaDjoSf1xt90ShhZJCbGuTpB0/UXuj++GckuQtEeI8NKGhNoe"
+    "dwd9QmIF5QS1Bz35+r+W0LZMqK0m6GYwHA6GLeHGsm3LnqAO6VcaEYYO6RY4q03W7C7XiN"
+    "GXuRH6MhWfiUdAe8MluwzZ/V6x4ws9r1jT2Pslnl2WsJ59ZNSwoeXkF7ERE91uFfud7Ziy"
+    "7zgrpX/wspaXtRXwUV7WvpuydvtHGsjrMEQZfpGPYUSknijuZHHA28fYKPnMkt3v5DO9bV"
+    "b2IxmVqlkt+yZfy/jZsNLwRoQ4ukl0U6VTHOw00h3LhvoMfYar1PpCdmngH9WtHsp5FQEh"
+    "2+ApyH6jBkSmRyYFsRslpVFbupbFdAjYAmzBHld9cYvGtWzg1qnT93m7fee7q0HJnrfLGq"
+    "3pX9htjR8X4QUrL1h5wVrngpVqIrMyeHlzwZd9u6KLfSbElCLF2+5nuSXQxgm67o7cR013"
+    "AvaSZUORA/lFQzO3ZGjygoEXDPVGlxcMvGCoYsGw+10cVj/k7uT41cVLuznh8eFdZcjue3"
+    "iKzFPkSjj/O06RdYd5c5b/WJYBAcpxoIhYQqf3RG5Xagx8a9tnwq4Gg9uYxq66ySN1d70r"
+    "eXhwzFRFmHSck6/52wslQ1JMjOdsPCPmGXG1MrtSGbEdHI15JW51PJ2VRC4W2qqUFHvXlT"
+    "IS4vAiU34y7F6a2kke7N9LYwbk383i6TBPhyvh9+87HQ79rXRKHBPlaXHmVdvSiVtCkCdv"
+    "RalxYIEbwhxKcpxLJMmx7/W+J8oJh305WS6IuHsLX+iIVUqYJWjr6lzMSJi9lsKEGYQ8lb"
+    "nQ/o5y4ldeysvPdh+h7XjnZ9Y9YxsR4aeWwz9eI65RAkSPvZ4AHh+tc3qecOX/c93R+ufn"
+    "C64x556f5zeZg5vMJW4fbv/z8vw/wSNe2w=="
+)
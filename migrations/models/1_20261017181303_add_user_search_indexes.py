@@ -0,0 +1,56 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `users` ADD INDEX `idx_users_created_43d91f` (`created_at`);
+        ALTER TABLE `users` ADD INDEX `idx_users_gender_7661e2` (`gender`, `age`);
+        ALTER TABLE `users` ADD INDEX `idx_users_age_ff56e5` (`age`);
+        ALTER TABLE `users` ADD INDEX `idx_users_last_lo_a507a3` (`last_login`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `users` DROP INDEX `idx_users_last_lo_a507a3`;
+        ALTER TABLE `users` DROP INDEX `idx_users_age_ff56e5`;
+        ALTER TABLE `users` DROP INDEX `idx_users_gender_7661e2`;
+        ALTER TABLE `users` DROP INDEX `idx_users_created_43d91f`;"""
+
+
+MODELS_STATE = (
+    "eJztXOtT4joU/1c6/eTOeHcUHyjfKpaVq8AdwL17V5xObAN0bFO2DSqz4/9+k/T9lCK4VP"
+    "KNnpyTJr/z6Dl58Fs0LQ0aztcL4MAO/Sk2hN8iAiYkP9KN+4IIZrOwiRIweDAY9wNhMwO2"
+    "BwfbQMWkYQwMBxKSBh3V1mdYtxChorlhUKKlEkYdTULSHOm/5lDB1gTiKbRJw909IetIgy"
+    "/Q8R9nj8pYh4YWG7Cu0XczuoIXM0a70CdthFuMl77wQVEtY26ikH+2wFMLBQI6wpQ6gQja"
+    "AEP6BmzP6QzoAL3Z+pNyBxuyuKOMyGhwDOYGjsx4SRhUC1EIyWgcNscJfctf57Xa0VG9dn"
+    "B0enZyXK+fnB2cEV42pHRT/dWdcAiI2xWDpf2t3R3SiVpET64GKeGVyQAMXCmGdwiwakMK"
+    "iQJwGuhL0oJ1E2ZDHZdMQK55ol/9H0kF+HAXacAnhCoILW9NOiBz0HrIWHjqLYB32O7Ig6"
+    "HU+YfOxHScXwaDSBrKtKXGqIsEde/0S1wfQSfCv+3hlUAfhZ+9rswQtBw8sdkbQ77hT5GO"
+    "CcyxpSDrWQFaxBJ9qg/MK3Wj8WNEz5TwANTHZ2BrSqrFqll5vOkms2YmKQCBCVMLBZcO0w"
+    "svtw5z8lTYYfTCiDMnHM7Go80dtUTNGwvxQtJ8F/6I2DV7NoCDFcOa6Ei853GKxykep94d"
+    "p/YjnkNdnv1OqbU5BXa2SqMyCYUS1FZR4cadyAQvigHRBE/J48lBgQK/S/3mldTfOzlIKK"
+    "XrtdRY02sMxSlwpsTGZ8Bxni07Ixjlg5khuh5MP8AtYqge1s6WgJVw5eLK2uLA0s9CCszc"
+    "sO5xvx3XtwQ/N7TXDo/rx2dHp8dBRA8oRYHcD9ohWOFnNW18MpqbDLQ2GQJAKkyBF0r/Yf"
+    "sTO9KN3BBMYMARasnu0xjSZ3EFuzxdwiqTATi0ydOkRc5sa6wbUNFNYm3K3DbKOHum8Epw"
+    "ewHyj3l77eRkCVwJVy6yrC2ObSTXK5llxCXXkGV8PL4VSSr8ab+n+gk1bsMnHT47Gdm7J9"
+    "i67kMDMCzTivUKmz7rZDtj/KtvqT41TCGjBRqZgEKSTJV2/040OrSzvtdXhUFxTUMx9Ee4"
+    "Fvu4IR1VGI6xZRjWs1efr45Fi3VTeRxIN7sIxCaXjVjcEDPWjdyG/aKFIxbANr9yxNd/+P"
+    "oPX/9Z6/oP1rFRavEnEKjmKsVG6paZYWX4xRC+5IQfn78qEBbZu/xjGDN1H6i9jvTjS8zc"
+    "b3rdbz57BNjmTe8igadKqrk0nn8Pet2cGOPxJ/C8RWSed5qu4n3B0B18Xzl06ZSL0U0CmY"
+    "gQtIMkujMDLPxYu+TCWlRkh1fX7JxIudTimr0NUVMctBrCoDVC/V5H6g7bzYbQt0hKiHV1"
+    "hKTL73J3eNuXG4KkPUGE5zYk1Oaw3esSEisoR6jZ68iX/zWEpmVCbTFCV71+v9dvCFeWbV"
+    "v2CLVIv9KAMLRIt8BZrLJmd75EjD7PjdDnqfhMPALaKy7ZZcju9oodX+h5x5rGzi/xbLKE"
+    "9ewjo4YNLSe/iI2Y6Hqr2Du2Y8q+46yUvudlLS9rt8BHeVn7acra9R9pIK/DEGX4RT6GEZ"
+    "FqoriRxQFvH2Ol5DNLdreTz/S2WdmPZFSqYrXsh3wt42fDSsMbEeLoJtFNlU5xsNNItywb"
+    "6hN0DRep9YXs0sA/5Lt9KOdVBIRsg+cg+40aEJkemRTEbpSUBk3pUhbTIWANsAV7XNXFLR"
+    "rXsoFbpk7f5e32je+uBiV73i5rtKZ/Y7c1flyEF6y8YOUFa5ULVqqJzMrg7c0FX/bjii72"
+    "mRBTihRv2tdyQ6CNI3TZHriPmu4E7CXLhiIH8ouGem7JUOcFAy8Yqo0uLxh4wbCNBcPmd3"
+    "FY/ZC7k+NXF2/t5oTHhzeVIbvv4SkyT5G3wvk/cYqsO8ybs/zHsgwIUI4DRcQSOn0gcptS"
+    "Y+Bb6z4TdtHr3cQ0dtFOHqm77VzI/b1DpirCpOOcfM3fXigZkmJiPGfjGTHPiLcrsyuVEd"
+    "vB0Zh34lbF01lJ5GKhbZuSYu+6UkZCHF5kyk+G3UtTG8mD/XtpzID8u1k8Hebp8Fb4/edO"
+    "h0N/K50Sx0R5Wpx51bZ04pYQ5MlbUWocWOCKMIeSHOcSSXLse73riXLCYd9Olgsi7s7CFz"
+    "riNiXMErR1dSpmJMxeS2HCDEKerbnQ/oly4ndeysvPdp+g7XjnZ5Y9YxsR4aeWwz9eI65R"
+    "AkSPvZoAHh4sc3qecOX/c93B8ufnC64x556f5zeZg5vMJW4frv/z8vo/dhtxRg=="
+)
@@ -0,0 +1,53 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `users` ADD `follower_count` INT NOT NULL DEFAULT 0;
+        ALTER TABLE `users` ADD `following_count` INT NOT NULL DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `users` DROP COLUMN `follower_count`;
+        ALTER TABLE `users` DROP COLUMN `following_count`;"""
+
+
+MODELS_STATE = (
+    "eJztXFlz4jgQ/iuUnzJV2SlCDhLeHGIm7ATYAjI7OyHlUmwBrtgyY4tkqKn895Xk+wwmkL"
+    "GD3nCrW5a+Ptytg9+CYapQtz9fAhv26E+hVfstIGBA8iPZeFgTwGIRNFECBg86434gbIbP"
+    "9mBjCyiYNEyBbkNCUqGtWNoCayYiVLTUdUo0FcKooVlAWiLt5xLK2JxBPIcWabi7J2QNqf"
+    "AXtL3HxaM81aCuRgasqfTdjC7j1YLRLrVZF+EO46UvfJAVU18aKOBfrPDcRL6AhjClziCC"
+    "FsCQvgFbSzoDOkB3tt6knMEGLM4oQzIqnIKljkMzXhMGxUQUQjIam81xRt/y10WjcXzcbN"
+    "SPz85PT5rN0/P6OeFlQ0o2NV+cCQeAOF0xWLpfuv0xnahJ9ORokBJemAzAwJFieAcAKxak"
+    "kMgAJ4G+Ii1YM2A61FHJGOSqK/rZ+xFXgAd3ngY8QqCCwPK2pAMyB3WA9JWr3hx4x92eNB"
+    "qLvX/oTAzb/qkziMSxRFsajLqKUQ/OPkX14XdS+7c7vq7Rx9qPQV9iCJo2nlnsjQHf+IdA"
+    "xwSW2JSR+SwDNWSJHtUD5oW60fQxpGdKeADK4zOwVDnRYjbMLN5kk9Ew4hSAwIyphYJLh+"
+    "mGl1ubOXki7DB6bsRZEg5759Hmjlqi6o6FeCFpvgt+hOyaPevAxrJuzjQk3PM4xeMUj1Nv"
+    "jlOHIc+hLs9+J9TangMrXaVhmZhCCWqbqHDnTmSAX7IO0QzPyeNpPUeB38Rh+1ocHpzWY0"
+    "rpuy0N1vQSQXEO7Dmx8QWw7WfTSglG2WCmiG4H03dwiwiqR43zNWAlXJm4srYosPSzkAAz"
+    "M6y73K/H9ZLg54T2xtFJ8+T8+OzEj+g+JS+Qe0E7ACv4rCaNT0JLg4HWJUMASIEJ8ALpP2"
+    "x/Qk+8kVo1A+hwgjqS8zSF9FnYwC7P1rDKeAAObPIsbpELy5xqOpQ1g1ibvLT0Is6eKrwR"
+    "3G6A/GPe3jg9XQNXwpWJLGuLYhvK9QpmGVHJLWQZ749vRZIKb9q5WcXU1HXzGVpEQ0uUkj"
+    "JmRvCk4PsF83p5IrkDA3njhgBGJPcGwQL1dwC1BZ80+Gyn1I+uYOfrEOqAzScJpltaD1kn"
+    "5cwyXjwT8aiCX8SElwjIBGRS5ii0+zei0aOdDd2+KgyKYxqyrj3CrdjHDemownB4sfmNWH"
+    "RYN5XHgXSzj0DscuGSxQ0hZeXSaTjMW7pkAWz3a5d8BZKvQPIVyK2uQGIN64WWH32Baq6T"
+    "7aRyXuhmil+M4a+M8OPxVwXCPHuXvo8jpu4BddATv3+KmPvNoP/FYw8B274ZXMbwVICdgu"
+    "ffo0E/I8a4/DE8bxGZ552qKfiwpms2vq8cunTK+ejGgYxFCNpBHN2FDlZerF2zrg2L7PH6"
+    "rpURKdda3rXKEDWFUadVG3UmaDjoif1xt92qDU2SEmJNmSDx6pvUH98OpVZNVJ8gwksLEm"
+    "p73B30CYkVlBPUHvSkq/9atbZpQHU1QdeD4XAwbNWuTcsyrQnqkH7FEWHokG6Bvdpk1fhi"
+    "jRh9kRmhLxLxmXgEtDZcNE6R3e81Y77Q84Y1jb1f4tllCevaR0oNG1hOdhEbMtHtVrF3bM"
+    "+efcdZKX3Py1pe1pbAR3lZ+2HK2u0fqiGvwzBt8ysbw5BINVHcyeKAu4+xUfKZJrvfyWdy"
+    "26zoRzIsVbFa9l2+ltHTiYXhDQlxdOPoJkqnKNhJpDumBbUZ+gpXifWF9NLAO2ZePpSzKg"
+    "JCtsCzn/2GDYhMj0wKYidKiqO2eCUJyRCwBdj8Pa7q4haOa+nArVOn7/N2+853V/2SPWuX"
+    "NVzTv7LbGj0uwgtWXrDygrXKBSvVRGpl8Prmgif7fkUX+0wICUUKN92vUqtGGyfoqjtyHl"
+    "XN9tkLlg15DuQVDc3MkqHJCwZeMFQbXV4w8IKhjAXD7ndxWP2QuZPjVRev7eYEx4d3lSE7"
+    "7+EpMk+RS+H8HzhF1mzmzWn+Y5o6BCjDgUJiMZ0+ELldqdH3rW2fCbscDG4iGrvsxo/U3f"
+    "YupeHBEVMVYdJwRr7mbS8UDEkRMZ6z8YyYZ8TlyuwKZcSWfzTmjbhV8XRWHLlIaCtTUuxe"
+    "V0pJiIOLTNnJsHNpaid5sHcvjRmQdzeLp8M8HS6F33/sdDjwt8IpcUSUp8Xp/59QNDjFBH"
+    "nylpcaB/+VsBnMgSTHuUCSHPle73uiHHPY15PlnIi7t/AFjlimhFmElqbMhZSE2W3JTZhB"
+    "wFOaC+0fKCd+46W87Gz3CVq2e35m3TO2IRF+ajn46z/iGgVAdNmrCeBRfZ3T84Qr+78T6+"
+    "ufn8+5xpx5fp7fZPZvMhe4fbj9z8vL/4XQPWk="
+)
@@ -0,0 +1,68 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `movies` ADD `like_count` INT NOT NULL DEFAULT 0;
+        UPDATE `movies` SET
+            `like_count` = (SELECT COUNT(*) FROM `movie_reactions` WHERE `movie_reactions`.`movie_id` = `movies`.`id` AND `movie_reactions`.`type` = 'like');
+        ALTER TABLE `movies` ADD INDEX `idx_movies_created_de5b2a` (`created_at`);
+        ALTER TABLE `movies` ADD INDEX `idx_movies_like_co_62b4eb` (`like_count`);
+        ALTER TABLE `movies` ADD INDEX `idx_movies_genre_0755c2` (`genre`, `created_at`);
+        ALTER TABLE `movies` ADD INDEX `idx_movies_genre_881047` (`genre`, `like_count`);
+        ALTER TABLE `movies` ADD INDEX `idx_movies_title_88147d` (`title`);
+        ALTER TABLE `movies` ADD INDEX `idx_movies_playtim_ac8381` (`playtime`);
+        ALTER TABLE `movies` ADD INDEX `idx_movies_genre_384549` (`genre`, `playtime`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `movies` DROP INDEX `idx_movies_genre_384549`;
+        ALTER TABLE `movies` DROP INDEX `idx_movies_playtim_ac8381`;
+        ALTER TABLE `movies` DROP INDEX `idx_movies_title_88147d`;
+        ALTER TABLE `movies` DROP INDEX `idx_movies_genre_881047`;
+        ALTER TABLE `movies` DROP INDEX `idx_movies_genre_0755c2`;
+        ALTER TABLE `movies` DROP INDEX `idx_movies_like_co_62b4eb`;
+        ALTER TABLE `movies` DROP INDEX `idx_movies_created_de5b2a`;
+        ALTER TABLE `movies` DROP COLUMN `like_count`;"""
+
+
+MODELS_STATE = (
+    "eJztXFtz2joQ/iseP6UzOR1CLiS8OQQaTgOcAdLT05DxKFiAJ0aiskjKdPLfjyTfrwECKQ"
+    "56w9KubH2rXX+7lvitTrEBLfvzJbBhi/9Uq8pvFYEpZD+SnYeKCmazoIs3UPBgCekHJjb1"
+    "xR5sSsCQso4RsGzImgxoD4k5oyZGrBXNLYs34iETNNE4aJoj8+cc6hSPIZ1Awjru7lmziQ"
+    "z4C9re5exRH5nQMiIPbBr83qJdp4uZaLs0x01EG0KW3/BBH2JrPkWB/GxBJxj5CiaivHUM"
+    "ESSAQn4HSuZ8BvwB3dl6k3IeNhBxnjKkY8ARmFs0NOMlYRhixCFkT2OLOY75Xf66KJePjy"
+    "vl0vHZ+elJpXJ6XjpnsuKRkl2VF2fCASDOUAKW5pdmu88nipmdHAvyhhehAyhwtATeAcBD"
+    "AjkkOqBJoK9YDzWnMB3qqGYMcsNV/ez9iBvAgzvPAl5DYIJg5W3IBmwORgdZC9e8OfD2m6"
+    "16r6+1/uEzmdr2T0tApPXrvKcsWhex1oOzT1F7+IMo/zb71wq/VH502nWBILbpmIg7BnL9"
+    "Hyp/JjCnWEf4WQdGaCV6rR4wL9yNRo8hO/OGBzB8fAbE0BM9uIyzZJNd0/I03gIQGAuzcH"
+    "D5Y7rh5dYWTp4IO6I9N+LMmYS99Whzx1ei4T4L80LWfRf8CK1rcW0Bm+oWHptIvZdxSsYp"
+    "GafeHKcOQ57DXV78Tpi1NgEk3aRhnZhBGWrrmHDrTjQFv3QLojGdsMvTUo4Bv2nd2rXWPT"
+    "gtxYzSdnvKouslguIE2BO2xmfAtp8xSQlG2WCmqG4G03dwiwiqR+XzJWBlUpm4ir4osPy1"
+    "kAAzM6y70q/H9R3Bzwnt5aOTysn58dmJH9H9lrxA7gXtAKzgtZpcfHU0nwrQmuwRABrCBH"
+    "iB9h9ef2pLu6lXlSmw4AA16s7VCPJrdY11ebbEqowH4GBNnsVX5IzgkWlB3Zyy1abPibWK"
+    "s6cqrwW3GyD/mLeXT0+XwJVJZSIr+qLYhrjeiiwjqrkBlvH++BaEVHjTzmUVI2xZ+BkSZq"
+    "E5SqGMmRE8qfh+wby0O5HcgYHdcU0AI5p7g+AK+XcANYFPJny2U/JHV7HxtQstIOaTBNNN"
+    "rbtikN1kGS/eEvFaVT+JCZcI2AR0luYM+fBvRKPFB+u6YxUYFGdp6Jb5CDeyPm7YQAWGw4"
+    "vNb8SiIYYpPA5smH0EYpuFSxE31JTKpdNxmFe6FAHsnWqXRDwLDwvuS1YUKv2OeAXT75hZ"
+    "YCHop1PYjOnH1aLS1KRsorICKiugsgK62Qqo41kJm2Yn8b5CMet0W8ncZxZO8Ys+/JURfj"
+    "z5okCYt97r3/uRpe4BddDSvn+KLPebTvuLJx4CtnbTuYzhOQR2Cp5/9zrtjBjjysfwvEVs"
+    "nneGOaSHimXa9L5w6PIp56MbBzIWIfgAcXT9V2sC4cz3ZVhlj+vLJCNSLlVeJrsQNdVeo6"
+    "r0GgPU7bS0dr9ZqypdzCgpNYcDpF19q7f7t916VdGMJ4jonEDWWus3O23WJBLaAap1WvWr"
+    "/6pKDU+hsRig60632+lWlWtMCCYD1GDjaj0m0GDDAnuxTtX6YokYfZEZoS8S8Zl5BCRrFq"
+    "1TdGXN2q9ZBzR++WgSVZIFOlmge70WtfeluW2WHtz1kVJ7CFZOdvEhtEQ3W324E3stBP8R"
+    "JZB7uXFTlgN2wEdlOeDDlAM2vxmK3Y7CNDqUjWFIpZgoboVaut+f1iLtabqStEc/d676kg"
+    "xrFawG8C5vy+iu0pXhDSlJdOPoJlKnKNhJpBuYQHOMvsJFoi6Tnhp4xwN2D+WsjIA1E/Ds"
+    "s9/wAmLTY5OC1ImSWq+mXdXVZAjYAGz+t8ni4haOa+nALZOn7/M2ia1/FfdT9qyv4+Gc/p"
+    "Wv5NFtPjJhlQmrTFiLnLByS6RmBq9/lPF03y/pEq8JNWFI9ab5tV5VeOcAXTV7zqVh2r74"
+    "imlDngN5SUMlM2WoyIRBJgzFRlcmDDJh2MWEYftfcUT+kPklx8suXvuaE2z73hZDdu4jKb"
+    "KkyDvh/B+YIpu28OY0/8HYggBlOFBILWbTB6a3LTP6vrXpvXSXnc5NxGKXzfhWxNvWZb17"
+    "cCRMxYRMmsHXvM8LK4akiJrkbJIRS0a8W8xuJUZM/K0xb8StiLuz4shFQtsukWL3mFkKIQ"
+    "4OoGWTYeew21Z4sHeeUCwg70ydpMOSDu+E339sOhz428qUOKIqaXHqEemViVtMUZK3PGoc"
+    "/MfFejAHmhLnFUhy5H2970Q55rCvk+WciLu38AWOuEuEWYPEHE7UFMLs9uQSZhDI7MxfNn"
+    "8gTvzGw4zZbPcJEtvdP7PsHtuQity1HPxlI3ONFUB0xYsJ4FFpmd3zTCr7Py9Ly++fzzn+"
+    "nbl/Xp4A90+Ar3D6cPOvl5f/Aeq2yW8="
+)
@@ -0,0 +1,72 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `movie_reaction_counter_shards` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `shard` INT NOT NULL,
+    `like_count` INT NOT NULL DEFAULT 0,
+    `dislike_count` INT NOT NULL DEFAULT 0,
+    `movie_id` BIGINT NOT NULL,
+    UNIQUE KEY `uid_movie_react_movie_i_0a733f` (`movie_id`, `shard`),
+    CONSTRAINT `fk_movie_re_movies_96f16567` FOREIGN KEY (`movie_id`) REFERENCES `movies` (`id`) ON DELETE CASCADE
+) CHARACTER SET utf8mb4 COMMENT='좋아요가 많은 영화의 리액션 카운터를 여러 row 로 나누어 저장합니다.';
+        ALTER TABLE `movies` ADD `dislike_count` INT NOT NULL DEFAULT 0;
+        UPDATE `movies` SET
+            `dislike_count` = (SELECT COUNT(*) FROM `movie_reactions` WHERE `movie_reactions`.`movie_id` = `movies`.`id` AND `movie_reactions`.`type` = 'dislike');"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `movies` DROP COLUMN `dislike_count`;
+        DROP TABLE IF EXISTS `movie_reaction_counter_shards`;"""
+
+
+MODELS_STATE = (
+    "eJztXVtz2joQ/iseP7UzOR1zMbc3QqDhNMAZID09DRlGlhXiiZGpbZoynfz3I8n3GwECFA"
+    "e9MLa0q8u32vXuSja/xbmhIt36dAks1KOXYkP4LWIwR+QiWXkhiGCxCKpogQ0UnVErhGzu"
+    "kymWbQJok4oHoFuIFKnIgqa2sDUDk1K81HVaaEBCqOFZULTE2o8lmtrGDNmPyCQVd/ekWM"
+    "Mq+oUs73bxNH3QkK5GBqyptG9WPrVXC1Z2qc262O4wWtqhMoWGvpzjgH6xsh8N7DNo2Kal"
+    "M4SRCWxEe7DNJZ0BHaA7W29SzmADEmeUIR4VPYClbodmvCEM0MAUQjIai81xRnv5q14slk"
+    "rVolSq1ORytSrXpBqhZUNKVlVfnAkHgDhNMVi6n7v9MZ2oQeTkSJAWvDAeYAOHi+EdAAxN"
+    "RCGZAjsJ9BWpsbU5Soc6yhmDXHVZP3kXcQF4cK+TgFcQiCBYeXuSAZmDOsD6yhXvGnjH3V"
+    "57NG72/qEzmVvWD51B1By3aU2Rla5ipR8qH6Py8BsR/u2OrwV6K3wf9NsMQcOyZybrMaAb"
+    "fxfpmMDSNqbYeJ4CNbQSvVIPmBeqRg9PITnTAgXAp2dgqtNEjVE0smiTVfPiPF4CMJgxsV"
+    "Bw6TBd83JrMSVPmB1WvtbiLAmFdXBrc0dXouqOhWghqb4LLkLrmt3rwLKnujHTsHjP7RS3"
+    "U9xOvdlOXYQ0h6o8u06ItfUIzHSRhnliAiWo7SLCgyvRHPya6gjP7EdyK0trBPi1OWxdN4"
+    "cfZCkmlL5bU2RVLxEUH4H1SNb4AljWs2GmGKNsMFNY94PpEdQigmqhWNsAVkKViSuriwJL"
+    "HwsJMDPNukv9ul0/Efwc014slKvlWqlS9i26X7LOkHtGOwAreKwmF18bL+cMtC4ZAsAQJc"
+    "ALuP/w+hN7zZt2Q5gDHU1wp+3cPSB6L+6wLisbrMq4AQ7WZCW+Ihem8aDpaKrNyWqbLk19"
+    "G2VPZd4JbtdA/jFtL8ryBrgSqkxkWV0U25Cvt6WXEeXcg5dxfHxz4lR4017rVTwYum48I5"
+    "NIaIlTXMZMC55kPJ4xl07HkjswkB53BDDCeTYIbhF/B1Cb6KeGnq2U+NFl7HwZIh2w+STB"
+    "dEPrIWvkNL2MF2+JeKWiH8SEUwRkAlMS5kDa/BvR6NHGhm5bOQbFWRpTXXtCe1kfN6ShHM"
+    "Ph2eY3YtFhzeQeB9LMOQJxyMQlsxtiSubSqbhYl7pkBuxIuUuTjYWaBfchyxKVfkU8g+lX"
+    "LHSwYu6nk9iM8cfZotS2ZpOJ8gwoz4DyDOh+M6COZiVkmh3E+wz5zNMdJHJf6EaKXozRrw"
+    "zz49HnBcJ16739bRxZ6h5QH3rNbx8jy/1m0P/skYeAbd0MLmN4QmCl4Pn3aNDPsDEufQzP"
+    "W0zmeadq0L4QdM2y73OHLp3yenTjQMYsBG0gjq7/aE0gnPm8DLOccX7ZzLCUG6WXzVOwmu"
+    "Ko0xBGnQkeDnrN/rjbaghDg7iktgYnuHn1td0f3w7bDaGp/kTYXpqIlLbG3UGfFLGAdoJb"
+    "g1776r+G0DLmSF1N8PVgOBwMG8K1YZqGOcEd0m5zRAg6pFlgrXbJWtc3sNH1TAtdT9hnoh"
+    "HI3DFpncLLc9Z+zjpw4ze3JlGms0nQhXFTNWsn6BJ8Z4MeT2++IZPHE5spcDhKRGy7RYy/"
+    "uk9wWk7DI9puzoA6ZIbLVaSUFFegYtk5rpAu7zfJdceO9DA3m2Xa7vn5YJ51OgEd5Vmnd5"
+    "N12v+ZO9KdjdJcx2wMQyz5RPEgEYy7zblTbJjGy2PD6K76tg/JMFfOUk1HeVpGDy9vDW+I"
+    "iaMbRzcRY0bBTiLdMUykzfAXtEqk/9LDBO8tlNNDOSsiIMUmePa93/ACItMjk0K2YyWbo1"
+    "bzqi0mTcAeYPO3wPOLW9iupQO3SULjnE/jHPzwhZ/byDqEEU5+vHIYI3qajAesPGDlAWue"
+    "A1YqidTI4PW9P4/3eEEXe0yICUGKN90v7YZAKyf4qjtybt0thV226dYpkBc0VDNDhioPGH"
+    "jAkG90ecDAA4ZTDBiO5ipHdrpec5vj22KbutApG3WvOtTiZAlrNYX8yuUy+a3UyS+AkiRM"
+    "lkodIlJULdMbWJEKk6VakSkVsQSsHkDKWCEVsMCKIKqyVhTyqxZKEiWqQlohI0KrVBEUTO"
+    "OZMtdkWq5I9Rr5LUqUTVbKlLQmSbQPIJM25EqdVkNGhMqf4o/fvI1/gmlVldwCVEodl3NG"
+    "3e1FleWa1wmUVcoAYImOt4hYJ1XaowIUOtJasczYdAM+MUJF9UbgEkJJVZ2eyXUdsv7lMi"
+    "C8JVhmc1InmK0eWlMvFGJDcMFQlBIbbZ0OpCqVfTQARJSq6kBWr9POYEHyGwFV6UJgg6f8"
+    "tYLDUyi6UnKn7gsoKQ1YYcJUAKDNlZEk+KN1WLzp1uTEskmNEH1DytrhISIPEU/i4feOQ0"
+    "TLe6xteJTLp8+ZW723M3D87CA/O3h89HiS4ahhMA/oTj6gC20IZR7N87aLXjueF7wufqgt"
+    "D6cf7tByh/YklP8dO7SaxbQ5TX8MQ0cAZyhQiC0mU4XwHUqMvm7t+x28y8HgJiKxy278Fc"
+    "bb3mV7+KHAREWINDsjAe+dF9vSJEXYuPfBtzhOxLfjWxy7bHGY/rsOb8Qtj+8lxZGLmLZT"
+    "cordz9OkOMTBh2uynWHnIzkH8YO97xCxBeR9i4e7w9wdPgm9f9/ucKBvW7vEEVbuFr+kfV"
+    "pta8ctxsidt3WucfBtzN1gDjg5zls4yZHn9bk7yjGFfd1ZXmNxzxa+QBFPyWFuIlODj2KK"
+    "w+zWrHWYQUBzMn/19I584jfunmV7uz+RabkvRCSPRqejF2Lhr6EGf/VAVGMLEF3yfAJYkD"
+    "Z5HZpQZf9XhrT5C9FrPhuX+UI0/3Kc/+W4hGtzzMfLy//MZPjx"
+)
@@ -0,0 +1,75 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `basemodel` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+        ALTER TABLE `users` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+        ALTER TABLE `movies` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+        ALTER TABLE `reviews` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+        ALTER TABLE `movie_reactions` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+        ALTER TABLE `movie_reaction_counter_shards` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+        ALTER TABLE `review_likes` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+        ALTER TABLE `follows` ADD `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `basemodel` DROP COLUMN `updated_at`;
+        ALTER TABLE `users` DROP COLUMN `updated_at`;
+        ALTER TABLE `movies` DROP COLUMN `updated_at`;
+        ALTER TABLE `reviews` DROP COLUMN `updated_at`;
+        ALTER TABLE `movie_reactions` DROP COLUMN `updated_at`;
+        ALTER TABLE `movie_reaction_counter_shards` DROP COLUMN `updated_at`;
+        ALTER TABLE `review_likes` DROP COLUMN `updated_at`;
+        ALTER TABLE `follows` DROP COLUMN `updated_at`;"""
+
+
+MODELS_STATE = (
+    "eJztXVlz2joU/iseP7UzuR2zmO2NEGi4DXAHSG9vQ4aRbYV4YmTqpSnTyX+/krxvbAGKQS"
+    "8ZLJ2j5Tvykb4jWfnNz3UFauana2DCHvnJN7jfPAJziH8kM684HiwWQRZJsICkUWkJi819"
+    "Mcm0DCBbOOMJaCbESQo0ZUNdWKqOcCqyNY0k6jIWVNEsSLKR+sOGU0ufQesZGjjj4REnq0"
+    "iBv6DpPS5epk8q1JRIg1WF1E3Tp9ZyQdOu1VkXWR0qSyqUprKu2XMUyC+W1rOOfAUVWSR1"
+    "BhE0gAVJDZZhkx6QBrq99TrlNDYQcVoZ0lHgE7A1K9TjDWGQdUQgxK0xaR9npJa/6sViqV"
+    "QtCqVKTSxXq2JNqGFZ2qRkVvXN6XAAiFMUhaX7udsfk47q2E6OBUnCG9UBFnC0KN4BwLIB"
+    "CSRTYCWBvsE5ljqH6VBHNWOQK67qJ+9H3AAe3Kss4CUEJghG3p5sgPugDJC2dM27At5xt9"
+    "cejZu9f0hP5qb5Q6MQNcdtklOkqctY6ofKx6g9/EK4f7vjW448ct8H/TZFUDetmUFrDOTG"
+    "33nSJmBb+hTpr1OghEail+oBgyUDw9oLZUfDRjWZYf+oYWnjiXt8egm9vyRBAvLLKzCUaS"
+    "JHL+pZssmseXEeTwEIzKhVCLakle60cW9S552YTmj6ypnExhLmwWeRBzIQFbct2Lvi7Ifg"
+    "R8hf0WcNmNZU02cq4h/Z/MPmH+am2PzDDJs6/0Tsil05/Z2wausZGBkWDenE7IlB28WCB3"
+    "eOc/BrqkE0s57xoyissN/X5rB12xx+EIWYTfpuTpFmvUVQfAbmMx7iC2Car7qRMslkg5mi"
+    "uh9Mj/BWRFAtFGsbwIqlMnGleVFgyXSfADNzunal18/XJ4KfM2UXC+VquVaqlP2Z2k9ZNU"
+    "F7k3EAVrBcSg6+NrLnFLQubgJAMkyAF2j/4fHH95p37QY3BxqcoE7beXqC5JnfYVxWNhiV"
+    "cf8bjMlKfEQuDP1J1eBUnePRNrUNbZuXPVV5J7hdB/nH3vaiKG6AK5bKRJbmRbENreG3XG"
+    "RENfewyDg+vjlZU3jdXrlafNI1TX+FBraQjVJWjJkePKl4PGcunI4nd2DANe4IYETzYhDc"
+    "Iq4SQG3Anyp8NVPiAq5i58sQaoD2JwmmGzIZ0kJOc5Xx5g0RL5VPoQFzHXdgilmOTIp/Jx"
+    "o9UtjQLSvHoDhDY6qpL3Av4+MOF5RjODzf/E4sOrSY3OOAi7lEIA4ZkKZ+g0+JSDsZV6tC"
+    "0tSBHSkmbdC2ELfgTrI0AO1nxCPTfsZCA0u6/HQC1jH9uFpU2lIt3FEW2WaRbRYAZZFtZt"
+    "j1kW3HYyZMmh2c8RXyGX89SERmoekpr8UY/sqYVjz5vEC4ari3v40jI90D6kOv+e1jZLTf"
+    "DfqfPfEQsK27wXUMTxmYKXj+PRr0M+YOVz6G5z3C/XxQVNm64jTVtB5zhy7p8mp040DGHA"
+    "QpII6uv2RKIJy5DgqrXPC+gZHhKTfaNjBOwWvyo06DG3UmaDjoNfvjbqvBDXVMNSxVnqDm"
+    "zdd2f3w/bDe4pvITIss2IE5tjbuDPk6igYoJag167Zv/GlxLn0NlOUG3g+FwMGxwt7ph6M"
+    "YEdXC5zREW6OBigbncZTeivoGPrmd66HrCP+M3Aho7bkak6LK9CH8vIqBnm3uTqNLFBF7D"
+    "uCmquRN0Cb2LQY+Frd8RoWUB6xQ4nJcI+3YTO39ln+C0nIJHpNycAXXIyKX7IqWELoNXLD"
+    "t2GXqX9xu8fKBHtegym0ZQH9l3GiyaeALv6NkEnVg08UwNe/HRxP2fkcXVWTCNEmRjGFLJ"
+    "J4oHYabusYSdOH+aLuP80VMw2y5+wlo5CyEeZRUU/dhga3hDSgzdOLqJ2EEU7CTSHd2A6g"
+    "x9gctEWDed/nlfA54eyllMDycb4NVnNeEBhLuHOwUtx0s2R63mTZtPuoA9wOYfWckvbmG/"
+    "lg7cJoGqSz49d/DDUn7MKuvQVDiotebwVPT0JwtEsEAEC0Tkhq+yQMSZGjYZiCCGSFh0s7"
+    "16T/d4ZJpO/3zCjvxd90u7wZHMCbrpjpxHdwtwl231VY7RI4PVTCpYZUSQEcF8o8uIICOC"
+    "p0gEj0aBIjvT6+hQfBt7U2qUsrG+lijxE1uu1ST8VyyX8d9KHf8FsiBwE1uqyxAnVcvkQa"
+    "4IhYmtVEQihT0BzQcyUazgDLlAk2RYpaVI+K9SKAlEqCqTDBFiWakKZc7QX4lyTSTpklCv"
+    "4b9FgaiJUpmI1gSB1AFEXIZYqZNsmQrB8qf49Ju39k8QyariRwBLqe1yvhVya1FEseZVIo"
+    "sKUQByibS3CGklVVKjBCTS0lqxTNU0XX6hgpLitcAVlAVFcWrGv+syrV8sA6xbksu0T8oE"
+    "0dFDcuqFQqwJLhiSVKKtrZOGVIWyjwaQIZGqOpDV66QyuSD4hYCqcMXRxhP9WsHRKRRdK7"
+    "ld9w2UtIZcocaUACDFlaHA+a11VLzu1sTEsEll/r4jpeUw6s+o/0lMfmfDEBn1P1PDJqi/"
+    "6S1XNjxS68vnjC7t7SwyO8PNznAfHz0WPDpqeIMR9ZMn6qEN3Mwj0t727rpj0sF1LIfaon"
+    "TqYUSFEZWTePnPZj3LiMqZGjZBVFSTeuk0v6jrGgQowzGG1GImlbDeoazo+8x9f+N+PRjc"
+    "RQx23Y1fEXDfu24PPxSopbCQamVsmHnndrecaiJqbFXJtiRPZM3OtiR32ZI0/G8J34lbHr"
+    "/7jSMXcW2nRHbca/1SiE5w4V82yXEuFzwIv/Hub6QDyLvDkNEcRnNO4r0/m9Uwozlnatg0"
+    "mhP40aRvXEN1IqqM7kSQ9a+B33bSiSmyRfkqyhPcFb8bzIEmw3kL8hNZh106AYq9sOtJ0A"
+    "qPe7HwBS/iKRGhJjRU+ZlPIUJuztUqIgQCmZP5V8VnxHXeududzWJ+QsN0PzhMfqKSjl5I"
+    "hV3zEPzrM/xqbAGiK55PAAvCJteNYKns/x0nbH7hyIrrdjMvHGE37vo37iaWNsecXt7+B4"
+    "0Qslw="
+)